@@ -0,0 +1,68 @@
+"""
+비동기 LLM 경로 벤치마크
+
+지연과 429를 주입하는 로컬 스텁 서버에 대해
+순차 call()과 asyncio.gather + acall_with_retry() 팬아웃의 소요 시간을 비교한다.
+
+실행:
+    python benchmarks/bench_async_llm.py [요청수] [지연(초)]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.stub_openai_server import StubOpenAIServer
+
+
+def run(requests: int = 40, latency: float = 0.1):
+    # 서버는 동시 6건까지만 처리하고, 5% 확률로 429를 돌려줌
+    server = StubOpenAIServer(latency=latency, max_inflight=6, rate_limit_rate=0.05).start()
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+    os.environ.setdefault("OPENAI_API_KEY", "sk-stub")
+    os.environ["LLM_CACHE"] = "0"
+
+    from src.utils.llm_client import LLMClient
+
+    # 1. 순차 호출
+    client = LLMClient()
+    start = time.perf_counter()
+    serial_errors = 0
+    for i in range(requests):
+        if "error" in client.call_with_retry("system", f"message {i}"):
+            serial_errors += 1
+    serial_elapsed = time.perf_counter() - start
+
+    # 2. 비동기 팬아웃 (동시 6건, 분당 600건 한도)
+    os.environ["LLM_MAX_CONCURRENCY"] = "6"
+    os.environ["LLM_RPM"] = "600"
+    client = LLMClient()
+    limited_before = server.rate_limited
+
+    async def fan_out():
+        return await asyncio.gather(
+            *(client.acall_with_retry("system", f"message {i}", retries=5) for i in range(requests))
+        )
+
+    start = time.perf_counter()
+    results = asyncio.run(fan_out())
+    async_elapsed = time.perf_counter() - start
+    async_errors = sum(1 for r in results if "error" in r)
+
+    server.stop()
+
+    print(f"요청 {requests}건, 요청당 지연 {latency * 1000:.0f} ms")
+    print(f"  순차 call_with_retry: {serial_elapsed:.2f} s (실패 {serial_errors}건)")
+    print(f"  비동기 팬아웃:        {async_elapsed:.2f} s (실패 {async_errors}건, "
+          f"429 {server.rate_limited - limited_before}회, 최대 동시 처리 {server.peak_inflight})")
+
+
+if __name__ == "__main__":
+    run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 40,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 0.1,
+    )
@@ -0,0 +1,130 @@
+"""
+이슈 카드 열 저장소 비교 (카드별 calculate_issue_probability vs calculate_issue_probabilities 배열 연산)
+
+1. 동일성: 번들 카드(공법별 90개)와 합성 카드(가중치 0 / 정수 / 누락 포함) × 케이스 A~D KPI와 무작위 KPI 벡터에서
+   두 계산 결과가 비트 단위로 같은지 확인, 발생 구간(occurrence_windows)이 일별 판정과 같은지 확인
+   (다르면 AssertionError)
+2. 실행 시간: 카드 N개 × KPI 벡터 M개의 확률 계산
+
+실행:
+    python benchmarks/bench_card_store.py [합성 카드 수] [KPI 벡터 수]
+"""
+
+import contextlib
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def synthetic_cards(method: str, count: int, seed: int = 0):
+    from src.config.case_mapping import KPI_NORMALIZATION
+
+    rng = random.Random(seed)
+    names = list(KPI_NORMALIZATION[method])
+    cards = []
+    for i in range(count):
+        weights = {}
+        for name in names:
+            roll = rng.random()
+            if roll < 0.2:
+                continue  # 누락
+            weights[name] = 0 if roll < 0.35 else rng.randint(1, 3) if roll < 0.5 else round(rng.random(), rng.randint(1, 4))
+        low = rng.randint(0, 90)
+        cards.append({
+            "ID": f"S-{i}",
+            "발생확률(%)": rng.choice([0.1, 0.6, 1.5, 5, 12.5, rng.uniform(0, 100)]),
+            "가중치": weights,
+            "공정률": f"{low}-{rng.randint(low, 100)}",
+            "지연(주)_Min": 1.0, "지연(주)_Max": 2.0, "비용증가(%)_Min": 0.1, "비용증가(%)_Max": 0.5,
+            "심각도": rng.choice(["S1", "S2", "S3"]),
+        })
+    return cards
+
+
+def kpi_vectors(method: str, count: int, seed: int = 1):
+    from src.config.case_mapping import KPI_NORMALIZATION, get_kpi_values
+
+    names = list(KPI_NORMALIZATION[method])
+    vectors = [[get_kpi_values(case, method)[name] for name in names] for case in "ABCD"]
+    rng = np.random.default_rng(seed)
+    maxima = np.array([KPI_NORMALIZATION[method][name]["max"] for name in names])
+    vectors += list(rng.uniform(0, 2, size=(count, len(names))) * maxima)
+    vectors.append([0.0] * len(names))
+    vectors.append(list(maxima))
+    return np.array(vectors, dtype=float)
+
+
+def scalar(cards, vectors, method):
+    from src.config.case_mapping import KPI_NORMALIZATION
+    from src.core.probability_calculator import calculate_issue_probability
+
+    names = list(KPI_NORMALIZATION[method])
+    return np.array([[calculate_issue_probability(card, dict(zip(names, vector)), method) for card in cards]
+                     for vector in vectors])
+
+
+def check_same(cards, method, label, vector_count=200):
+    from src.core.probability_calculator import calculate_issue_probabilities
+    from src.data.card_store import IssueCardStore
+
+    vectors = kpi_vectors(method, vector_count)
+    expected = scalar(cards, vectors, method)
+    actual = calculate_issue_probabilities(IssueCardStore(cards, method), vectors)
+    assert actual.shape == expected.shape
+    assert np.array_equal(actual.view(np.int64), expected.view(np.int64)), f"{label}: 확률이 비트 단위로 다름"
+    print(f"[{label}] 카드 {len(cards)}개 × KPI 벡터 {len(vectors)}개 → 비트 단위 동일")
+
+
+def check_windows(issues, label):
+    from src.core.occurrence_sampler import occurrence_windows
+    from src.data.issue_cards import filter_issues_by_progress
+
+    for target_days in (1, 3, 7, 90, 299, 360, 365, 1000):
+        start, length = occurrence_windows(issues, target_days)
+        for day in range(1, target_days + 1):
+            candidates = {issue["ID"] for issue in filter_issues_by_progress(issues, day / target_days)}
+            in_window = {issue["ID"] for issue, s, n in zip(issues, start, length) if s <= day < s + n}
+            assert candidates == in_window, f"{label} 목표 {target_days}일 / {day}일: 발생 구간이 다름"
+    print(f"[{label}] 발생 구간 = 일별 공정률 판정")
+
+
+def run(count: int = 20000, vector_count: int = 100):
+    with contextlib.redirect_stdout(io.StringIO()):
+        from src.core.probability_calculator import calculate_issue_probabilities
+        from src.data.card_store import IssueCardStore
+        from src.data.issue_cards import get_issues_by_method
+
+    for method in ("BIM", "TRADITIONAL"):
+        check_same(get_issues_by_method(method), method, method)
+        check_same(synthetic_cards(method, 2000), method, f"합성 {method}", vector_count=50)
+        check_windows(get_issues_by_method(method), method)
+    check_windows(synthetic_cards("BIM", 300), "합성")
+
+    cards = synthetic_cards("BIM", count, seed=2)
+    vectors = kpi_vectors("BIM", vector_count - 6)
+
+    started = time.perf_counter()
+    expected = scalar(cards, vectors, "BIM")
+    scalar_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    store = IssueCardStore(cards, "BIM")
+    build_time = time.perf_counter() - started
+    actual = calculate_issue_probabilities(store, vectors)
+    vector_time = time.perf_counter() - started
+
+    assert np.array_equal(actual, expected)
+    print(f"\n카드 {count}개 × KPI 벡터 {len(vectors)}개")
+    print(f"  카드별 calculate_issue_probability: {scalar_time:.2f}s")
+    print(f"  IssueCardStore + calculate_issue_probabilities: {vector_time:.3f}s "
+          f"(저장소 생성 {build_time * 1000:.0f}ms 포함, {scalar_time / vector_time:.0f}배)")
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:3]))
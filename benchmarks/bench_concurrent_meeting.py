@@ -0,0 +1,68 @@
+"""
+하루 신규 이슈 동시 토론 효과 측정
+
+요청당 지연이 있는 스텁 서버로 BIM 시뮬레이션을 순차 토론(MEETING_WORKERS=1) /
+동시 토론(기본 4)으로 각각 1회 실행하고 실행 시간과 결과 동일 여부를 비교한다.
+
+실행:
+    python benchmarks/bench_concurrent_meeting.py [동시 토론 스레드 수]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.stub_openai_server import StubOpenAIServer
+
+
+def run_once(workers: int):
+    from main import load_project_config
+    from src.core.simulation_engine import ConstructionSimulation
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim = ConstructionSimulation(load_project_config(), method="BIM", meeting_workers=workers, seed=42)
+        summary = sim.run_simulation(output_dir=None)
+    elapsed = time.perf_counter() - started
+
+    order = [
+        (log["day"], discussion["issue_id"])
+        for log in sim.daily_logs
+        for discussion in log["discussions"]
+        if discussion.get("type") == "신규"
+    ]
+    busy_days = sum(
+        1 for log in sim.daily_logs
+        if sum(1 for d in log["discussions"] if d.get("type") == "신규") > 1
+    )
+    return elapsed, summary["시뮬레이션결과"], order, busy_days
+
+
+def run(workers: int = 4):
+    server = StubOpenAIServer(latency=0.1).start()
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+    os.environ.setdefault("OPENAI_API_KEY", "sk-stub")
+    os.environ["LLM_CACHE"] = "0"
+
+    sequential = run_once(1)
+    server.peak_inflight = 0
+    concurrent = run_once(workers)
+    server.stop()
+
+    print(f"BIM 시뮬레이션 1회 (요청당 100ms), 신규 이슈 {len(sequential[2])}건, "
+          f"신규 이슈가 2건 이상인 날 {sequential[3]}일")
+    print(f"  순차 토론: {sequential[0]:.1f}s")
+    print(f"  동시 토론 ({workers}스레드): {concurrent[0]:.1f}s, 최대 동시 요청 {server.peak_inflight}건")
+
+    assert concurrent[1] == sequential[1], "동시 토론 여부에 따라 시뮬레이션 결과가 달라짐"
+    assert concurrent[2] == sequential[2], "회의 로그의 토론 순서가 달라짐"
+    print(f"  → 실행 시간 {(1 - concurrent[0] / sequential[0]) * 100:.0f}% 단축, 결과/로그 순서 동일")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 4)
@@ -0,0 +1,131 @@
+"""
+병렬 델파이 모드 정확도 비교
+
+같은 시드로 순차 모드(건축주 의견을 본 뒤 시공사 답변)와 델파이 모드(동시 답변 + 조정 라운드)를 실행하고
+이슈별 합의 심각도 / 지연 결과와 누적 지연·비용이 순차 모드에서 얼마나 벗어나는지 출력한다.
+
+기본은 로컬 스텁 서버를 사용한다. 스텁은 이슈·에이전트별로 다른 심각도를 돌려주고,
+다른 에이전트 의견이 프롬프트에 있으면 그 값 쪽으로 끌리는(앵커링) 응답을 흉내 낸다.
+"live"를 주면 .env에 설정된 실제 API로 실행한다 (비용 발생).
+
+실행:
+    python benchmarks/bench_delphi_drift.py [live]
+    DELPHI_THRESHOLD=1 python benchmarks/bench_delphi_drift.py
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.stub_openai_server import DEFAULT_OPINION, StubOpenAIServer
+
+
+CARD_BASE = {"S1": 7, "S2": 5, "S3": 3}
+ANCHOR_WEIGHT = 0.4  # 다른 에이전트 의견을 본 경우 그 값 쪽으로 끌리는 정도
+
+
+def _offset(*keys) -> int:
+    """에이전트·이슈·일자별로 고정된 -2~+2 편차"""
+    digest = hashlib.sha1(":".join(map(str, keys)).encode("utf-8")).digest()
+    return digest[0] % 5 - 2
+
+
+def agent_responder(body):
+    """프롬프트 내용에 따라 심각도를 정하는 가짜 에이전트"""
+    system, user = (m.get("content") or "" for m in body["messages"][:2])
+    agent = "건축주" if "건축주" in system.split("\n", 1)[0] else "시공사"
+
+    if "최종 심각도를 다시 판단" in system:
+        # 조정 라운드: 상대 평가 쪽으로 차이의 절반만큼 이동
+        own = json.loads(re.search(r"【내 평가】 (\{.*\})", user).group(1))["severity_assessment"]
+        others = [int(v) for v in re.findall(r'"severity_assessment": (\d+)', user.split("【다른 에이전트 평가】")[1])]
+        mean = sum(others) / len(others)
+        return {"severity_assessment": round(own + (mean - own) / 2), "reason": "상대 평가 반영"}
+
+    issue_id = re.search(r"- ID: (\S+)", user).group(1)
+    card = re.search(r"- 심각도: (S\d)", user).group(1)
+    day = re.search(r"Day (\d+)", user).group(1)
+    severity = CARD_BASE.get(card, 5) + _offset(agent, issue_id, day)
+
+    others = re.findall(r'"severity_assessment": (\d+)', user.split("【다른 에이전트 의견】")[-1])
+    if others:
+        severity = severity * (1 - ANCHOR_WEIGHT) + int(others[0]) * ANCHOR_WEIGHT
+    return {**DEFAULT_OPINION, "severity_assessment": max(1, min(10, round(severity))),
+            "recommended_timing": "조건부착수"}
+
+
+def run_once(method: str, mode: str):
+    from main import load_project_config
+    from src.core.simulation_engine import ConstructionSimulation
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim = ConstructionSimulation(load_project_config(), method=method, opinion_mode=mode, seed=42)
+        summary = sim.run_simulation(output_dir=None)
+    elapsed = time.perf_counter() - started
+
+    outcomes = {
+        (log["day"], d["issue_id"]): d
+        for log in sim.daily_logs
+        for d in log["discussions"]
+        if d.get("type") == "신규"
+    }
+    return elapsed, summary["시뮬레이션결과"], outcomes
+
+
+def _number(text: str) -> float:
+    return float(re.match(r"-?[\d.]+", text).group())
+
+
+def compare(method: str):
+    seq_time, seq_result, seq = run_once(method, "sequential")
+    del_time, del_result, delphi = run_once(method, "delphi")
+    assert seq.keys() == delphi.keys(), "두 모드의 이슈 발생이 다름 (같은 시드여야 함)"
+
+    severity_drift = sorted(
+        abs(delphi[k]["severity"]["agent_consensus"] - seq[k]["severity"]["agent_consensus"]) for k in seq
+    )
+    delay_drift = [
+        abs(delphi[k]["severity"]["final_delay_weeks"] - seq[k]["severity"]["final_delay_weeks"]) for k in seq
+    ]
+    reconciled = sum(1 for d in delphi.values() if d.get("delphi", {}).get("reconciled"))
+    within = sum(1 for x in severity_drift if x <= 0.5)
+
+    seq_delay, del_delay = _number(seq_result["누적지연"]), _number(del_result["누적지연"])
+    seq_cost, del_cost = _number(seq_result["누적비용증가"]), _number(del_result["누적비용증가"])
+
+    print(f"[{method}] 신규 이슈 {len(seq)}건, 조정 라운드 {reconciled}건 ({reconciled / len(seq) * 100:.0f}%)")
+    print(f"  실행 시간: 순차 {seq_time:.1f}s → 델파이 {del_time:.1f}s")
+    print(f"  합의 심각도 차이: 평균 {sum(severity_drift) / len(seq):.2f}, 최대 {severity_drift[-1]:.2f}, "
+          f"0.5 이내 {within / len(seq) * 100:.0f}%")
+    print(f"  이슈별 지연 차이: 평균 {sum(delay_drift) / len(seq):.2f}주, 최대 {max(delay_drift):.2f}주")
+    print(f"  누적 지연 {seq_delay:.1f}일 → {del_delay:.1f}일 ({(del_delay - seq_delay) / seq_delay * 100:+.1f}%), "
+          f"누적 비용 {seq_cost:.2f}% → {del_cost:.2f}% ({(del_cost - seq_cost) / seq_cost * 100:+.1f}%)")
+
+
+def run(live: bool = False):
+    server = None
+    if not live:
+        server = StubOpenAIServer(latency=0.05, responder=agent_responder).start()
+        os.environ["OPENAI_BASE_URL"] = server.base_url
+        os.environ.setdefault("OPENAI_API_KEY", "sk-stub")
+        os.environ["LLM_CACHE"] = "0"
+
+    print(f"조정 라운드 기준: 심각도 차이 > {os.getenv('DELPHI_THRESHOLD', '2')}")
+    for method in ("BIM", "TRADITIONAL"):
+        compare(method)
+
+    if server is not None:
+        server.stop()
+
+
+if __name__ == "__main__":
+    run(len(sys.argv) > 1 and sys.argv[1] == "live")
@@ -0,0 +1,106 @@
+"""
+이슈 카드 로드 비교 (import 시 JSON 정규화 vs 공법별 지연 로드 + pickle 스냅샷)
+
+1. import 시간: src.data.issue_cards import만 (새 프로세스, 중앙값)
+2. 공법별 첫 로드: JSON 정규화(스냅샷 없음) vs 스냅샷 읽기, 번들 카드(90개)와 합성 카드 N개
+   (스냅샷 결과가 JSON 정규화 결과와 같은지 확인, 다르면 AssertionError)
+3. 작업 프로세스 시작: 작업 프로세스마다 카드를 처음 조회할 때까지 걸린 시간 (부모에서 preload 여부별)
+
+실행:
+    python benchmarks/bench_issue_card_loading.py [합성 카드 수]
+"""
+
+import json
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def import_time(runs: int = 9) -> float:
+    code = (f"import sys, time; sys.path.insert(0, {str(ROOT)!r}); t = time.perf_counter(); "
+            "import src.data.issue_cards; print(time.perf_counter() - t)")
+    times = [float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True).stdout)
+             for _ in range(runs)]
+    return statistics.median(times)
+
+
+def synthetic_raw(count: int):
+    raw = json.loads((ROOT / "src/data/bim_issues_raw.json").read_text(encoding="utf-8"))
+    rng = random.Random(0)
+    cards = []
+    for i in range(count):
+        card = dict(rng.choice(raw))
+        card["ID"] = f"S-{i}"
+        cards.append(card)
+    return cards
+
+
+def first_load(issue_cards, method: str):
+    """(JSON 정규화 시간, 스냅샷 읽기 시간)"""
+    issue_cards.snapshot_path(method).unlink(missing_ok=True)
+    started = time.perf_counter()
+    from_json = issue_cards.load_issue_cards(method)
+    json_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    from_snapshot = issue_cards.load_issue_cards(method)
+    snapshot_time = time.perf_counter() - started
+    assert from_snapshot == from_json, f"{method}: 스냅샷과 JSON 정규화 결과가 다름"
+    return json_time, snapshot_time
+
+
+def _worker_first_lookup(_):
+    from src.data import issue_cards
+
+    started = time.perf_counter()
+    issue_cards.get_issues_by_method("BIM")
+    return time.perf_counter() - started
+
+
+def worker_startup(issue_cards, preload: bool, workers: int = 2) -> float:
+    """작업 프로세스별 첫 조회 시간 평균"""
+    issue_cards._ISSUES.clear()
+    if preload:
+        issue_cards.preload_issue_cards(["BIM"])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return statistics.mean(executor.map(_worker_first_lookup, range(workers)))
+
+
+def run(count: int = 20000):
+    print(f"import 시간 (카드 로드 없음): {import_time() * 1000:.1f}ms")
+
+    workdir = Path(tempfile.mkdtemp())
+    os.environ["ISSUE_CARD_CACHE_DIR"] = str(workdir / "snapshots")
+    try:
+        from src.data import issue_cards
+
+        for method in ("BIM", "TRADITIONAL"):
+            json_time, snapshot_time = first_load(issue_cards, method)
+            print(f"[{method}] 번들 카드 첫 로드: JSON {json_time * 1000:.1f}ms / 스냅샷 {snapshot_time * 1000:.2f}ms")
+
+        (workdir / "bim_issues_raw.json").write_text(json.dumps(synthetic_raw(count), ensure_ascii=False), encoding="utf-8")
+        issue_cards.DATA_DIR = workdir
+        json_time, snapshot_time = first_load(issue_cards, "BIM")
+        print(f"[합성] 카드 {count}개 첫 로드: JSON {json_time * 1000:.0f}ms / 스냅샷 {snapshot_time * 1000:.0f}ms "
+              f"({json_time / snapshot_time:.1f}배)")
+
+        cold = worker_startup(issue_cards, preload=False)
+        shared = worker_startup(issue_cards, preload=True)
+        print(f"[합성] 작업 프로세스 첫 조회: preload 없음(스냅샷 읽기) {cold * 1000:.0f}ms / "
+              f"preload 후 fork 공유 {shared * 1000:.3f}ms")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,66 @@
+"""
+LLM 응답 JSON 복구 효과 측정
+
+잘린 JSON(max_tokens 초과), 설명 문장이 붙은 JSON, 문자열 심각도("6/10")를 섞어 돌려주는
+스텁 서버로 BIM 시뮬레이션 1회를 실행하고 사용 가능한 응답 비율을 출력한다.
+
+실행:
+    python benchmarks/bench_json_repair.py [망가진 응답 비율]
+"""
+
+import contextlib
+import io
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.stub_openai_server import StubOpenAIServer
+
+
+def run(malformed_rate: float = 0.3):
+    server = StubOpenAIServer(malformed_rate=malformed_rate, seed=7).start()
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+    os.environ.setdefault("OPENAI_API_KEY", "sk-stub")
+    os.environ["LLM_CACHE"] = "0"
+
+    from main import load_project_config
+    from src.agents import LLMOpinionBackend
+    from src.core.simulation_engine import ConstructionSimulation
+
+    class CountingBackend(LLMOpinionBackend):
+        """기본 의견(fallback)으로 대체된 횟수 집계"""
+
+        def __init__(self):
+            super().__init__()
+            self.opinions = 0
+            self.fallbacks = 0
+
+        def give_opinion(self, agent, issue, context, other_opinions=None):
+            opinion = super().give_opinion(agent, issue, context, other_opinions)
+            self.opinions += 1
+            if opinion == agent.fallback_opinion(issue, context):
+                self.fallbacks += 1
+            return opinion
+
+    backend = CountingBackend()
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim = ConstructionSimulation(load_project_config(), method="BIM", backend=backend, seed=42)
+        sim.run_simulation(output_dir=None)
+    server.stop()
+
+    total = sim.metrics.summary()["전체"]
+    broken = server.malformed
+    print(f"의견 요청 {backend.opinions}건, 망가진 응답 주입 {sum(broken.values())}건 "
+          f"(잘림 {broken['truncated']}, 설명 문장 {broken['prose']}, 문자열 심각도 {broken['string_severity']})")
+    print(f"  JSON 복구 {total['json_repaired']}건, 복구 실패 {total['json_failed']}건, "
+          f"수정 요청 {total['fixups']}건, 전체 재시도 {total['retries']}건")
+    print(f"  기본 의견 대체 {backend.fallbacks}건 → 사용 가능 응답 "
+          f"{(1 - backend.fallbacks / backend.opinions) * 100:.1f}%")
+    print(f"  (이전 방식: 잘림/설명 문장 {broken['truncated'] + broken['prose']}건은 프롬프트 전체를 다시 보내는 재시도 대상, "
+          f"문자열 심각도 {broken['string_severity']}건은 심각도 계산 오류)")
+
+
+if __name__ == "__main__":
+    run(float(sys.argv[1]) if len(sys.argv) > 1 else 0.3)
@@ -0,0 +1,62 @@
+"""
+LLMClient 호출 오버헤드 마이크로 벤치마크
+
+호출마다 LLMClient를 새로 만드는 방식(기존 에이전트 동작)과
+프로세스 공유 클라이언트(get_llm_client)를 재사용하는 방식을 로컬 스텁 서버로 비교한다.
+로컬 HTTP라 TLS 핸드셰이크 비용은 포함되지 않으므로 실제 API에서는 차이가 더 크다.
+
+실행:
+    python benchmarks/bench_llm_client.py [호출횟수]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.stub_openai_server import StubOpenAIServer
+
+
+def run(calls: int = 200):
+    server = StubOpenAIServer().start()
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+    os.environ.setdefault("OPENAI_API_KEY", "sk-stub")
+    os.environ["LLM_CACHE"] = "0"  # 캐시 없이 순수 호출 비용만 측정
+
+    from src.utils.llm_client import LLMClient, get_llm_client, set_llm_client
+
+    # 1. 호출마다 새 클라이언트
+    conn_before = server.connections
+    start = time.perf_counter()
+    for i in range(calls):
+        client = LLMClient()
+        client.call("system", f"message {i}")
+        client.close()
+    per_call_elapsed = time.perf_counter() - start
+    per_call_conns = server.connections - conn_before
+
+    # 2. 공유 클라이언트
+    set_llm_client(None)
+    conn_before = server.connections
+    start = time.perf_counter()
+    for i in range(calls):
+        get_llm_client().call("system", f"message {i}")
+    shared_elapsed = time.perf_counter() - start
+    shared_conns = server.connections - conn_before
+    get_llm_client().close()
+
+    server.stop()
+
+    per_call_ms = per_call_elapsed / calls * 1000
+    shared_ms = shared_elapsed / calls * 1000
+
+    print(f"호출 횟수: {calls}")
+    print(f"  호출마다 새 클라이언트: {per_call_ms:.2f} ms/call, 연결 {per_call_conns}개")
+    print(f"  공유 클라이언트:        {shared_ms:.2f} ms/call, 연결 {shared_conns}개")
+    print(f"  호출당 절감:            {per_call_ms - shared_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
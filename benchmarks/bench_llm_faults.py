@@ -0,0 +1,64 @@
+"""
+장애 주입 스텁 서버로 call_with_retry 동작 확인
+
+- 500 오류 / 응답 정지(stall)를 섞어 재시도·데드라인·헤지 요청의 효과를 비교
+- 모든 요청이 실패하는 서버에서 회로 차단기가 열리는지 확인
+
+실행:
+    python benchmarks/bench_llm_faults.py [요청수]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.stub_openai_server import StubOpenAIServer
+
+
+def run(requests: int = 30):
+    server = StubOpenAIServer(latency=0.02, error_rate=0.2, stall_rate=0.1, stall_seconds=3).start()
+    os.environ.update(
+        OPENAI_BASE_URL=server.base_url,
+        LLM_CACHE="0",
+        LLM_TIMEOUT="1",
+        LLM_BACKOFF_BASE="0.05",
+        LLM_CALL_DEADLINE="4",
+        LLM_HEDGE_DELAY="0",
+    )
+    os.environ.setdefault("OPENAI_API_KEY", "sk-stub")
+
+    from src.utils.llm_client import LLMClient
+
+    def measure(client):
+        start = time.perf_counter()
+        results = [client.call_with_retry("system", f"message {i}") for i in range(requests)]
+        return time.perf_counter() - start, sum(1 for r in results if "error" in r)
+
+    # 1. 재시도 + 데드라인
+    elapsed, failed = measure(LLMClient())
+    print(f"재시도/데드라인: {elapsed:.2f} s, 최종 실패 {failed}/{requests}건")
+
+    # 2. 헤지 요청 추가 (0.2초 내 응답 없으면 중복 요청)
+    os.environ["LLM_HEDGE_DELAY"] = "0.2"
+    client = LLMClient()
+    elapsed, failed = measure(client)
+    print(f"헤지 요청:      {elapsed:.2f} s, 최종 실패 {failed}/{requests}건, 헤지 {client.hedged_requests}회")
+
+    # 3. 회로 차단기 (모든 요청 실패)
+    server.error_rate, server.stall_rate = 1.0, 0.0
+    os.environ.update(LLM_HEDGE_DELAY="0", LLM_BREAKER_THRESHOLD="3")
+    client = LLMClient()
+    before = server.server_errors
+    for i in range(10):
+        client.call_with_retry("system", f"message {i}", retries=1)
+    print(f"회로 차단기:    상태 {client.circuit_breaker.state}, "
+          f"10건 중 서버 도달 {server.server_errors - before}건")
+
+    server.stop()
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 30)
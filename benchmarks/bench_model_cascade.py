@@ -0,0 +1,120 @@
+"""
+모델 캐스케이드 효과 측정
+
+스텁 서버에 두 "모델"을 흉내 낸다.
+- 큰 모델(OPENAI_MODEL): 요청당 지연이 길고, 이슈·에이전트별로 고정된 심각도를 돌려줌
+- 작은 모델(LLM_CASCADE_MODEL): 빠르고 싸지만 심각도가 가끔 ±1 틀리고, 일부 응답은 심각도가 빠짐
+
+같은 시드로 큰 모델만 사용 / 캐스케이드를 각각 실행해 실행 시간, 비용, 승격 비율(사유별),
+이슈별 합의 심각도와 누적 지연이 큰 모델만 쓴 결과에서 얼마나 벗어나는지 출력한다.
+
+실행:
+    python benchmarks/bench_model_cascade.py [작은 모델 오답 확률]
+"""
+
+import contextlib
+import hashlib
+import io
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.stub_openai_server import DEFAULT_OPINION, StubOpenAIServer
+
+
+LARGE_MODEL = "gpt-4o"
+SMALL_MODEL = "gpt-4o-mini"
+CARD_BASE = {"S1": 7, "S2": 5, "S3": 3}
+INVALID_RATE = 0.05  # 작은 모델이 심각도를 빼먹는 확률
+
+
+def _roll(*keys) -> float:
+    """에이전트·이슈·일자별로 고정된 0~1 값"""
+    digest = hashlib.sha1(":".join(map(str, keys)).encode("utf-8")).digest()
+    return int.from_bytes(digest[:4], "big") / 2 ** 32
+
+
+def make_responder(error_rate: float):
+    def responder(body):
+        system, user = (m.get("content") or "" for m in body["messages"][:2])
+        agent = "건축주" if "건축주" in system.split("\n", 1)[0] else "시공사"
+        issue_id = re.search(r"- ID: (\S+)", user).group(1)
+        card = re.search(r"- 심각도: (S\d)", user).group(1)
+        day = re.search(r"Day (\d+)", user).group(1)
+
+        severity = CARD_BASE.get(card, 5) + int(_roll(agent, issue_id, day) * 5) - 2
+        if body.get("model") == SMALL_MODEL:
+            roll = _roll(agent, issue_id, day, "small")
+            if roll < INVALID_RATE:
+                return {key: value for key, value in DEFAULT_OPINION.items() if key != "severity_assessment"}
+            if roll < INVALID_RATE + error_rate:
+                severity += 1 if roll < INVALID_RATE + error_rate / 2 else -1
+        return {**DEFAULT_OPINION, "severity_assessment": max(1, min(10, severity))}
+
+    return responder
+
+
+def run_once(cascade: bool):
+    from main import load_project_config
+    from src.agents import LLMOpinionBackend
+    from src.core.simulation_engine import ConstructionSimulation
+    from src.utils.llm_client import LLMClient
+
+    os.environ["OPENAI_MODEL"] = LARGE_MODEL
+    os.environ["LLM_CASCADE_MODEL"] = SMALL_MODEL if cascade else ""
+    backend = LLMOpinionBackend(llm=LLMClient())
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim = ConstructionSimulation(load_project_config(), method="BIM", backend=backend, seed=42)
+        summary = sim.run_simulation(output_dir=None)
+    elapsed = time.perf_counter() - started
+
+    consensus = {
+        (log["day"], d["issue_id"]): d["severity"]["agent_consensus"]
+        for log in sim.daily_logs
+        for d in log["discussions"]
+        if d.get("type") == "신규"
+    }
+    return elapsed, summary["시뮬레이션결과"], consensus, sim.metrics.summary()["전체"]
+
+
+def run(error_rate: float = 0.3):
+    server = StubOpenAIServer(
+        latency=0.3,
+        responder=make_responder(error_rate),
+        model_latency={SMALL_MODEL: 0.05, LARGE_MODEL: 0.3},
+    ).start()
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+    os.environ.setdefault("OPENAI_API_KEY", "sk-stub")
+    os.environ["LLM_CACHE"] = "0"
+
+    large_time, large_result, large_consensus, large_total = run_once(cascade=False)
+    cascade_time, cascade_result, cascade_consensus, cascade_total = run_once(cascade=True)
+    server.stop()
+    assert large_consensus.keys() == cascade_consensus.keys(), "두 실행의 이슈 발생이 다름 (같은 시드여야 함)"
+
+    drift = sorted(abs(cascade_consensus[k] - large_consensus[k]) for k in large_consensus)
+    reasons = ", ".join(f"{reason} {count}" for reason, count in sorted(cascade_total["escalation_reasons"].items()))
+
+    print(f"BIM 시뮬레이션 1회 (큰 모델 300ms / 작은 모델 50ms, 작은 모델 오답 {error_rate * 100:.0f}%, "
+          f"심각도 누락 {INVALID_RATE * 100:.0f}%)")
+    print(f"  큰 모델만: {large_time:.1f}s, ${large_total['cost_usd']:.4f}, API {large_total['api_requests']}건")
+    print(f"  캐스케이드: {cascade_time:.1f}s, ${cascade_total['cost_usd']:.4f}, API {cascade_total['api_requests']}건, "
+          f"큰 모델 사용 {cascade_total['escalations']}/{cascade_total['cascade_requests']}건 "
+          f"({cascade_total['escalation_rate'] * 100:.1f}%: {reasons}), "
+          f"지표상 절감 ${cascade_total['cascade_saved_usd']:.4f}")
+    print(f"  이슈별 합의 심각도 차이: 평균 {sum(drift) / len(drift):.2f}, 최대 {drift[-1]:.2f}, "
+          f"일치 {sum(1 for x in drift if x == 0) / len(drift) * 100:.0f}%")
+    print(f"  누적 지연 {large_result['누적지연']} → {cascade_result['누적지연']}, "
+          f"누적 비용 {large_result['누적비용증가']} → {cascade_result['누적비용증가']}")
+    print(f"  → 실행 시간 {(1 - cascade_time / large_time) * 100:.0f}% 단축, "
+          f"비용 {(1 - cascade_total['cost_usd'] / large_total['cost_usd']) * 100:.0f}% 절감")
+
+
+if __name__ == "__main__":
+    run(float(sys.argv[1]) if len(sys.argv) > 1 else 0.3)
@@ -0,0 +1,81 @@
+"""
+신규 이슈 묶음 요청 효과 측정
+
+프롬프트 접두사 캐시를 흉내 내는 스텁 서버로 BIM 시뮬레이션을 이슈별 요청 / 묶음 요청으로 각각 1회 실행하고
+API 호출 수, 입력 토큰, 추정 비용, 실행 시간을 비교한다. 스텁은 묶음 요청에 이슈 ID별 의견 목록으로 답하며,
+drop_rate 확률로 마지막 이슈를 빼먹어 이슈별 재요청 경로도 확인한다.
+
+실행:
+    python benchmarks/bench_multi_issue.py [이슈 누락 확률]
+"""
+
+import contextlib
+import io
+import os
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.stub_openai_server import DEFAULT_OPINION, StubOpenAIServer
+
+
+def make_responder(drop_rate: float):
+    rng = random.Random(3)
+
+    def responder(body):
+        user = body["messages"][1]["content"]
+        if "【답변 형식 - 여러 이슈】" not in user:
+            return DEFAULT_OPINION
+        issue_ids = re.findall(r"^\[\d+\] (\S+)$", user, re.MULTILINE)
+        if rng.random() < drop_rate:
+            issue_ids = issue_ids[:-1]
+        return {"opinions": [{"issue_id": issue_id, **DEFAULT_OPINION} for issue_id in issue_ids]}
+
+    return responder
+
+
+def run_once(multi_issue: bool):
+    from main import load_project_config
+    from src.agents import LLMOpinionBackend
+    from src.core.simulation_engine import ConstructionSimulation
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        sim = ConstructionSimulation(
+            load_project_config(), method="BIM", backend=LLMOpinionBackend(multi_issue=multi_issue), seed=42
+        )
+        summary = sim.run_simulation(output_dir=None)
+    elapsed = time.perf_counter() - started
+    reasked = out.getvalue().count("이슈별로 다시 요청")
+    return elapsed, summary["시뮬레이션결과"], sim.metrics.summary()["전체"], reasked
+
+
+def run(drop_rate: float = 0.1):
+    server = StubOpenAIServer(latency=0.1, prefix_cache=True, responder=make_responder(drop_rate)).start()
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+    os.environ.setdefault("OPENAI_API_KEY", "sk-stub")
+    os.environ["LLM_CACHE"] = "0"
+
+    results = {multi: run_once(multi) for multi in (False, True)}
+    server.stop()
+
+    print(f"BIM 시뮬레이션 1회 (요청당 100ms, 묶음 응답 이슈 누락 확률 {drop_rate * 100:.0f}%)")
+    for multi, (elapsed, _, total, reasked) in results.items():
+        label = "묶음 요청" if multi else "이슈별 요청"
+        extra = f", 누락으로 이슈별 재요청 {reasked}회" if multi else ""
+        print(f"  {label}: API {total['api_requests']}건, 입력 토큰 {total['prompt_tokens']:,} "
+              f"(캐시 {total['cached_token_ratio'] * 100:.1f}%), 출력 토큰 {total['completion_tokens']:,}, "
+              f"${total['cost_usd']:.4f}, {elapsed:.1f}s{extra}")
+
+    single, multi = results[False], results[True]
+    assert multi[1] == single[1], "묶음 요청 여부에 따라 시뮬레이션 결과가 달라짐"
+    print(f"  → 입력 토큰 {(1 - multi[2]['prompt_tokens'] / single[2]['prompt_tokens']) * 100:.0f}% 감소, "
+          f"API 호출 {single[2]['api_requests'] - multi[2]['api_requests']}건 감소, 결과 동일")
+
+
+if __name__ == "__main__":
+    run(float(sys.argv[1]) if len(sys.argv) > 1 else 0.1)
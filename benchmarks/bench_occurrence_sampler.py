@@ -0,0 +1,124 @@
+"""
+이슈 발생 판정 방식 비교 (daily 베르누이 루프 vs geometric 최초 발생일 추출)
+
+1. 분포 동일성 검정 (공법별)
+   - 이슈별 발생 가능 구간이 매일의 filter_issues_by_progress 결과와 정확히 같은지 확인
+   - daily: 엔진의 filter_issues_by_progress + check_issue_occurrence를 매일 실행 (N회, 시드별 난수원)
+   - geometric: sample_occurrence_schedules로 N회분을 한 번에 추출
+   - 이슈별 발생 비율을 정확한 값 1-(1-p)^구간일수와 비교 (z 검정), 이슈별 발생일 / 반복별 총 발생 수를
+     두 방식 간 2표본 KS 검정으로 비교. 본페로니 보정한 최소 p값이 0.001 미만이면 실패(AssertionError)
+2. 실행 시간: 반복 N회분의 발생 일정을 뽑는 데 걸린 시간
+
+실행:
+    python benchmarks/bench_occurrence_sampler.py [반복 수]
+"""
+
+import contextlib
+import io
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+ALPHA = 0.001
+
+
+def ks_2samp(a: np.ndarray, b: np.ndarray) -> float:
+    """2표본 KS 검정 p값 (점근 분포, 이산 자료에서는 보수적)"""
+    values = np.union1d(a, b)
+    cdf_a = np.searchsorted(np.sort(a), values, side="right") / len(a)
+    cdf_b = np.searchsorted(np.sort(b), values, side="right") / len(b)
+    d = float(np.max(np.abs(cdf_a - cdf_b)))
+    if d == 0:
+        return 1.0
+    ne = len(a) * len(b) / (len(a) + len(b))
+    lam = (math.sqrt(ne) + 0.12 + 0.11 / math.sqrt(ne)) * d
+    p = 2 * sum((-1) ** (k - 1) * math.exp(-2 * k * k * lam * lam) for k in range(1, 101))
+    return min(max(p, 0.0), 1.0)
+
+
+def z_test(count: int, n: int, expected: float) -> float:
+    """발생 횟수가 이항분포 B(n, expected)와 맞는지 (정규 근사 양측 p값)"""
+    variance = n * expected * (1 - expected)
+    if variance == 0:
+        return 1.0 if count == n * expected else 0.0
+    return math.erfc(abs(count - n * expected) / math.sqrt(2 * variance))
+
+
+def daily_schedules(sim, runs: int, seed: int) -> np.ndarray:
+    """엔진의 일별 루프로 발생일 추출 (회의 없이 발생 판정만)"""
+    from src.core.issue_manager import IssueManager
+    from src.core.monte_carlo import replication_seeds
+    from src.core.rng import SimulationRNG
+    from src.data.issue_cards import filter_issues_by_progress
+
+    index = {issue["ID"]: i for i, issue in enumerate(sim.all_issues)}
+    days = np.zeros((runs, len(sim.all_issues)), dtype=np.int64)
+    for run, run_seed in enumerate(replication_seeds(seed, runs)):
+        sim.rng = SimulationRNG(run_seed)
+        sim.issue_manager = IssueManager()
+        for day in range(1, sim.context.target_days + 1):
+            candidates = filter_issues_by_progress(sim.all_issues, sim.context.get_progress_rate(day))
+            for issue in sim.check_issue_occurrence(candidates):
+                sim.issue_manager.occurred_issue_ids.add(issue["ID"])
+                days[run, index[issue["ID"]]] = day
+    return days
+
+
+def check_method(method: str, runs: int):
+    from main import load_project_config
+    from src.core.occurrence_sampler import issue_probabilities, occurrence_windows, sample_occurrence_schedules
+    from src.core.simulation_engine import ConstructionSimulation
+    from src.data.issue_cards import filter_issues_by_progress
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim = ConstructionSimulation(load_project_config(), method=method, backend="heuristic")
+    issues, kpi, target_days = sim.all_issues, sim.context.kpi_values, sim.context.target_days
+
+    started = time.perf_counter()
+    daily = daily_schedules(sim, runs, seed=1)
+    daily_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    geometric = sample_occurrence_schedules(issues, kpi, method, target_days, runs, np.random.default_rng(2))
+    geometric_time = time.perf_counter() - started
+
+    start, length = occurrence_windows(issues, target_days)
+    for day in range(1, target_days + 1):
+        candidates = {issue["ID"] for issue in filter_issues_by_progress(issues, sim.context.get_progress_rate(day))}
+        in_window = {issue["ID"] for issue, s, n in zip(issues, start, length) if s <= day < s + n}
+        assert candidates == in_window, f"{method} {day}일: 발생 가능 구간이 공정률 필터와 다름"
+    expected = 1 - (1 - issue_probabilities(issues, kpi, method)) ** length
+
+    p_values = []
+    for i in range(len(issues)):
+        p_values.append(z_test(int((daily[:, i] > 0).sum()), runs, expected[i]))
+        p_values.append(z_test(int((geometric[:, i] > 0).sum()), runs, expected[i]))
+        # 발생하지 않은 반복은 목표 공기 다음 날로 두고 발생일 분포 비교
+        p_values.append(ks_2samp(np.where(daily[:, i] > 0, daily[:, i], target_days + 1),
+                                 np.where(geometric[:, i] > 0, geometric[:, i], target_days + 1)))
+    totals_p = ks_2samp((daily > 0).sum(axis=1), (geometric > 0).sum(axis=1))
+    p_values.append(totals_p)
+    min_adjusted = min(min(p_values) * len(p_values), 1.0)
+
+    print(f"[{method}] 이슈 {len(issues)}개, 반복 {runs}회")
+    print(f"  총 발생 수 평균: daily {(daily > 0).sum(axis=1).mean():.2f} / geometric {(geometric > 0).sum(axis=1).mean():.2f} "
+          f"/ 정확값 {expected.sum():.2f} (KS p={totals_p:.3f})")
+    print(f"  검정 {len(p_values)}건, 본페로니 보정 최소 p값 {min_adjusted:.3f}")
+    print(f"  발생 일정 추출 시간: daily {daily_time:.2f}s / geometric {geometric_time * 1000:.1f}ms "
+          f"({daily_time / geometric_time:.0f}배)")
+    assert min_adjusted >= ALPHA, f"{method}: daily와 geometric 발생 분포가 다름 (보정 p={min_adjusted:.4g})"
+
+
+def run(runs: int = 400):
+    for method in ("BIM", "TRADITIONAL"):
+        check_method(method, runs)
+    print("→ 두 방식의 발생 분포 일치")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 400)
@@ -0,0 +1,109 @@
+"""
+프롬프트 접두사 캐시 효과 측정
+
+1. 접두사 안정성 확인: 에이전트별 시스템 프롬프트가 일자/진행률/누적값/이슈 현황과 무관하게
+   바이트 단위로 같은지 검사 (다르면 AssertionError)
+2. 접두사 캐시를 흉내 내는 로컬 스텁 서버로 BIM 시뮬레이션 1회를 실행하고
+   입력 토큰 중 캐시 적중 비율과 추정 비용을 출력
+
+실행:
+    python benchmarks/bench_prefix_cache.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.stub_openai_server import StubOpenAIServer
+
+
+def make_context(method: str, day: int, active: int) -> dict:
+    """일자별로 값이 달라지는 회의 컨텍스트"""
+    from src.config.case_mapping import get_kpi_values
+
+    return {
+        "method": method,
+        "current_day": day,
+        "progress_rate": day / 400,
+        "project_summary": {"총공사비": "100억원", "목표공기": "400일"},
+        "kpi_values": get_kpi_values("A" if day % 2 else "D", method),
+        "daily_finance_cost": f"{day * 1.5:.1f}만원",
+        "cumulative": {"total_delay_days": day * 0.7, "total_cost_overrun": day * 0.05},
+        "issue_status": {
+            "해결완료": [],
+            "진행중": [{"ID": f"I-{i:02d}", "이름": "이슈", "진행률": "10%", "카테고리": "시공"} for i in range(active)],
+            "대기중": [],
+        },
+    }
+
+
+class _RecordingLLM:
+    """LLM 백엔드가 보내는 요청을 기록만 하는 가짜 클라이언트"""
+
+    def __init__(self):
+        self.requests = []
+
+    def call_with_retry(self, system_prompt, user_message, **kwargs):
+        self.requests.append((system_prompt, user_message))
+        return {"severity_assessment": 5}
+
+    def call_cascade(self, system_prompt, user_message, **kwargs):
+        # 캐스케이드 없음 (LLMClient.call_cascade와 같이 call_with_retry로 위임)
+        return self.call_with_retry(system_prompt, user_message)
+
+
+def check_prefix_stability():
+    """실제 의견 요청 경로에서 시스템 프롬프트(고정 접두사)가 회의마다 같은지 확인"""
+    from src.agents import OwnerAgent, ContractorAgent, LLMOpinionBackend
+    from src.data.issue_cards import get_issues_by_method
+
+    for method in ("BIM", "TRADITIONAL"):
+        issues = get_issues_by_method(method)
+        for agent in (OwnerAgent(), ContractorAgent(method)):
+            llm = _RecordingLLM()
+            backend = LLMOpinionBackend(llm=llm)
+            for day, active in ((1, 0), (57, 3), (230, 8)):
+                context = make_context(method, day, active)
+                backend.give_opinion(agent, issues[day % len(issues)], context, {"건축주": {"severity_assessment": day % 10}})
+
+            system_prompts = {system.encode("utf-8") for system, _ in llm.requests}
+            assert len(system_prompts) == 1, f"{agent.name}({method}) 시스템 프롬프트가 회의마다 달라짐"
+            # 일자별 값은 사용자 메시지에만 있어야 함
+            for (system, user), day in zip(llm.requests, (1, 57, 230)):
+                assert f"Day {day}" in user and f"Day {day}" not in system
+            print(f"  {agent.name}({method}): 고정 접두사 {len(system_prompts.pop())} bytes - 회의마다 동일")
+
+
+def run():
+    print("접두사 안정성 확인")
+    check_prefix_stability()
+
+    server = StubOpenAIServer(prefix_cache=True).start()
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+    os.environ.setdefault("OPENAI_API_KEY", "sk-stub")
+    os.environ["LLM_CACHE"] = "0"  # 응답 캐시 없이 모든 요청을 서버로 보냄
+
+    from main import load_project_config
+    from src.core.simulation_engine import ConstructionSimulation
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim = ConstructionSimulation(load_project_config(), method="BIM", seed=42)
+        sim.run_simulation(output_dir=None)
+    server.stop()
+
+    summary = sim.metrics.summary()
+    total = summary["전체"]
+    print(f"\nBIM 시뮬레이션 1회: API 호출 {total['api_requests']}건")
+    print(f"  입력 토큰 {total['prompt_tokens']:,} 중 캐시 적중 {total['cached_tokens']:,} "
+          f"({total['cached_token_ratio'] * 100:.1f}%)")
+    print(f"  추정 비용 ${total['cost_usd']:.4f}")
+    for agent, stats in summary["agent"].items():
+        print(f"  - {agent}: 캐시 적중 {stats['cached_token_ratio'] * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    run()
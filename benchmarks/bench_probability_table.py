@@ -0,0 +1,167 @@
+"""
+일별 이슈 발생 판정 비용 비교 (후보마다 calculate_issue_probability vs ProjectContext 확률표 조회)
+
+1. 동일성: 번들 카드 / 합성 카드 × 케이스 A~D에서 확률표가 카드별 calculate_issue_probability와
+   비트 단위로 같은지, KPI 값(set_kpi_values / 직접 수정) / 케이스 / 공법 / 카드 목록을 바꾸면 표가 다시 계산되는지 확인
+   (다르면 AssertionError)
+2. 실행 시간: 목표 공기 동안 매일 후보 이슈의 발생 여부 판정 (일별 루프의 check_issue_occurrence 부분),
+   하루 평균 비용 (두 방식의 발생 이슈가 같은지도 확인)
+
+실행:
+    python benchmarks/bench_probability_table.py [합성 카드 수] [목표 공기]
+"""
+
+import contextlib
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_card_store import synthetic_cards  # noqa: E402
+
+
+def make_context(method: str, case: str, target_days: int = 360):
+    from src.config.case_mapping import get_kpi_values
+    from src.config.project_context import ProjectContext
+
+    return ProjectContext(
+        location="도심", floor_area_ratio=60, total_area=5000, total_budget=50,
+        planned_duration_days=target_days, building_type="상업", ground_roughness="B",
+        method=method, case=case, kpi_values=get_kpi_values(case, method),
+    )
+
+
+def check_same(issues, method, label):
+    from src.core.probability_calculator import calculate_issue_probability
+
+    for case in "ABCD":
+        context = make_context(method, case)
+        table = context.issue_probabilities(issues)
+        expected = np.array([calculate_issue_probability(issue, context.kpi_values, method) for issue in issues])
+        actual = np.array([table[issue["ID"]] for issue in issues])
+        assert np.array_equal(actual.view(np.int64), expected.view(np.int64)), f"{label} 케이스 {case}: 확률표가 다름"
+        assert context.issue_probabilities(issues) is table, f"{label} 케이스 {case}: 확률표가 재사용되지 않음"
+    print(f"[{label}] 카드 {len(issues)}개 × 케이스 A~D → 비트 단위 동일")
+
+
+def check_invalidation(issues, method):
+    from src.config.case_mapping import get_kpi_values
+    from src.core.probability_calculator import calculate_issue_probability, clear_probability_tables
+    from src.data import card_store, issue_cards
+
+    context = make_context(method, "A")
+    before = context.issue_probabilities(issues)
+
+    context.set_kpi_values(get_kpi_values("D", method))
+    after = context.issue_probabilities(issues)
+    assert after is not before
+    assert all(after[issue["ID"]] == calculate_issue_probability(issue, context.kpi_values, method) for issue in issues)
+
+    name = next(iter(context.kpi_values))
+    context.kpi_values[name] *= 2  # 직접 수정
+    changed = context.issue_probabilities(issues)
+    assert changed is not after
+    assert all(changed[issue["ID"]] == calculate_issue_probability(issue, context.kpi_values, method) for issue in issues)
+
+    context.case = "B"
+    assert context.issue_probabilities(issues) is not changed, "케이스 변경이 감지되지 않음"
+
+    other = "TRADITIONAL" if method == "BIM" else "BIM"
+    context.method = other
+    context.kpi_values = get_kpi_values("B", other)
+    cards = synthetic_cards(other, len(issues))
+    table = context.issue_probabilities(cards)
+    assert all(table[card["ID"]] == calculate_issue_probability(card, context.kpi_values, other) for card in cards)
+
+    # 같은 길이의 새 목록 (모듈 캐시를 비워 이전 목록이 해제되면 새 목록이 같은 id를 물려받음)
+    sources = [synthetic_cards(other, len(issues), seed=seed) for seed in range(1, 6)]
+    for source in sources:
+        clear_probability_tables()
+        card_store._STORE_CACHE.clear()
+        issue_cards._INDEX_CACHE.clear()
+        del cards
+        cards = list(source)
+        table = context.issue_probabilities(cards)
+        assert all(table[card["ID"]] == calculate_issue_probability(card, context.kpi_values, other) for card in cards), \
+            "새 카드 목록에 이전 확률표 사용"
+    print(f"[{method}] KPI / 케이스 / 공법 / 카드 목록 변경 시 확률표 다시 계산")
+
+
+def daily_scalar(issues, context, uniforms):
+    """기존 방식: 매일 후보마다 확률 계산"""
+    from src.core.probability_calculator import calculate_issue_probability
+    from src.data.issue_cards import filter_issues_by_progress
+
+    occurred_ids, elapsed = set(), 0.0
+    for day in range(1, context.target_days + 1):
+        candidates = filter_issues_by_progress(issues, context.get_progress_rate(day))
+        started = time.perf_counter()
+        for issue in candidates:
+            if issue["ID"] in occurred_ids:
+                continue
+            prob = calculate_issue_probability(issue, context.kpi_values, context.method)
+            if uniforms[issue["ID"]][day] < prob:
+                occurred_ids.add(issue["ID"])
+        elapsed += time.perf_counter() - started
+    return occurred_ids, elapsed
+
+
+def daily_table(issues, context, uniforms):
+    """확률표 조회 (확률표는 첫날 계산, 그 시간 포함)"""
+    from src.data.issue_cards import filter_issues_by_progress
+
+    occurred_ids, elapsed = set(), 0.0
+    for day in range(1, context.target_days + 1):
+        candidates = filter_issues_by_progress(issues, context.get_progress_rate(day))
+        started = time.perf_counter()
+        probabilities = context.issue_probabilities(issues)
+        for issue in candidates:
+            if issue["ID"] in occurred_ids:
+                continue
+            if uniforms[issue["ID"]][day] < probabilities[issue["ID"]]:
+                occurred_ids.add(issue["ID"])
+        elapsed += time.perf_counter() - started
+    return occurred_ids, elapsed
+
+
+def compare(issues, method, label, target_days):
+    from src.core.probability_calculator import clear_probability_tables
+
+    rng = random.Random(0)
+    uniforms = {issue["ID"]: [rng.random() for _ in range(target_days + 1)] for issue in issues}
+
+    clear_probability_tables()
+    expected, scalar_time = daily_scalar(issues, make_context(method, "B", target_days), uniforms)
+    actual, table_time = daily_table(issues, make_context(method, "B", target_days), uniforms)
+    assert actual == expected, f"{label}: 발생 이슈가 다름"
+
+    print(f"[{label}] 카드 {len(issues)}개 × {target_days}일 (발생 {len(actual)}건)")
+    print(f"  후보마다 calculate_issue_probability: 하루 {scalar_time / target_days * 1e6:.1f}µs")
+    print(f"  ProjectContext 확률표 조회: 하루 {table_time / target_days * 1e6:.1f}µs "
+          f"({scalar_time / table_time:.1f}배)")
+
+
+def run(count: int = 20000, target_days: int = 360):
+    with contextlib.redirect_stdout(io.StringIO()):
+        from src.data.issue_cards import get_issues_by_method
+
+        bundled = {method: get_issues_by_method(method) for method in ("BIM", "TRADITIONAL")}
+
+    for method, issues in bundled.items():
+        check_same(issues, method, method)
+        check_same(synthetic_cards(method, 2000), method, f"합성 {method}")
+        check_invalidation(issues, method)
+
+    print()
+    for method, issues in bundled.items():
+        compare(issues, method, method, target_days)
+    compare(synthetic_cards("BIM", count, seed=2), "BIM", "합성 BIM", target_days)
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,91 @@
+"""
+공정률 구간 색인 비교 (매일 문자열 파싱 + 전체 순회 vs ProgressIndex 버킷 조회)
+
+1. 동일성: 이슈 카드(90개)와 합성 카드(잘못된 범위 포함)에서 모든 목표 공기 / 일자의 후보 이슈가
+   이전 filter_issues_by_progress 결과와 순서까지 같은지 확인 (다르면 AssertionError)
+2. 실행 시간: 합성 카드 N개, 360일 동안 매일 후보 이슈 조회
+
+실행:
+    python benchmarks/bench_progress_index.py [합성 카드 수]
+"""
+
+import contextlib
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def legacy_filter(issues, progress_rate):
+    """이전 구현 (매 호출 문자열 파싱, 파싱 실패는 무시)"""
+    filtered = []
+    progress_pct = progress_rate * 100
+    for issue in issues:
+        try:
+            parts = issue["공정률"].split("-")
+            if int(parts[0]) <= progress_pct <= int(parts[1]):
+                filtered.append(issue)
+        except (ValueError, IndexError):
+            continue
+    return filtered
+
+
+def synthetic_cards(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    cards = []
+    for i in range(count):
+        roll = rng.random()
+        if roll < 0.01:
+            # "0-25-50"처럼 3개 이상인 형식은 이전 구현이 앞의 두 값을 썼으므로 비교에서 제외 (새 구현은 잘못된 범위)
+            range_str = rng.choice(["", "abc", "10", "a-b", "30-10", "5.5-20", "-5-10"])
+        else:
+            low = rng.randint(-5, 100)
+            range_str = f"{low}-{min(low + rng.randint(0, 40), 110)}"
+        cards.append({"ID": f"S-{i}", "공정률": range_str})
+    return cards
+
+
+def check_same(issues, label):
+    from src.data.issue_cards import ProgressIndex
+
+    index = ProgressIndex(issues)
+    rates = [day / target for target in (1, 7, 90, 300, 360, 365, 1000) for day in range(0, target + 2)]
+    rng = random.Random(1)
+    rates += [rng.uniform(-0.1, 1.1) for _ in range(2000)]
+    for rate in rates:
+        assert index.candidates(rate) == legacy_filter(issues, rate), f"{label}: 공정률 {rate * 100}%에서 결과가 다름"
+    print(f"[{label}] 카드 {len(issues)}개 (잘못된 범위 {len(index.malformed)}개), 공정률 {len(rates)}개 → 결과 동일")
+
+
+def run(count: int = 20000):
+    with contextlib.redirect_stdout(io.StringIO()):
+        from src.data.issue_cards import BIM_ISSUES, TRADITIONAL_ISSUES, ProgressIndex
+
+    check_same(BIM_ISSUES, "BIM")
+    check_same(TRADITIONAL_ISSUES, "TRADITIONAL")
+    check_same(synthetic_cards(5000), "합성")
+
+    cards = synthetic_cards(count, seed=1)
+    rates = [day / 360 for day in range(1, 361)]
+
+    started = time.perf_counter()
+    legacy = sum(len(legacy_filter(cards, rate)) for rate in rates)
+    legacy_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    index = ProgressIndex(cards)
+    build_time = time.perf_counter() - started
+    indexed = sum(len(index.candidates(rate)) for rate in rates)
+    indexed_time = time.perf_counter() - started
+
+    assert legacy == indexed
+    print(f"\n합성 카드 {count}개 × 360일 (일평균 후보 {indexed / len(rates):.0f}개)")
+    print(f"  매일 파싱 + 순회: {legacy_time:.2f}s")
+    print(f"  ProgressIndex: {indexed_time:.3f}s (색인 생성 {build_time * 1000:.0f}ms 포함, {legacy_time / indexed_time:.0f}배)")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
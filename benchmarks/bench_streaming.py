@@ -0,0 +1,90 @@
+"""
+스트리밍 응답(심각도 선행 추출) 효과 측정
+
+출력 토큰마다 생성 시간이 걸리는 스텁 서버로 BIM 시뮬레이션을 일반 호출 / 스트리밍 호출로
+각각 1회 실행하고 전체 실행 시간, 의견 1건당 심각도 도착 시간을 비교한다.
+스트리밍 실행에서도 회의 로그의 의견이 전체 필드로 채워졌는지 확인한다.
+
+실행:
+    python benchmarks/bench_streaming.py [토큰당 생성 시간(초)]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.stub_openai_server import StubOpenAIServer
+
+
+# 실제 응답과 비슷한 길이의 의견 (severity_assessment가 맨 앞)
+LONG_OPINION = {
+    "severity_assessment": 7,
+    "concern_level": "높음",
+    "priority": "일정 준수",
+    "recommended_timing": "즉시착수",
+    "impact_on_schedule": "단기영향",
+    "safety_risk": "보통",
+    "recommended_sequence": "즉시착수",
+    "budget_tolerance": "0.5%",
+    "resource_conflict": "있음",
+    "relationship_with_active_issues": "진행 중인 골조 이슈와 양중 장비를 공유하므로 작업 순서 조정이 필요함",
+    "field_assessment": "작업 공간은 확보 가능하나 타워크레인 사용 시간이 겹쳐 오전/오후 분리 운영이 필요함",
+    "opinion": "신규 이슈는 현재 진행 중인 이슈들과 인력 및 장비를 공유하고 있어 단독으로 처리하면 다른 공종의 "
+               "지연을 유발할 수 있다. 우선순위를 일정 준수에 두고, 간섭이 적은 구간부터 즉시 착수하되 "
+               "하도급 투입 일정과 자재 반입 일정을 함께 조정해 누적 지연이 커지지 않도록 관리해야 한다.",
+}
+
+
+def run_once(stream: bool):
+    from main import load_project_config
+    from src.agents import LLMOpinionBackend
+    from src.core.simulation_engine import ConstructionSimulation
+
+    backend = LLMOpinionBackend(stream=stream)
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim = ConstructionSimulation(load_project_config(), method="BIM", backend=backend, seed=42)
+        summary = sim.run_simulation(output_dir=None)
+    elapsed = time.perf_counter() - started
+
+    opinions = [
+        opinion
+        for log in sim.daily_logs
+        for discussion in log.get("discussions", [])
+        for opinion in discussion.get("opinions", {}).values()
+    ]
+    complete = sum(1 for opinion in opinions if opinion.get("opinion") == LONG_OPINION["opinion"])
+    return elapsed, summary, sim.metrics.summary()["전체"], len(opinions), complete
+
+
+def run(token_latency: float = 0.001):
+    server = StubOpenAIServer(latency=0.05, response=LONG_OPINION, token_latency=token_latency).start()
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+    os.environ.setdefault("OPENAI_API_KEY", "sk-stub")
+    os.environ["LLM_CACHE"] = "0"
+
+    results = {}
+    for stream in (False, True):
+        results[stream] = run_once(stream)
+    server.stop()
+
+    print(f"BIM 시뮬레이션 1회 (첫 토큰 50ms, 토큰당 {token_latency * 1000:.1f}ms)")
+    for stream, (elapsed, summary, total, opinions, complete) in results.items():
+        label = "스트리밍" if stream else "일반 호출"
+        early = f", 심각도 도착 평균 {total['early_fields_mean_ms']:.0f}ms" if stream else ""
+        print(f"  {label}: {elapsed:.1f}s, 의견 {opinions}건 (전체 필드 {complete}건), "
+              f"응답 완료 평균 {total['latency_mean_ms']:.0f}ms{early}")
+
+    base, streamed = results[False], results[True]
+    assert streamed[1]["시뮬레이션결과"] == base[1]["시뮬레이션결과"], "스트리밍 여부에 따라 시뮬레이션 결과가 달라짐"
+    assert streamed[3] == streamed[4], "스트리밍 후 회의 로그에 완성되지 않은 의견이 남음"
+    print(f"  → 실행 시간 {(1 - streamed[0] / base[0]) * 100:.0f}% 단축, 시뮬레이션 결과 동일")
+
+
+if __name__ == "__main__":
+    run(float(sys.argv[1]) if len(sys.argv) > 1 else 0.001)
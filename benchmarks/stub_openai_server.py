@@ -0,0 +1,425 @@
+"""
+로컬 OpenAI 호환 스텁 서버
+벤치마크 및 오프라인 검증용 (실제 API 키/네트워크 불필요)
+
+지원 엔드포인트:
+    POST /v1/chat/completions (stream=True면 SSE)
+    POST /v1/files, GET /v1/files/{id}/content
+    POST /v1/batches, GET /v1/batches/{id}
+
+사용 예:
+    server = StubOpenAIServer(latency=0.01).start()
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+    ...
+    server.stop()
+"""
+
+import hashlib
+import json
+import random
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict
+
+
+# 기본 응답 (건축주/시공사 의견 형식)
+DEFAULT_OPINION = {
+    "severity_assessment": 6,
+    "concern_level": "보통",
+    "priority": "일정 준수",
+    "opinion": "스텁 서버 응답",
+    "field_assessment": "스텁 서버 응답",
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # keep-alive 지원 (Nagle 비활성화로 작은 응답의 지연 ACK 대기 방지)
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.stub.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        stub = self.server.stub
+        parts = self.path.strip("/").split("/")
+
+        if len(parts) == 3 and parts[1] == "batches":
+            self._send_json(200, stub.retrieve_batch(parts[2]))
+        elif len(parts) == 4 and parts[1] == "files" and parts[3] == "content":
+            data = stub.files[parts[2]]["content"]
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        else:
+            self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+
+    def do_POST(self):
+        stub = self.server.stub
+        length = int(self.headers.get("Content-Length", 0))
+        raw = self.rfile.read(length)
+
+        if self.path.endswith("/files"):
+            self._send_json(200, stub.create_file(self.headers.get("Content-Type", ""), raw))
+            return
+
+        body = json.loads(raw or b"{}")
+
+        if self.path.endswith("/batches"):
+            self._send_json(200, stub.create_batch(body))
+        elif self.path.endswith("/chat/completions"):
+            if not stub.enter():
+                stub.rate_limited += 1
+                self._send_json(
+                    429,
+                    {"error": {"message": "Rate limit reached (stub)", "type": "rate_limit_error"}},
+                    headers={"retry-after": "0.05"},
+                )
+                return
+            try:
+                fault = stub.pick_fault()
+                latency = stub.model_latency.get(body.get("model"), stub.latency)
+                if fault == "stall":
+                    time.sleep(stub.stall_seconds)
+                elif latency:
+                    time.sleep(latency)
+
+                if fault == "error":
+                    stub.server_errors += 1
+                    self._send_json(500, {"error": {"message": "Internal error (stub)", "type": "server_error"}})
+                elif body.get("stream"):
+                    self._send_stream(stub.make_completion(body), body.get("stream_options") or {})
+                else:
+                    completion = stub.make_completion(body)
+                    if stub.token_latency:
+                        time.sleep(stub.token_latency * completion["usage"]["completion_tokens"])
+                    self._send_json(200, completion)
+            finally:
+                stub.leave()
+        else:
+            self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+
+    def _send_stream(self, completion: Dict, stream_options: Dict):
+        """SSE 스트리밍 응답 (토큰 단위 조각, 조각마다 token_latency 대기)"""
+        stub = self.server.stub
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def send_event(payload):
+            text = payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False)
+            data = f"data: {text}\n\n".encode("utf-8")
+            self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+
+        base = {key: completion[key] for key in ("id", "created", "model")}
+        base["object"] = "chat.completion.chunk"
+        choice = completion["choices"][0]
+        content = choice["message"]["content"]
+
+        send_event({**base, "choices": [{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}]})
+        for start in range(0, len(content), stub.CHARS_PER_TOKEN):
+            if stub.token_latency:
+                time.sleep(stub.token_latency)
+            piece = content[start:start + stub.CHARS_PER_TOKEN]
+            send_event({**base, "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]})
+        send_event({**base, "choices": [{"index": 0, "delta": {}, "finish_reason": choice["finish_reason"]}]})
+        if stream_options.get("include_usage"):
+            send_event({**base, "choices": [], "usage": completion["usage"]})
+        send_event("[DONE]")
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def _send_json(self, status: int, payload: Dict, headers: Dict = None):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # 클라이언트가 타임아웃으로 먼저 끊은 연결은 무시
+        pass
+
+
+class StubOpenAIServer:
+    """OpenAI 호환 스텁 서버 (/v1/chat/completions)"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        response: Dict = None,
+        port: int = 0,
+        max_inflight: int = 0,
+        rate_limit_rate: float = 0.0,
+        error_rate: float = 0.0,
+        stall_rate: float = 0.0,
+        stall_seconds: float = 30.0,
+        seed: int = 0,
+        prefix_cache: bool = False,
+        malformed_rate: float = 0.0,
+        token_latency: float = 0.0,
+        responder: Callable[[Dict], Dict] = None,
+        model_latency: Dict[str, float] = None,
+    ):
+        """
+        Args:
+            latency: 요청당 인위적 지연 (초, 스트리밍이면 첫 토큰까지의 지연)
+            response: 응답 content로 돌려줄 JSON
+            port: 포트 (0이면 임의 포트)
+            max_inflight: 동시 처리 한도 (초과 요청은 429, 0이면 무제한)
+            rate_limit_rate: 무작위로 429를 돌려줄 확률
+            error_rate: 무작위로 500을 돌려줄 확률
+            stall_rate: 응답을 stall_seconds초 동안 멈출 확률 (타임아웃/헤지 검증용)
+            seed: 장애 주입용 난수 시드
+            prefix_cache: OpenAI 프롬프트 접두사 캐시 흉내 (usage.prompt_tokens_details.cached_tokens 보고)
+            malformed_rate: 잘린 JSON / 설명 문장이 붙은 JSON / 문자열 심각도 응답을 돌려줄 확률
+            token_latency: 출력 토큰 1개 생성 시간 (초, 스트리밍은 조각마다, 아니면 응답 전체만큼 대기)
+            responder: 요청 body → 응답 JSON 함수 (프롬프트에 따라 응답을 바꿀 때, 없으면 response 고정)
+            model_latency: 모델명 → 요청당 지연 (모델 캐스케이드 검증용, 없는 모델은 latency)
+        """
+        self.latency = latency
+        self.response = response or DEFAULT_OPINION
+        self.max_inflight = max_inflight
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.stall_rate = stall_rate
+        self.stall_seconds = stall_seconds
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.prefix_cache = prefix_cache
+        self._seen_prefixes = set()
+
+        # 통계
+        self.requests = 0
+        self.connections = 0
+        self.rate_limited = 0
+        self.server_errors = 0
+        self.stalled = 0
+        self.malformed_rate = malformed_rate
+        self.token_latency = token_latency
+        self.responder = responder
+        self.model_latency = model_latency or {}
+        self.malformed = {"truncated": 0, "prose": 0, "string_severity": 0}
+        self.inflight = 0
+        self.peak_inflight = 0
+
+        # Batch 에뮬레이션 상태
+        self.files: Dict[str, Dict] = {}
+        self.batches: Dict[str, Dict] = {}
+
+        self._httpd = _QuietHTTPServer(("127.0.0.1", port), _Handler)
+        self._httpd.stub = self
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "StubOpenAIServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def enter(self) -> bool:
+        """요청 수락 여부 (False면 429)"""
+        with self._lock:
+            if self.rate_limit_rate and self._random.random() < self.rate_limit_rate:
+                return False
+            if self.max_inflight and self.inflight >= self.max_inflight:
+                return False
+            self.requests += 1
+            self.inflight += 1
+            self.peak_inflight = max(self.peak_inflight, self.inflight)
+            return True
+
+    def pick_fault(self) -> str:
+        """이번 요청에 주입할 장애 ("error" / "stall" / "")"""
+        with self._lock:
+            roll = self._random.random()
+            if roll < self.error_rate:
+                return "error"
+            if roll < self.error_rate + self.stall_rate:
+                self.stalled += 1
+                return "stall"
+            return ""
+
+    def pick_malformed(self) -> str:
+        """이번 응답을 망가뜨릴 방식 ("truncated" / "prose" / "string_severity" / "")"""
+        with self._lock:
+            if not self.malformed_rate or self._random.random() >= self.malformed_rate:
+                return ""
+            kind = self._random.choice(list(self.malformed))
+            self.malformed[kind] += 1
+            return kind
+
+    def leave(self):
+        with self._lock:
+            self.inflight -= 1
+
+    def create_file(self, content_type: str, raw: bytes) -> Dict:
+        """multipart 업로드에서 파일 내용을 꺼내 저장"""
+        message = BytesParser(policy=HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + raw
+        )
+        content = b""
+        purpose = "batch"
+        for part in message.iter_parts():
+            name = part.get_param("name", header="content-disposition")
+            if name == "file":
+                content = part.get_payload(decode=True)
+            elif name == "purpose":
+                purpose = part.get_content().strip()
+
+        file_id = f"file-stub-{len(self.files) + 1}"
+        self.files[file_id] = {"content": content, "purpose": purpose}
+        return self._file_object(file_id)
+
+    def create_batch(self, body: Dict) -> Dict:
+        """Batch 생성 (첫 조회 시 in_progress, 두 번째 조회에서 완료 처리)"""
+        batch_id = f"batch-stub-{len(self.batches) + 1}"
+        lines = self.files[body["input_file_id"]]["content"].decode("utf-8").splitlines()
+        self.batches[batch_id] = {
+            "id": batch_id,
+            "object": "batch",
+            "endpoint": body.get("endpoint"),
+            "input_file_id": body["input_file_id"],
+            "completion_window": body.get("completion_window", "24h"),
+            "status": "validating",
+            "created_at": int(time.time()),
+            "output_file_id": None,
+            "error_file_id": None,
+            "request_counts": {"total": len(lines), "completed": 0, "failed": 0},
+        }
+        return self.batches[batch_id]
+
+    def retrieve_batch(self, batch_id: str) -> Dict:
+        batch = self.batches[batch_id]
+        if batch["status"] == "validating":
+            batch["status"] = "in_progress"
+        elif batch["status"] == "in_progress":
+            self._complete_batch(batch)
+        return batch
+
+    def _complete_batch(self, batch: Dict):
+        lines = self.files[batch["input_file_id"]]["content"].decode("utf-8").splitlines()
+        output = []
+        for line in lines:
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            self.requests += 1
+            output.append(json.dumps({
+                "id": f"batch_req_{len(output) + 1}",
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 200, "body": self.make_completion(request["body"])},
+                "error": None,
+            }, ensure_ascii=False))
+
+        output_id = f"file-stub-{len(self.files) + 1}"
+        self.files[output_id] = {"content": "\n".join(output).encode("utf-8"), "purpose": "batch_output"}
+        batch["status"] = "completed"
+        batch["output_file_id"] = output_id
+        batch["request_counts"]["completed"] = len(output)
+
+    def _file_object(self, file_id: str) -> Dict:
+        return {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(self.files[file_id]["content"]),
+            "created_at": int(time.time()),
+            "filename": f"{file_id}.jsonl",
+            "purpose": self.files[file_id]["purpose"],
+            "status": "processed",
+        }
+
+    # 토큰 수 근사 (한글 위주 프롬프트 기준 약 2자/토큰, LLMClient._estimate_tokens와 같은 기준)
+    CHARS_PER_TOKEN = 2
+    # OpenAI 접두사 캐시 규칙: 1024토큰 이상부터 128토큰 단위로 적중
+    CACHE_MIN_TOKENS = 1024
+    CACHE_BLOCK_TOKENS = 128
+
+    def count_cached_tokens(self, prompt: str) -> int:
+        """이전 요청과 공유하는 접두사 중 캐시 적중으로 계산될 토큰 수"""
+        block_chars = self.CACHE_BLOCK_TOKENS * self.CHARS_PER_TOKEN
+        cached = 0
+        with self._lock:
+            for end in range(block_chars, len(prompt) + 1, block_chars):
+                digest = hashlib.sha1(prompt[:end].encode("utf-8")).digest()
+                if digest in self._seen_prefixes:
+                    cached = end // self.CHARS_PER_TOKEN
+                else:
+                    self._seen_prefixes.add(digest)
+        return cached if cached >= self.CACHE_MIN_TOKENS else 0
+
+    def make_completion(self, body: Dict) -> Dict:
+        """chat.completions 응답 생성"""
+        response = self.responder(body) if self.responder else self.response
+        content = json.dumps(response, ensure_ascii=False)
+        finish_reason = "stop"
+        kind = self.pick_malformed()
+        if kind == "truncated":
+            # max_tokens 초과로 잘린 응답
+            content = content[: int(len(content) * 0.6)]
+            finish_reason = "length"
+        elif kind == "prose":
+            content = f"다음은 의견입니다.\n```json\n{content}\n```\n참고 부탁드립니다."
+        elif kind == "string_severity":
+            response = dict(response)
+            response["severity_assessment"] = f"{response.get('severity_assessment', 5)}/10"
+            content = json.dumps(response, ensure_ascii=False)
+        prompt = "".join(m.get("content") or "" for m in body.get("messages", []))
+        prompt_tokens = max(len(prompt) // self.CHARS_PER_TOKEN, 1)
+        cached_tokens = self.count_cached_tokens(prompt) if self.prefix_cache else 0
+        completion_tokens = max(len(content) // self.CHARS_PER_TOKEN, 1)
+        return {
+            "id": f"chatcmpl-stub-{self.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": finish_reason,
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "prompt_tokens_details": {"cached_tokens": cached_tokens},
+            },
+        }
+
+
+if __name__ == "__main__":
+    server = StubOpenAIServer().start()
+    print(f"스텁 서버 실행 중: {server.base_url} (Ctrl-C 종료)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
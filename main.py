@@ -2,10 +2,17 @@
 건설 시뮬레이션 메인 실행 파일
 """
 
-import random
+import argparse
+import os
 import json
 from pathlib import Path
 from src.core.simulation_engine import ConstructionSimulation
+from src.core.monte_carlo import METHODS, run_monte_carlo
+from src.core.scenario_sweep import expand_scenarios, run_sweep
+from src.core.checkpoint import checkpoint_path
+from src.data.issue_cards import ISSUE_CARD_SOURCES, load_issue_cards, snapshot_path
+from src.utils.llm_client import get_response_cache, get_llm_client
+from src.utils.llm_batch import run_batch_mode
 
 
 def load_project_config():
@@ -41,7 +48,7 @@ def load_project_config():
     return project_info
 
 
-def run_bim_simulation():
+def run_bim_simulation(output_dir="results", backend="llm", seed=42, resume=False, checkpoint=True):
     """BIM 방식 시뮬레이션"""
     project_info = load_project_config()
 
@@ -49,8 +56,11 @@ def run_bim_simulation():
     print("BIM 방식 시뮬레이션")
     print("=" * 70)
 
-    sim = ConstructionSimulation(project_info, method="BIM")
-    result = sim.run_simulation(output_dir="results")
+    sim = ConstructionSimulation(
+        project_info, method="BIM", backend=backend, seed=seed,
+        checkpoint_path=checkpoint_path("BIM") if checkpoint else None,
+    )
+    result = sim.run_simulation(output_dir=output_dir, resume=resume)
 
     print("\n【시뮬레이션 결과 요약】")
     print(f"목표 공기: {result['시뮬레이션결과']['목표공기']}")
@@ -63,7 +73,7 @@ def run_bim_simulation():
     return result
 
 
-def run_traditional_simulation():
+def run_traditional_simulation(output_dir="results", backend="llm", seed=42, resume=False, checkpoint=True):
     """전통 방식 시뮬레이션"""
     project_info = load_project_config()
 
@@ -71,8 +81,11 @@ def run_traditional_simulation():
     print("전통 방식 시뮬레이션")
     print("=" * 70)
 
-    sim = ConstructionSimulation(project_info, method="TRADITIONAL")
-    result = sim.run_simulation(output_dir="results")
+    sim = ConstructionSimulation(
+        project_info, method="TRADITIONAL", backend=backend, seed=seed,
+        checkpoint_path=checkpoint_path("TRADITIONAL") if checkpoint else None,
+    )
+    result = sim.run_simulation(output_dir=output_dir, resume=resume)
 
     print("\n【시뮬레이션 결과 요약】")
     print(f"목표 공기: {result['시뮬레이션결과']['목표공기']}")
@@ -164,21 +177,280 @@ def compare_results(bim_result, trad_result):
     print(f"\n비교 리포트 저장 완료: {report_file}")
 
 
+def run_simulations(output_dir="results", backend="llm", seed=42, resume=False, checkpoint=True):
+    """
+    BIM → 전통 방식 순서로 시뮬레이션 실행 (두 방식 모두 같은 시드, 이슈별 난수 스트림도 같음)
+
+    checkpoint가 True면 공법별로 checkpoints/ 에 진행 상태를 주기적으로 저장하고,
+    resume이 True면 저장된 체크포인트부터 이어서 실행 (이미 끝난 공법은 다시 실행하지 않음)
+    """
+    # 1. BIM 시뮬레이션
+    bim_result = run_bim_simulation(output_dir, backend, seed, resume, checkpoint)
+
+    # 2. 전통 방식 시뮬레이션
+    trad_result = run_traditional_simulation(output_dir, backend, seed, resume, checkpoint)
+
+    return bim_result, trad_result
+
+
+def parse_args():
+    """명령행 인자"""
+    parser = argparse.ArgumentParser(description="BIM vs 전통 방식 건설 시뮬레이션")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["compare", "montecarlo", "sweep", "import-cards"],
+        default="compare",
+        help="compare: BIM/전통 방식 1회씩 실행 후 비교 (기본), montecarlo: 서로 다른 시드로 반복 실행해 분포 집계, "
+             "sweep: 여러 프로젝트 설정(위치 × 용적률 등)을 실행해 시나리오별 표로 집계, "
+             "import-cards: 엑셀 통합 문서의 이슈 카드를 검증해 스냅샷 생성",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["llm", "heuristic"],
+        default=None,
+        help="에이전트 의견 백엔드 (heuristic: LLM 없이 규칙 기반으로 빠르게 실행, API 키 불필요) "
+             "(기본: compare는 llm, montecarlo / sweep은 heuristic)",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="OpenAI Batch API로 에이전트 의견을 일괄 수집한 뒤 실행 (지연 무관한 대규모 실험용)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="LLM 응답을 스트리밍으로 받아 심각도가 도착하는 즉시 회의 진행 (LLM_STREAM=1과 같음)",
+    )
+    parser.add_argument(
+        "--multi-issue",
+        action="store_true",
+        help="하루의 신규 이슈를 에이전트별로 한 번에 묻는 묶음 요청 사용 (LLM_MULTI_ISSUE=1과 같음)",
+    )
+    parser.add_argument(
+        "--opinion-mode",
+        choices=["sequential", "delphi"],
+        default=None,
+        help="의견 수렴 방식 (delphi: 건축주/시공사가 동시에 답변하고 심각도 차이가 크면 조정, OPINION_MODE와 같음)",
+    )
+    parser.add_argument(
+        "--occurrence",
+        choices=["daily", "geometric"],
+        default=None,
+        help="이슈 발생 판정 방식 (geometric: 시작 시 이슈별 최초 발생일을 한 번에 추출, 분포는 daily와 같음, "
+             "OCCURRENCE_SAMPLER와 같음)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["day", "event"],
+        default=None,
+        help="진행 방식 (event: 이슈 발생 / 완료 / 착수 확인이 있는 날만 진행, 발생 판정은 geometric, "
+             "SIMULATION_ENGINE과 같음)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="난수 시드 (compare / sweep: 두 방식에 같은 시드 사용, montecarlo: 반복별 시드를 여기서 생성)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="checkpoints/ 의 체크포인트에서 이어서 실행 (같은 설정 / 시드일 때, 이미 끝난 공법은 저장된 결과 사용)",
+    )
+    parser.add_argument(
+        "--checkpoint-days",
+        type=int,
+        default=None,
+        help="체크포인트 저장 간격 (일, 0이면 일수 기준 저장 안 함, CHECKPOINT_DAYS와 같음, 기본 10)",
+    )
+    parser.add_argument(
+        "--cards",
+        choices=list(ISSUE_CARD_SOURCES),
+        default=None,
+        help="이슈 카드 원본 (excel: 연구 엑셀 통합 문서를 직접 읽음, pandas / openpyxl 필요, ISSUE_CARD_SOURCE와 같음)",
+    )
+    parser.add_argument(
+        "--workbook",
+        default=None,
+        help="이슈 카드 엑셀 통합 문서 경로 (ISSUE_CARD_WORKBOOK과 같음, 기본: 저장소 루트의 연구 엑셀 파일)",
+    )
+    parser.add_argument(
+        "--export-json",
+        action="store_true",
+        help="import-cards에서 검증한 카드를 src/data/*_issues_raw.json으로도 저장 (시뮬레이션에 쓰는 열만)",
+    )
+    parser.add_argument(
+        "--batch-poll-interval",
+        type=float,
+        default=30.0,
+        help="Batch 상태 확인 간격 (초)",
+    )
+
+    montecarlo = parser.add_argument_group("montecarlo / sweep 옵션")
+    montecarlo.add_argument("-n", "--replications", type=int, default=1000, help="공법별 반복 횟수 (montecarlo)")
+    montecarlo.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    montecarlo.add_argument("--methods", nargs="+", choices=list(METHODS), default=list(METHODS), help="실행할 공법")
+    montecarlo.add_argument("--confidence", type=float, default=0.95, help="평균 신뢰구간 수준 (montecarlo)")
+    montecarlo.add_argument("--keep-replications", action="store_true", help="리포트에 반복별 결과 포함 (montecarlo)")
+    montecarlo.add_argument("--no-save", action="store_true", help="리포트 파일을 저장하지 않음")
+
+    sweep = parser.add_argument_group("sweep 옵션 (지정하지 않은 설정은 project_config.json 값)")
+    sweep.add_argument(
+        "--grid",
+        action="append",
+        default=[],
+        metavar="KEY=V1,V2,...",
+        help="설정별 값 목록, 여러 번 지정하면 모든 조합 (예: --grid location=도심,외곽 --grid floor_area_ratio=40,60,80)",
+    )
+    sweep.add_argument(
+        "--scenarios",
+        default=None,
+        metavar="FILE",
+        help='시나리오 JSON 파일 (시나리오 목록, 또는 {"grid": {...}, "scenarios": [...]})',
+    )
+
+    args = parser.parse_args()
+    if args.backend is None:
+        args.backend = "heuristic" if args.command in ("montecarlo", "sweep") else "llm"
+    if args.command in ("montecarlo", "sweep") and args.batch:
+        parser.error(f"--batch는 {args.command}와 함께 사용할 수 없습니다.")
+    if (args.grid or args.scenarios) and args.command != "sweep":
+        parser.error("--grid / --scenarios는 sweep에서만 사용할 수 있습니다.")
+    for item in args.grid:
+        if "=" not in item:
+            parser.error(f"--grid 형식이 잘못되었습니다: {item} (KEY=V1,V2,...)")
+    if args.resume and (args.command in ("montecarlo", "sweep") or args.batch):
+        parser.error("--resume은 compare 실행(--batch 제외)에서만 사용할 수 있습니다.")
+    if args.export_json and args.command != "import-cards":
+        parser.error("--export-json은 import-cards에서만 사용할 수 있습니다.")
+    if args.cards:
+        os.environ["ISSUE_CARD_SOURCE"] = args.cards
+    if args.workbook:
+        os.environ["ISSUE_CARD_WORKBOOK"] = args.workbook
+    if args.checkpoint_days is not None:
+        os.environ["CHECKPOINT_DAYS"] = str(args.checkpoint_days)
+    if args.replications < 1:
+        parser.error("--replications는 1 이상이어야 합니다.")
+    if not 0 < args.confidence < 1:
+        parser.error("--confidence는 0과 1 사이여야 합니다.")
+    if args.batch and args.backend != "llm":
+        parser.error("--batch는 --backend llm에서만 사용할 수 있습니다.")
+    if args.stream and args.backend != "llm":
+        parser.error("--stream은 --backend llm에서만 사용할 수 있습니다.")
+    if args.stream:
+        os.environ["LLM_STREAM"] = "1"
+    if args.multi_issue and args.backend != "llm":
+        parser.error("--multi-issue는 --backend llm에서만 사용할 수 있습니다.")
+    if args.multi_issue:
+        os.environ["LLM_MULTI_ISSUE"] = "1"
+    if args.opinion_mode:
+        os.environ["OPINION_MODE"] = args.opinion_mode
+    if args.engine == "event" and args.occurrence == "daily":
+        parser.error("--engine event는 --occurrence geometric에서만 사용할 수 있습니다.")
+    if args.occurrence:
+        os.environ["OCCURRENCE_SAMPLER"] = args.occurrence
+    if args.engine:
+        os.environ["SIMULATION_ENGINE"] = args.engine
+    if args.command == "sweep":
+        try:
+            args.sweep_scenarios = load_sweep_scenarios(args)
+        except (OSError, ValueError) as e:
+            parser.error(f"시나리오 설정 오류: {e}")
+    return args
+
+
+def run_montecarlo(args):
+    """몬테카를로 반복 실행 (공법별 누적 지연 / 비용 증가 / 이슈 수 분포)"""
+    run_monte_carlo(
+        load_project_config(),
+        replications=args.replications,
+        methods=args.methods,
+        workers=args.workers,
+        seed=args.seed,
+        backend=args.backend,
+        confidence=args.confidence,
+        output_dir=None if args.no_save else "results",
+        keep_replications=args.keep_replications,
+    )
+
+
+def load_sweep_scenarios(args):
+    """--grid / --scenarios → 시나리오 목록 (값이 잘못되었으면 ValueError)"""
+    grid = {}
+    for item in args.grid:
+        key, values = item.split("=", 1)
+        grid[key.strip()] = [value.strip() for value in values.split(",") if value.strip()]
+
+    scenarios = None
+    if args.scenarios:
+        with open(args.scenarios, "r", encoding="utf-8") as f:
+            spec = json.load(f)
+        if isinstance(spec, dict):
+            grid.update(spec.get("grid", {}))
+            scenarios = spec.get("scenarios")
+        else:
+            scenarios = spec
+
+    return expand_scenarios(load_project_config(), grid=grid, scenarios=scenarios)
+
+
+def run_scenario_sweep(args):
+    """시나리오 스윕 (--grid / --scenarios 조합마다 BIM / 전통 방식 실행)"""
+    run_sweep(
+        args.sweep_scenarios,
+        methods=args.methods,
+        workers=args.workers,
+        seed=args.seed,
+        backend=args.backend,
+        output_dir=None if args.no_save else "results",
+    )
+
+
+def run_import_cards(args):
+    """엑셀 통합 문서의 이슈 카드 시트 검증 → 스냅샷 생성 (--export-json이면 JSON 원본도 갱신)"""
+    from src.data.excel_loader import export_raw_json, workbook_path
+
+    print(f"\n이슈 카드 통합 문서: {workbook_path()}")
+    for method in METHODS:
+        issues = load_issue_cards(method, source="excel")
+        print(f"  {method}: 카드 {len(issues)}개 → {snapshot_path(method, 'excel')}")
+    if args.export_json:
+        for method, path in export_raw_json().items():
+            print(f"  {method}: JSON 저장 → {path}")
+    print("\n--cards excel (또는 ISSUE_CARD_SOURCE=excel)로 실행하면 통합 문서의 카드를 사용합니다.")
+
+
 def main():
     """메인 함수"""
-    # 랜덤 시드 설정 (재현성)
-    random.seed(42)
+    args = parse_args()
+
+    if args.command == "import-cards":
+        run_import_cards(args)
+        return
+
+    if args.command == "montecarlo":
+        run_montecarlo(args)
+        return
+    if args.command == "sweep":
+        run_scenario_sweep(args)
+        return
 
     print("\n" + "=" * 70)
     print("건설 시뮬레이션 프로그램")
     print("BIM vs 전통 방식 비교 분석")
     print("=" * 70)
 
-    # 1. BIM 시뮬레이션
-    bim_result = run_bim_simulation()
+    if args.batch:
+        # 드라이 런으로 요청 수집 → Batch 제출 → 결과를 재사용하며 실제 실행
+        run_batch_mode(
+            lambda: run_simulations(output_dir=None, seed=args.seed, checkpoint=False),
+            get_llm_client(),
+            poll_interval=args.batch_poll_interval,
+        )
 
-    # 2. 전통 방식 시뮬레이션
-    trad_result = run_traditional_simulation()
+    # 1~2. BIM / 전통 방식 시뮬레이션
+    bim_result, trad_result = run_simulations(backend=args.backend, seed=args.seed, resume=args.resume)
 
     # 3. 비교 분석
     compare_results(bim_result, trad_result)
@@ -191,6 +463,15 @@ def main():
     print("  - logs/traditional_meetings_YYYYMMDD_HHMMSS.json (전통 회의 로그)")
     print("  - logs/traditional_issues_YYYYMMDD_HHMMSS.json (전통 이슈 목록)")
     print("  - results/comparison_report_YYYYMMDD_HHMMSS.json (비교 리포트)")
+    if args.backend == "llm":
+        print("  - results/llm_metrics_{BIM,TRADITIONAL}_YYYYMMDD_HHMMSS.json (LLM 호출 비용/지연 리포트)")
+
+    # LLM 응답 캐시 통계
+    cache = get_response_cache() if args.backend == "llm" else None
+    if cache is not None:
+        stats = cache.stats()
+        print(f"\nLLM 캐시: 적중 {stats['hits']}회 / 미적중 {stats['misses']}회 "
+              f"(적중률 {stats['hit_rate']*100:.1f}%, 저장 {stats['entries']}건)")
     print("=" * 70 + "\n")
 
 
@@ -5,5 +5,21 @@
 from .base_agent import BaseAgent
 from .owner_agent import OwnerAgent
 from .contractor_agent import ContractorAgent
+from .backends import (
+    OpinionBackend,
+    LLMOpinionBackend,
+    HeuristicOpinionBackend,
+    StreamedOpinion,
+    create_backend,
+)
 
-__all__ = ["BaseAgent", "OwnerAgent", "ContractorAgent"]
+__all__ = [
+    "BaseAgent",
+    "OwnerAgent",
+    "ContractorAgent",
+    "OpinionBackend",
+    "LLMOpinionBackend",
+    "HeuristicOpinionBackend",
+    "StreamedOpinion",
+    "create_backend",
+]
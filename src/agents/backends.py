@@ -0,0 +1,524 @@
+"""
+에이전트 의견 생성 백엔드
+
+- LLMOpinionBackend: GPT API로 의견 생성 (기존 동작, stream=True면 심각도만 먼저 받고 나머지는 백그라운드,
+  LLM_CASCADE_MODEL 설정 시 작은 모델에 먼저 묻고 검증 실패/경계 근처 심각도/S1 이슈만 큰 모델 사용)
+- HeuristicOpinionBackend: 이슈 카드(심각도, 지연/비용 범위, 가중치)와 KPI 값으로
+  의견을 규칙 기반으로 계산 (API 키 불필요, 결정적, 빠른 반복/대량 실험용)
+"""
+
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+from ..config.case_mapping import normalize_kpi_value
+from ..utils.json_parsing import coerce_severity, validate_response
+from ..utils.llm_metrics import LLMMetrics
+
+
+class OpinionBackend(ABC):
+    """에이전트 의견 생성 백엔드"""
+
+    name = ""
+
+    # LLM 호출 지표 기록기 (LLM을 쓰지 않는 백엔드는 None)
+    metrics = None
+
+    # 의견 생성이 네트워크 대기 위주인지 (True면 하루의 신규 이슈를 동시에 토론, 여러 스레드에서 호출됨)
+    blocking_io = False
+
+    # 하루의 신규 이슈를 에이전트별로 한 번에 묻는지 (True면 회의가 give_opinions 사용)
+    multi_issue = False
+
+    @abstractmethod
+    def give_opinion(self, agent, issue: Dict, context: Dict, other_opinions: Dict = None) -> Dict:
+        """에이전트(agent) 입장의 이슈 의견 생성"""
+        pass
+
+    def give_opinions(self, agent, issues: List[Dict], context: Dict, other_opinions: Dict = None) -> Dict[str, Dict]:
+        """여러 이슈 의견 → 이슈 ID별 의견 (기본: 이슈마다 give_opinion, other_opinions는 이슈 ID별)"""
+        other_opinions = other_opinions or {}
+        return {
+            issue["ID"]: self.give_opinion(agent, issue, context, other_opinions.get(issue["ID"]))
+            for issue in issues
+        }
+
+    def reconcile(self, agent, issue: Dict, context: Dict, own: Dict, others: Dict) -> Optional[Dict]:
+        """다른 에이전트 평가를 보고 심각도 재판단 (기본: 조정하지 않음)"""
+        return None
+
+    def flush(self):
+        """백그라운드에서 완성 중인 의견이 있으면 모두 끝날 때까지 대기 (결과 저장 전 호출)"""
+        pass
+
+
+class StreamedOpinion(dict):
+    """
+    스트리밍으로 먼저 돌려준 의견
+
+    처음에는 stream_early_fields(심각도 등)만 담고, 응답이 끝나면 같은 dict에 나머지 필드가 채워진다.
+    shared는 처음 돌려준 필드의 복사본으로, 다른 에이전트 프롬프트에는 이것만 넣는다
+    (응답 완료 시점과 무관하게 프롬프트가 같도록).
+    """
+
+    def __init__(self, fields: Dict):
+        super().__init__(fields)
+        self.shared = dict(fields)
+
+
+class LLMOpinionBackend(OpinionBackend):
+    """LLM 백엔드 - 에이전트 프롬프트로 GPT API 호출"""
+
+    name = "llm"
+    blocking_io = True
+
+    def __init__(
+        self, llm=None, metrics=None, stream: bool = False, multi_issue: bool = False, cascade_margin: float = 0.5
+    ):
+        """
+        Args:
+            llm: 사용할 LLMClient (None이면 처음 호출할 때 프로세스 공유 클라이언트 사용)
+            metrics: 호출 지표 기록기 (None이면 새로 생성)
+            stream: True면 스트리밍 호출로 stream_early_fields(심각도 등)가 도착하는 즉시 의견을 돌려주고
+                나머지 필드는 응답이 끝나면 같은 dict에 채움 (flush()로 완료 대기)
+            multi_issue: True면 하루의 신규 이슈가 여러 건일 때 에이전트별로 한 번에 묻고
+                빠졌거나 검증에 실패한 이슈만 이슈별로 다시 요청 (묶음 요청은 스트리밍하지 않음)
+            cascade_margin: 모델 캐스케이드 사용 시 심각도가 에이전트의 구간 경계에서 이 값 이내면 큰 모델로 다시 물음
+                (정수 점수 기준 경계는 b-0.5이므로 0.5면 경계 양쪽 점수 b-1, b가 해당)
+        """
+        self._llm = llm
+        self.metrics = metrics if metrics is not None else LLMMetrics()
+        self.stream = stream
+        self.multi_issue = multi_issue
+        self.cascade_margin = cascade_margin
+        self._pending = 0
+        self._pending_cond = threading.Condition()
+
+    @property
+    def llm(self):
+        """LLM 클라이언트 (처음 사용할 때 공유 클라이언트를 가져옴)"""
+        if self._llm is None:
+            from ..utils.llm_client import get_llm_client
+
+            self._llm = get_llm_client()
+        return self._llm
+
+    # JSON 수정 요청에 보낼 원문 최대 길이 (문자)
+    FIXUP_MAX_CHARS = 4000
+
+    def give_opinion(self, agent, issue: Dict, context: Dict, other_opinions: Dict = None) -> Dict:
+        tags = {
+            "agent": agent.name,
+            "issue_id": issue["ID"],
+            "day": context.get("current_day", 0),
+            "method": context.get("method", ""),
+        }
+        if other_opinions:
+            other_opinions = self._visible_opinions(other_opinions)
+        system_prompt = agent.get_system_prompt()
+        user_message = agent.build_user_message(issue, context, other_opinions)
+        request_id = agent.request_id(issue, context)
+        defaults = agent.fallback_opinion(issue, context)
+
+        escalate = self.initial_escalation([issue])
+        if self.stream:
+            return self._give_opinion_streaming(
+                agent, system_prompt, user_message, request_id, defaults, tags, escalate=escalate
+            )
+
+        response = self.llm.call_cascade(
+            system_prompt,
+            user_message,
+            check=lambda small: self.escalation_reason(agent, small, defaults),
+            escalate=escalate,
+            request_id=request_id,
+            metrics=self.metrics,
+            tags=tags,
+        )
+        return self.finalize_opinion(agent, response, defaults, tags)
+
+    @staticmethod
+    def _visible_opinions(other_opinions: Dict) -> Dict:
+        """다른 에이전트에게 보여줄 의견 (스트리밍 의견은 처음 받은 요약만)"""
+        return {
+            name: opinion.shared if isinstance(opinion, StreamedOpinion) else opinion
+            for name, opinion in other_opinions.items()
+        }
+
+    def give_opinions(self, agent, issues: List[Dict], context: Dict, other_opinions: Dict = None) -> Dict[str, Dict]:
+        """하루의 신규 이슈를 한 번에 묻고 이슈별로 검증 (누락/실패 이슈만 이슈별로 다시 요청)"""
+        if not self.multi_issue or len(issues) < 2:
+            return super().give_opinions(agent, issues, context, other_opinions)
+
+        other_opinions = {
+            issue_id: self._visible_opinions(opinions)
+            for issue_id, opinions in (other_opinions or {}).items() if opinions
+        }
+        issue_ids = [issue["ID"] for issue in issues]
+        tags = {
+            "agent": agent.name,
+            "issue_id": "+".join(issue_ids),
+            "day": context.get("current_day", 0),
+            "method": context.get("method", ""),
+            "issue_count": len(issues),
+        }
+
+        def check(small: Dict) -> Optional[str]:
+            # 묶음 전체를 다시 물음: 검증된 답이 하나도 없거나, 검증된 답 중 경계 근처 심각도가 있을 때
+            if "error" in small:
+                return self.escalation_reason(agent, small, {})
+            answers = self.split_multi_issue_response(small, issue_ids)
+            reasons = {
+                self.escalation_reason(agent, answers[issue["ID"]], agent.fallback_opinion(issue, context))
+                for issue in issues if issue["ID"] in answers
+            }
+            if not reasons - {"validation"}:
+                return "validation"
+            return "boundary" if "boundary" in reasons else None
+
+        response = self.llm.call_cascade(
+            agent.get_system_prompt(),
+            agent.build_multi_issue_message(issues, context, other_opinions or None),
+            check=check,
+            escalate=self.initial_escalation(issues),
+            request_id=f"{context.get('method', '')}:{context.get('current_day', 0)}:{'+'.join(issue_ids)}:{agent.name}",
+            metrics=self.metrics,
+            tags=tags,
+            max_tokens=self.llm.max_tokens * len(issues),
+        )
+
+        if response.get("error") == "batch_pending":
+            # Batch 드라이 런: 묶음 요청만 수집 (이슈별 재요청까지 수집하지 않음)
+            return {issue["ID"]: agent.fallback_opinion(issue, context) for issue in issues}
+
+        answers = self.split_multi_issue_response(response, issue_ids)
+        opinions = {}
+        for issue in issues:
+            answer = answers.get(issue["ID"])
+            if answer is None:
+                continue
+            opinion, _ = validate_response(answer, agent.response_schema, agent.fallback_opinion(issue, context))
+            if opinion is not None:
+                opinion.pop("issue_id", None)
+                opinions[issue["ID"]] = opinion
+
+        missing = [issue for issue in issues if issue["ID"] not in opinions]
+        if missing:
+            print(f"{agent.name}: 묶음 응답에서 {len(missing)}/{len(issues)}건 누락 또는 검증 실패 → 이슈별로 다시 요청")
+            for issue in missing:
+                opinions[issue["ID"]] = self.give_opinion(agent, issue, context, other_opinions.get(issue["ID"]))
+
+        return {issue_id: opinions[issue_id] for issue_id in issue_ids}
+
+    @staticmethod
+    def split_multi_issue_response(response: Dict, issue_ids: List[str]) -> Dict[str, Dict]:
+        """
+        묶음 응답 → 이슈 ID별 응답
+
+        {"opinions": [{"issue_id": ...}, ...]}가 기본 형식이고, {"opinions": {ID: {...}}}, {ID: {...}}도 허용.
+        issue_id가 모두 빠진 목록은 개수가 같을 때만 순서대로 대응시킨다.
+        """
+        if "error" in response:
+            return {}
+
+        items = response.get("opinions", response)
+        if isinstance(items, dict):
+            return {issue_id: items[issue_id] for issue_id in issue_ids if isinstance(items.get(issue_id), dict)}
+        if not isinstance(items, list):
+            return {}
+
+        items = [item for item in items if isinstance(item, dict)]
+        if items and not any("issue_id" in item for item in items) and len(items) == len(issue_ids):
+            return dict(zip(issue_ids, items))
+        return {str(item["issue_id"]): item for item in items if str(item.get("issue_id")) in issue_ids}
+
+    @staticmethod
+    def initial_escalation(issues: List[Dict]) -> Optional[str]:
+        """모델 캐스케이드에서 처음부터 큰 모델에 물을 사유 (카드 심각도 S1 이슈 포함 시 "S1")"""
+        return "S1" if any(issue.get("심각도") == "S1" for issue in issues) else None
+
+    def escalation_reason(self, agent, response: Dict, defaults: Dict) -> Optional[str]:
+        """작은 모델 응답을 큰 모델로 다시 물을 사유 ("error" / "validation" / "boundary", 없으면 None)"""
+        if "error" in response:
+            return "validation" if "raw_content" in response else "error"
+        opinion, _ = validate_response(response, agent.response_schema, defaults)
+        if opinion is None:
+            return "validation"
+        if self.near_boundary(agent, opinion["severity_assessment"]):
+            return "boundary"
+        return None
+
+    def near_boundary(self, agent, severity: float) -> bool:
+        """심각도가 에이전트의 의견 구간 경계 근처인지 (정수 점수 기준 경계 b-0.5에서 cascade_margin 이내)"""
+        return any(abs(severity - (boundary - 0.5)) <= self.cascade_margin for boundary in agent.severity_boundaries)
+
+    def finalize_opinion(self, agent, response: Dict, defaults: Dict, tags: Dict) -> Dict:
+        """LLM 응답 → 검증된 의견 (스키마 불일치 시 수정 요청, 그래도 안 되면 기본 의견)"""
+        if "error" in response and "raw_content" not in response:
+            return defaults
+
+        if "error" not in response:
+            opinion, _ = validate_response(response, agent.response_schema, defaults)
+            if opinion is not None:
+                return opinion
+            raw_content = json.dumps(response, ensure_ascii=False)
+        else:
+            raw_content = response["raw_content"]
+
+        # 마지막 수단: 원래 프롬프트 없이 응답 원문만 보내 스키마에 맞게 고쳐 달라고 요청
+        fixed = self.request_fixup(agent, raw_content, tags)
+        if fixed is not None:
+            opinion, _ = validate_response(fixed, agent.response_schema, defaults)
+            if opinion is not None:
+                return opinion
+
+        return defaults
+
+    def _give_opinion_streaming(
+        self, agent, system_prompt: str, user_message: str, request_id: str, defaults: Dict, tags: Dict,
+        escalate: Optional[str] = None, escalated: bool = False
+    ) -> Dict:
+        """
+        심각도 등 선행 필드만 받아 바로 반환, 나머지는 응답이 끝나면 같은 dict에 채움
+
+        모델 캐스케이드 사용 시 작은 모델 스트림에서 심각도를 얻지 못했거나 경계 근처면
+        큰 모델 스트림으로 다시 묻는다 (escalate가 있으면 처음부터 큰 모델).
+        """
+        model, stream_tags = None, tags
+        if self.llm.cascade_model is not None:
+            if escalate is None:
+                model, stream_tags = self.llm.cascade_model, {**tags, "cascade": "small"}
+            else:
+                stream_tags = {**tags, "cascade": "escalated" if escalated else "large", "escalation": escalate}
+
+        handle = self.llm.call_stream(
+            system_prompt,
+            user_message,
+            early_fields=agent.stream_early_fields,
+            request_id=request_id,
+            metrics=self.metrics,
+            tags=stream_tags,
+            model=model,
+        )
+        early = handle.early()
+        severity = coerce_severity(early.get("severity_assessment"))
+        missing = severity is None or any(field not in early for field in agent.stream_early_fields)
+
+        if model is not None and self.llm.batch_collector is None:
+            reason = "validation" if severity is None else "boundary" if self.near_boundary(agent, severity) else None
+            if reason is not None:
+                # 작은 모델 스트림은 버리되 지표 기록이 끝날 때까지 flush()가 기다리도록 등록
+                self._track(handle, lambda done_handle: None)
+                return self._give_opinion_streaming(
+                    agent, system_prompt, user_message, f"{request_id}:escalated", defaults, tags,
+                    escalate=reason, escalated=True,
+                )
+
+        if missing:
+            # 선행 필드를 스트림에서 얻지 못함 (잘린 응답 등) → 전체 응답으로 기존 처리
+            return self.finalize_opinion(agent, handle.result(), defaults, tags)
+
+        fields = {field: early[field] if isinstance(early[field], str) else str(early[field])
+                  for field in agent.stream_early_fields}
+        opinion = StreamedOpinion({**fields, "severity_assessment": severity})
+
+        def complete(done_handle):
+            full = defaults
+            try:
+                full = self.finalize_opinion(agent, done_handle.result(), defaults, tags)
+            finally:
+                with self._pending_cond:
+                    # 회의에서 이미 사용한 선행 필드 값은 유지
+                    opinion.update({**full, **opinion.shared})
+
+        self._track(handle, complete)
+        return opinion
+
+    def _track(self, handle, callback):
+        """응답이 끝나면 callback 실행 (flush()가 완료를 기다리도록 대기 건수에 포함)"""
+        def done(done_handle):
+            try:
+                callback(done_handle)
+            finally:
+                with self._pending_cond:
+                    self._pending -= 1
+                    self._pending_cond.notify_all()
+
+        with self._pending_cond:
+            self._pending += 1
+        handle.add_done_callback(done)
+
+    def flush(self):
+        with self._pending_cond:
+            self._pending_cond.wait_for(lambda: self._pending == 0)
+
+    # 심각도 조정 응답 스키마
+    RECONCILE_SCHEMA = {"severity_assessment": "severity", "reason": "text"}
+
+    def reconcile(self, agent, issue: Dict, context: Dict, own: Dict, others: Dict) -> Optional[Dict]:
+        """심각도만 다시 묻는 짧은 요청 (의견 요약만 보내고 한 문장 근거만 받음)"""
+        system_prompt = f"""당신은 {agent.role}({agent.name})입니다. 같은 이슈에 대한 다른 에이전트의 심각도 평가가 당신과 크게 다릅니다.
+상대 평가를 참고해 당신 입장의 최종 심각도를 다시 판단하세요.
+
+반드시 아래 JSON 형식으로만 답변:
+{{"severity_assessment": 1~10 사이 숫자, "reason": "한 문장 근거"}}
+"""
+        other_lines = "\n".join(
+            f"- {name}: {json.dumps(summary, ensure_ascii=False)}" for name, summary in others.items()
+        )
+        user_message = f"""【이슈】 {issue['ID']} {issue['이슈명']} (카드 심각도 {issue['심각도']}, 예상 지연 {issue['지연(주)_Min']}~{issue['지연(주)_Max']}주, 예상 비용 증가 {issue['비용증가(%)_Min']}~{issue['비용증가(%)_Max']}%)
+【내 평가】 {json.dumps(own, ensure_ascii=False)}
+【다른 에이전트 평가】
+{other_lines}
+"""
+        tags = {
+            "agent": agent.name,
+            "issue_id": issue["ID"],
+            "day": context.get("current_day", 0),
+            "method": context.get("method", ""),
+            "purpose": "reconcile",
+        }
+        response = self.llm.call_with_retry(
+            system_prompt,
+            user_message,
+            request_id=f"{agent.request_id(issue, context)}:reconcile",
+            metrics=self.metrics,
+            tags=tags,
+        )
+        if "error" in response:
+            return None
+        result, _ = validate_response(response, self.RECONCILE_SCHEMA, {"reason": ""})
+        return result
+
+    def request_fixup(self, agent, raw_content: str, tags: Dict) -> Optional[Dict]:
+        """스키마에 맞지 않는 응답을 JSON으로 고쳐 달라는 짧은 요청 (실패 시 None)"""
+        fields = "\n".join(
+            f"- {field}: {'1~10 사이 숫자 (필수)' if kind == 'severity' else '문자열'}"
+            for field, kind in agent.response_schema.items()
+        )
+        system_prompt = f"""다음은 {agent.name} 에이전트의 응답입니다. 잘렸거나 형식이 잘못되었습니다.
+내용은 그대로 유지하고 아래 필드를 가진 JSON 객체 하나로만 다시 출력하세요. 알 수 없는 값은 짧게 추정하세요.
+
+{fields}
+"""
+        response = self.llm.call_with_retry(
+            system_prompt,
+            (raw_content or "")[: self.FIXUP_MAX_CHARS],
+            retries=0,
+            metrics=self.metrics,
+            tags={**tags, "purpose": "fixup"},
+        )
+        return None if "error" in response else response
+
+
+class HeuristicOpinionBackend(OpinionBackend):
+    """
+    규칙 기반 백엔드 (LLM 호출 없음)
+
+    심각도 점수(1~10) = 카드 심각도 기본점수
+                      + 지연/비용 영향 (에이전트별 관점 가중)
+                      + KPI 위험도 조정
+                      + 진행 중 이슈 부담
+    나머지 의견 항목은 에이전트가 점수와 현황으로 채운다 (heuristic_opinion).
+    """
+
+    name = "heuristic"
+
+    # 카드 심각도별 기본 점수
+    SEVERITY_BASE = {"S1": 8.0, "S2": 5.5, "S3": 3.0}
+
+    # 영향 정규화 기준 (이 값 이상이면 최대 영향)
+    DELAY_SCALE_WEEKS = 4.0
+    COST_SCALE_PCT = 2.0
+
+    # 진행 중 이슈 1건당 가산점 (최대 5건까지)
+    ACTIVE_ISSUE_PENALTY = 0.2
+
+    def give_opinion(self, agent, issue: Dict, context: Dict, other_opinions: Dict = None) -> Dict:
+        severity = self.assess_severity(agent, issue, context)
+        return agent.heuristic_opinion(issue, context, severity)
+
+    def reconcile(self, agent, issue: Dict, context: Dict, own: Dict, others: Dict) -> Optional[Dict]:
+        """다른 에이전트 평균 쪽으로 차이의 절반만큼 이동"""
+        own_severity = own.get("severity_assessment", 5)
+        other_mean = sum(o.get("severity_assessment", 5) for o in others.values()) / len(others)
+        severity = int(round(max(1.0, min(10.0, own_severity + (other_mean - own_severity) / 2))))
+        return {"severity_assessment": severity, "reason": f"다른 에이전트 평가({other_mean:.1f}) 쪽으로 조정"}
+
+    def assess_severity(self, agent, issue: Dict, context: Dict) -> int:
+        """에이전트 관점의 심각도 점수 (1~10 정수)"""
+        score = self.SEVERITY_BASE.get(issue.get("심각도"), self.SEVERITY_BASE["S2"])
+
+        # 지연/비용 영향 (범위 중앙값 기준, 0~1)
+        delay_mid = (issue["지연(주)_Min"] + issue["지연(주)_Max"]) / 2
+        cost_mid = (issue["비용증가(%)_Min"] + issue["비용증가(%)_Max"]) / 2
+        delay_score = min(delay_mid / self.DELAY_SCALE_WEEKS, 1.0)
+        cost_score = min(cost_mid / self.COST_SCALE_PCT, 1.0)
+
+        focus = agent.heuristic_focus
+        impact = focus["delay"] * delay_score + focus["cost"] * cost_score
+        score += (impact - 0.3) * 3
+
+        # KPI 위험도 (0~1, 0.5 기준 ±1점)
+        score += (self.kpi_risk(issue, context) - 0.5) * 2
+
+        # 진행 중 이슈가 많을수록 자원 경쟁으로 심각도 증가
+        active_count = len(context.get("issue_status", {}).get("진행중", []))
+        score += min(active_count, 5) * self.ACTIVE_ISSUE_PENALTY
+
+        return int(round(max(1.0, min(10.0, score))))
+
+    @staticmethod
+    def kpi_risk(issue: Dict, context: Dict) -> float:
+        """이슈 가중치로 평균한 KPI 위험도 (발생 확률 계산과 같은 정규화)"""
+        kpi_values = context.get("kpi_values", {})
+        weights = issue.get("가중치", {})
+        method = context.get("method", "BIM")
+
+        risk_scores = []
+        for kpi_name, kpi_value in kpi_values.items():
+            if kpi_name in weights and weights[kpi_name] > 0:
+                normalized = normalize_kpi_value(kpi_name, kpi_value, method)
+                risk_scores.append(normalized * weights[kpi_name])
+
+        if not risk_scores:
+            return 0.5
+        return sum(risk_scores) / sum(weights.values())
+
+
+BACKENDS = {
+    LLMOpinionBackend.name: LLMOpinionBackend,
+    HeuristicOpinionBackend.name: HeuristicOpinionBackend,
+}
+
+
+def create_backend(
+    name: str = "llm", llm=None, metrics=None, stream: Optional[bool] = None, multi_issue: Optional[bool] = None,
+    cascade_margin: Optional[float] = None
+) -> OpinionBackend:
+    """
+    이름으로 의견 백엔드 생성
+
+    Args:
+        name: "llm" 또는 "heuristic"
+        llm: LLM 백엔드가 사용할 LLMClient (heuristic이면 무시)
+        metrics: LLM 백엔드의 호출 지표 기록기 (heuristic이면 무시)
+        stream: LLM 스트리밍 여부 (None이면 LLM_STREAM 환경 변수, heuristic이면 무시)
+        multi_issue: 하루 신규 이슈 묶음 요청 여부 (None이면 LLM_MULTI_ISSUE 환경 변수, heuristic이면 무시)
+        cascade_margin: 모델 캐스케이드 경계 근처 기준 (None이면 LLM_CASCADE_MARGIN 환경 변수, heuristic이면 무시)
+    """
+    if name == LLMOpinionBackend.name:
+        if stream is None:
+            stream = os.getenv("LLM_STREAM", "0") == "1"
+        if multi_issue is None:
+            multi_issue = os.getenv("LLM_MULTI_ISSUE", "0") == "1"
+        if cascade_margin is None:
+            cascade_margin = float(os.getenv("LLM_CASCADE_MARGIN", "0.5"))
+        return LLMOpinionBackend(
+            llm=llm, metrics=metrics, stream=stream, multi_issue=multi_issue, cascade_margin=cascade_margin
+        )
+    if name == HeuristicOpinionBackend.name:
+        return HeuristicOpinionBackend()
+    raise ValueError(f"Invalid backend: {name}. Must be one of {sorted(BACKENDS)}")
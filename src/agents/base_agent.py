@@ -2,20 +2,54 @@
 에이전트 베이스 클래스
 """
 
+import json
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, List, Optional
 
 
 class BaseAgent(ABC):
     """에이전트 기본 클래스"""
 
-    def __init__(self, name: str, role: str):
+    # 규칙 기반 백엔드의 관점 가중치 (지연/비용 영향 반영 비율)
+    heuristic_focus = {"delay": 0.5, "cost": 0.5}
+
+    # LLM 응답 스키마 (필드 → "severity": 1~10 숫자, 필수 / "text": 문자열, 없으면 기본 의견 값)
+    response_schema = {"severity_assessment": "severity"}
+
+    # 스트리밍 시 먼저 받아 회의를 진행할 필드 (나머지 의견 문장은 백그라운드에서 받아 로그에 채움)
+    stream_early_fields = ("severity_assessment",)
+
+    # 의견 구간이 바뀌는 심각도 (이 값 이상이면 윗 구간, 모델 캐스케이드가 경계 근처 응답을 큰 모델로 다시 물을 때 사용)
+    severity_boundaries = (7,)
+
+    def __init__(self, name: str, role: str, backend=None):
+        """
+        Args:
+            name: 에이전트 이름
+            role: 역할
+            backend: 의견 생성 백엔드 (None이면 LLM 백엔드 + 프로세스 공유 클라이언트)
+        """
         self.name = name
         self.role = role
+        self._backend = backend
+
+    @property
+    def backend(self):
+        """의견 생성 백엔드 (처음 사용할 때 LLM 백엔드를 생성)"""
+        if self._backend is None:
+            from .backends import LLMOpinionBackend
+
+            self._backend = LLMOpinionBackend()
+        return self._backend
 
     @abstractmethod
-    def get_system_prompt(self, context: Dict[str, Any]) -> str:
-        """시스템 프롬프트 생성"""
+    def get_system_prompt(self) -> str:
+        """
+        시스템 프롬프트 (에이전트·공법별 고정 문자열)
+
+        회의마다 바뀌는 값(일자, 진행률, 누적 지연/비용, 이슈 현황, KPI)은 build_user_message에 넣어
+        모든 호출이 같은 접두사를 공유하게 한다 (OpenAI 프롬프트 접두사 캐시 적중).
+        """
         pass
 
     @abstractmethod
@@ -23,9 +57,103 @@ class BaseAgent(ABC):
         """이슈 보고"""
         pass
 
-    @abstractmethod
     def give_opinion(self, issue: Dict, context: Dict, other_opinions: Dict = None) -> Dict:
-        """이슈에 대한 의견"""
+        """이슈에 대한 의견 (백엔드에 위임)"""
+        return self.backend.give_opinion(self, issue, context, other_opinions)
+
+    def reconcile(self, issue: Dict, context: Dict, own: Dict, others: Dict) -> Optional[Dict]:
+        """
+        심각도 조정 (병렬 델파이 모드에서 다른 에이전트와 평가가 크게 다를 때, 백엔드에 위임)
+
+        Args:
+            own: 내 의견 요약 (stream_early_fields 항목)
+            others: 에이전트 이름 → 다른 에이전트 의견 요약
+
+        Returns:
+            {"severity_assessment", "reason"} 또는 None (조정하지 않음)
+        """
+        return self.backend.reconcile(self, issue, context, own, others)
+
+    def give_opinions(self, issues: List[Dict], context: Dict, other_opinions: Dict = None) -> Dict[str, Dict]:
+        """
+        여러 신규 이슈에 대한 의견을 한 번에 (백엔드에 위임)
+
+        Args:
+            other_opinions: 이슈 ID → {에이전트 이름: 의견}
+
+        Returns:
+            이슈 ID → 의견
+        """
+        return self.backend.give_opinions(self, issues, context, other_opinions)
+
+    @abstractmethod
+    def _situation_section(self, context: Dict) -> str:
+        """의견 요청 메시지의 프로젝트 상황 부분 (진행률, 누적 현황, 이슈 수, 지표)"""
+        pass
+
+    @abstractmethod
+    def _issue_section(self, issue: Dict) -> str:
+        """의견 요청 메시지의 신규 이슈 항목"""
+        pass
+
+    @abstractmethod
+    def _details_section(self, context: Dict) -> str:
+        """의견 요청 메시지의 진행 중 / 대기 중 이슈 상세"""
+        pass
+
+    def build_user_message(self, issue: Dict, context: Dict, other_opinions: Dict = None) -> str:
+        """의견 요청 메시지 생성 (LLM 백엔드용)"""
+        return f"""
+{self._situation_section(context)}
+
+【신규 이슈 정보】
+{self._issue_section(issue)}
+
+{self._details_section(context)}
+
+【다른 에이전트 의견】
+{json.dumps(other_opinions, ensure_ascii=False, indent=2) if other_opinions else "아직 수집 전"}
+
+반드시 JSON 형식으로만 답변하세요.
+"""
+
+    def build_multi_issue_message(self, issues: List[Dict], context: Dict, other_opinions: Dict = None) -> str:
+        """
+        여러 신규 이슈를 한 번에 묻는 메시지 (시스템 프롬프트는 그대로 두고 답변 형식만 목록으로 바꿈)
+
+        Args:
+            other_opinions: 이슈 ID → {에이전트 이름: 의견}
+        """
+        issue_blocks = "\n\n".join(
+            f"[{index}] {issue['ID']}\n{self._issue_section(issue)}" for index, issue in enumerate(issues, 1)
+        )
+        ids = ", ".join(issue["ID"] for issue in issues)
+
+        return f"""
+{self._situation_section(context)}
+
+【신규 이슈 정보 - {len(issues)}건】
+{issue_blocks}
+
+{self._details_section(context)}
+
+【다른 에이전트 의견 (이슈 ID별)】
+{json.dumps(other_opinions, ensure_ascii=False, indent=2) if other_opinions else "아직 수집 전"}
+
+【답변 형식 - 여러 이슈】
+이번 회의의 신규 이슈는 {len(issues)}건({ids})입니다. 이슈마다 출력 형식의 JSON 객체에 "issue_id"를 추가하고,
+{{"opinions": [{{"issue_id": "이슈 ID", "severity_assessment": ..., ...}}, ...]}} 형태로 모든 이슈에 빠짐없이 답변하세요.
+각 이슈는 독립적으로 평가하세요. 반드시 JSON 형식으로만 답변하세요.
+"""
+
+    @abstractmethod
+    def fallback_opinion(self, issue: Dict, context: Dict) -> Dict:
+        """LLM 호출 실패 시 기본 의견"""
+        pass
+
+    @abstractmethod
+    def heuristic_opinion(self, issue: Dict, context: Dict, severity: int) -> Dict:
+        """규칙 기반 백엔드가 계산한 심각도로 의견 항목 구성"""
         pass
 
     @abstractmethod
@@ -33,6 +161,10 @@ class BaseAgent(ABC):
         """해결 방안 제안"""
         pass
 
+    def request_id(self, issue: Dict, context: Dict) -> str:
+        """시뮬레이션 내 요청 위치 식별자 (공법:일자:이슈ID:에이전트)"""
+        return f"{context.get('method', '')}:{context.get('current_day', 0)}:{issue['ID']}:{self.name}"
+
     def _format_context(self, context: Dict) -> str:
         """컨텍스트를 문자열로 포맷팅"""
         lines = []
@@ -3,36 +3,38 @@
 """
 
 from .base_agent import BaseAgent
-from typing import Dict, Any
+from typing import Dict
 import json
 
 
 class OwnerAgent(BaseAgent):
-    def __init__(self):
-        super().__init__(name="건축주", role="발주자")
-
-    def get_system_prompt(self, context: Dict[str, Any]) -> str:
-        project_summary = context.get("project_summary", {})
-        cumulative = context.get("cumulative", {})
-        issue_status = context.get('issue_status', {})
-
-        return f"""당신은 건설 프로젝트의 건축주(발주자)입니다.
-
-【현재 프로젝트 상황】
-- 총 공사비: {project_summary.get('총공사비', 'N/A')}
-- 목표 공기: {project_summary.get('목표공기', 'N/A')}
-- 현재 진행률: {context.get('progress_rate', 0) * 100:.1f}%
-- 경과일: Day {context.get('current_day', 0)}
-
-【누적 현황】
-- 누적 지연: {cumulative.get('total_delay_days', 0):.1f}일
-- 누적 비용 초과: {cumulative.get('total_cost_overrun', 0):.2f}%
-- 일일 금융 비용: {context.get('daily_finance_cost', 'N/A')}
-
-【진행 중인 이슈 현황】
-- 해결 완료: {len(issue_status.get('해결완료', []))}개
-- 진행 중: {len(issue_status.get('진행중', []))}개
-- 대기 중: {len(issue_status.get('대기중', []))}개
+    # 건축주는 비용 영향을 더 크게 봄
+    heuristic_focus = {"delay": 0.4, "cost": 0.6}
+
+    response_schema = {
+        "severity_assessment": "severity",
+        "concern_level": "text",
+        "priority": "text",
+        "opinion": "text",
+        "budget_tolerance": "text",
+        "relationship_with_active_issues": "text",
+        "resource_conflict": "text",
+        "recommended_timing": "text",
+    }
+
+    # 스트리밍 시 먼저 받아 회의를 진행할 필드 (시공사 프롬프트에는 이 요약만 공유)
+    stream_early_fields = ("severity_assessment", "concern_level", "priority", "recommended_timing")
+
+    # 우려 수준 낮음/보통/높음 경계 (heuristic_opinion과 같은 기준)
+    severity_boundaries = (4, 7)
+
+    def __init__(self, backend=None):
+        super().__init__(name="건축주", role="발주자", backend=backend)
+
+    def get_system_prompt(self) -> str:
+        # 회의마다 바뀌는 값은 넣지 않음 (프롬프트 접두사 캐시용 고정 프롬프트)
+        return """당신은 건설 프로젝트의 건축주(발주자)입니다.
+매 회의마다 사용자 메시지로 현재 프로젝트 상황(진행률, 경과일, 누적 지연/비용, 이슈 현황)과 신규 이슈 정보가 주어집니다.
 
 【건축주의 주요 관심사】
 1. 전체 프로젝트 일정 준수 (지연 시 금융 비용 누적)
@@ -49,81 +51,125 @@ class OwnerAgent(BaseAgent):
 5. 전문가(시공사, 설계사) 의견 존중하되 최종 결정은 사업성 기반
 
 【반드시 고려해야 할 사항】
-- 현재 진행 중인 {len(issue_status.get('진행중', []))}개 이슈와의 자원 경쟁
-- 대기 중인 {len(issue_status.get('대기중', []))}개 이슈의 착수 시점
+- 현재 진행 중인 이슈들과의 자원 경쟁
+- 대기 중인 이슈들의 착수 시점
 - 누적된 지연/비용이 신규 이슈 판단에 미치는 영향
 - 여러 이슈가 동일 공간/자원을 필요로 할 경우 우선순위
 
+【질문】
+건축주로서 다음을 고려하여 신규 이슈에 대한 의견을 주세요:
+
+1. 이 신규 이슈가 현재 진행 중인 이슈들과 어떻게 상호작용하는가?
+2. 자원(인력, 장비, 예산)이 겹치는가? 우선순위는?
+3. 즉시 착수해야 하는가, 아니면 다른 이슈 해결 후 착수해야 하는가?
+4. 누적 지연/비용을 고려할 때 이 이슈의 심각도는?
+5. 다른 에이전트 의견을 고려한 최종 판단은?
+
 【출력 형식】
 반드시 아래 JSON 형식으로만 답변:
-{{
+{
+  "severity_assessment": 1~10 사이 숫자,
   "concern_level": "높음/보통/낮음",
   "priority": "비용 최소화/일정 준수/품질 유지/안전 확보",
-  "opinion": "건축주 입장에서의 구체적 의견 (진행중인 다른 이슈들과의 관계, 자원 배분, 우선순위 등을 반드시 언급)",
-  "severity_assessment": 1~10 사이 숫자,
+  "recommended_timing": "즉시착수/대기/조건부착수",
   "budget_tolerance": "추가 비용 허용 한도 (예: 0.5%)",
-  "relationship_with_active_issues": "진행중인 이슈들과의 관계 분석",
   "resource_conflict": "자원 경쟁 여부 (있음/없음)",
-  "recommended_timing": "즉시착수/대기/조건부착수"
-}}
+  "relationship_with_active_issues": "진행중인 이슈들과의 관계 분석",
+  "opinion": "건축주 입장에서의 구체적 의견 (진행중인 다른 이슈들과의 관계, 자원 배분, 우선순위 등을 반드시 언급)"
+}
+(필드 순서를 지켜 severity_assessment부터 출력)
 """
 
     def report_issue(self, issue: Dict, context: Dict) -> str:
         return ""
 
-    def give_opinion(self, issue: Dict, context: Dict, other_opinions: Dict = None) -> Dict:
-        from ..utils.llm_client import LLMClient
-
-        llm = LLMClient()
-        system_prompt = self.get_system_prompt(context)
+    def _situation_section(self, context: Dict) -> str:
+        project_summary = context.get("project_summary", {})
+        cumulative = context.get("cumulative", {})
         issue_status = context.get('issue_status', {})
 
-        user_message = f"""
-【신규 이슈 정보】
-- ID: {issue['ID']}
+        return f"""【현재 프로젝트 상황】
+- 총 공사비: {project_summary.get('총공사비', 'N/A')}
+- 목표 공기: {project_summary.get('목표공기', 'N/A')}
+- 현재 진행률: {context.get('progress_rate', 0) * 100:.1f}%
+- 경과일: Day {context.get('current_day', 0)}
+
+【누적 현황】
+- 누적 지연: {cumulative.get('total_delay_days', 0):.1f}일
+- 누적 비용 초과: {cumulative.get('total_cost_overrun', 0):.2f}%
+- 일일 금융 비용: {context.get('daily_finance_cost', 'N/A')}
+
+【진행 중인 이슈 현황】
+- 해결 완료: {len(issue_status.get('해결완료', []))}개
+- 진행 중: {len(issue_status.get('진행중', []))}개
+- 대기 중: {len(issue_status.get('대기중', []))}개"""
+
+    def _issue_section(self, issue: Dict) -> str:
+        return f"""- ID: {issue['ID']}
 - 이슈명: {issue['이슈명']}
 - 카테고리: {issue['카테고리']}
 - 심각도: {issue['심각도']}
 - 예상 지연: {issue['지연(주)_Min']} ~ {issue['지연(주)_Max']}주
 - 예상 비용 증가: {issue['비용증가(%)_Min']} ~ {issue['비용증가(%)_Max']}%
-- 상세 설명: {issue.get('설명', '')}
+- 상세 설명: {issue.get('설명', '')}"""
 
-【현재 진행 중인 이슈 상세】
+    def _details_section(self, context: Dict) -> str:
+        issue_status = context.get('issue_status', {})
+
+        return f"""【현재 진행 중인 이슈 상세】
 {json.dumps(issue_status.get('진행중', []), ensure_ascii=False, indent=2)}
 
 【대기 중인 이슈】
-{json.dumps(issue_status.get('대기중', []), ensure_ascii=False, indent=2)}
-
-【다른 에이전트 의견】
-{json.dumps(other_opinions, ensure_ascii=False, indent=2) if other_opinions else "아직 수집 전"}
-
-【질문】
-건축주로서 다음을 고려하여 의견을 주세요:
+{json.dumps(issue_status.get('대기중', []), ensure_ascii=False, indent=2)}"""
 
-1. 이 신규 이슈가 현재 진행 중인 {len(issue_status.get('진행중', []))}개 이슈와 어떻게 상호작용하는가?
-2. 자원(인력, 장비, 예산)이 겹치는가? 우선순위는?
-3. 즉시 착수해야 하는가, 아니면 다른 이슈 해결 후 착수해야 하는가?
-4. 누적 지연/비용을 고려할 때 이 이슈의 심각도는?
-5. 다른 에이전트 의견을 고려한 최종 판단은?
+    def fallback_opinion(self, issue: Dict, context: Dict) -> Dict:
+        issue_status = context.get('issue_status', {})
+        return {
+            "concern_level": "보통",
+            "priority": "일정 준수",
+            "opinion": f"{issue['이슈명']} 검토 필요 (진행중 {len(issue_status.get('진행중', []))}개 이슈 고려)",
+            "severity_assessment": 5,
+            "budget_tolerance": "0.5%",
+            "relationship_with_active_issues": "분석 필요",
+            "resource_conflict": "확인 필요",
+            "recommended_timing": "조건부착수"
+        }
 
-반드시 JSON 형식으로만 답변하세요.
-"""
+    def heuristic_opinion(self, issue: Dict, context: Dict, severity: int) -> Dict:
+        active_count = len(context.get('issue_status', {}).get('진행중', []))
+
+        if severity >= 7:
+            concern_level, timing = "높음", "즉시착수"
+        elif severity >= 4:
+            concern_level, timing = "보통", "조건부착수"
+        else:
+            concern_level, timing = "낮음", "대기"
+
+        # 비용 영향이 크면 비용, 지연이 길면 일정, 설계/감리/준공은 품질 우선
+        if issue['비용증가(%)_Max'] >= 1.5:
+            priority = "비용 최소화"
+        elif issue['지연(주)_Max'] >= 3:
+            priority = "일정 준수"
+        elif issue['카테고리'] in ("설계", "감리", "준공"):
+            priority = "품질 유지"
+        else:
+            priority = "일정 준수"
+
+        # 심각할수록 최대 비용까지 허용
+        tolerance = issue['비용증가(%)_Max'] if severity >= 7 else issue['비용증가(%)_Min']
 
-        response = llm.call(system_prompt, user_message, response_format="json")
-
-        if "error" in response:
-            return {
-                "concern_level": "보통",
-                "priority": "일정 준수",
-                "opinion": f"{issue['이슈명']} 검토 필요 (진행중 {len(issue_status.get('진행중', []))}개 이슈 고려)",
-                "severity_assessment": 5,
-                "budget_tolerance": "0.5%",
-                "relationship_with_active_issues": "분석 필요",
-                "resource_conflict": "확인 필요",
-                "recommended_timing": "조건부착수"
-            }
-
-        return response
+        return {
+            "concern_level": concern_level,
+            "priority": priority,
+            "opinion": f"{issue['이슈명']}: 심각도 {issue['심각도']}, 예상 지연 {issue['지연(주)_Min']}~{issue['지연(주)_Max']}주, "
+                       f"비용 {issue['비용증가(%)_Min']}~{issue['비용증가(%)_Max']}% 기준 {timing} 권고 "
+                       f"(진행중 {active_count}개 이슈 고려)",
+            "severity_assessment": severity,
+            "budget_tolerance": f"{tolerance:.1f}%",
+            "relationship_with_active_issues": f"진행중 {active_count}개 이슈와 병행" if active_count else "진행중 이슈 없음",
+            "resource_conflict": "있음" if active_count >= 2 else "없음",
+            "recommended_timing": timing
+        }
 
     def propose_solution(self, issue: Dict, severity: Dict, context: Dict) -> Dict:
         return {}
@@ -5,7 +5,7 @@
 
 import math
 from dataclasses import dataclass, field
-from typing import Dict, Literal
+from typing import Dict, List, Literal, Optional
 
 
 @dataclass
@@ -45,6 +45,11 @@ class ProjectContext:
     supervisor_context: Dict = field(default_factory=dict)
     financier_context: Dict = field(default_factory=dict)
 
+    # ===== 이슈 발생 확률표 (issue_probabilities에서 계산, KPI가 바뀌면 다시 계산) =====
+    _probability_table: Optional[Dict[str, float]] = field(default=None, init=False, repr=False, compare=False)
+    _probability_issues: Optional[List[Dict]] = field(default=None, init=False, repr=False, compare=False)
+    _probability_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """초기화 후 자동 계산"""
         self._calculate_derived_values()
@@ -130,6 +135,33 @@ class ProjectContext:
         """현재 진행률 계산"""
         return current_day / self.target_days if self.target_days > 0 else 0
 
+    def issue_probabilities(self, issues: List[Dict]) -> Dict[str, float]:
+        """
+        이슈 ID → 일일 발생 확률 (공법 / 케이스 / KPI 값으로 한 번 계산해 두고 재사용)
+
+        공법 / 케이스 / KPI 값(set_kpi_values, 또는 직접 고친 경우)이나 이슈 목록이 바뀌면 다시 계산한다.
+        """
+        key = (self.method, self.case, tuple(self.kpi_values.items()), len(issues))
+        if (self._probability_table is None or self._probability_issues is not issues
+                or self._probability_key != key):
+            from ..core.probability_calculator import probability_table
+
+            self._probability_table = probability_table(issues, self.kpi_values, self.method, self.case)
+            self._probability_issues = issues
+            self._probability_key = key
+        return self._probability_table
+
+    def set_kpi_values(self, kpi_values: Dict[str, float]):
+        """KPI 값 변경 (확률표 무효화)"""
+        self.kpi_values = dict(kpi_values)
+        self.invalidate_probability_table()
+
+    def invalidate_probability_table(self):
+        """확률표 버리기 (다음 issue_probabilities 호출 때 다시 계산)"""
+        self._probability_table = None
+        self._probability_issues = None
+        self._probability_key = None
+
     def get_remaining_days(self, current_day: int) -> int:
         """남은 일수"""
         return max(0, self.target_days - current_day)
@@ -2,24 +2,47 @@
 에이전트 회의 시스템 - 이슈 현황 통합
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from ..agents.owner_agent import OwnerAgent
 from ..agents.contractor_agent import ContractorAgent
+from ..agents.backends import StreamedOpinion
 from ..config.case_mapping import normalize_kpi_value
-import random
+
+
+# 의견 수렴 방식
+OPINION_MODES = ("sequential", "delphi")
 
 
 class AgentMeeting:
-    def __init__(self, date: int, project_context: Dict, new_issues: List[Dict], active_issues: List, method: str):
+    def __init__(self, date: int, project_context: Dict, new_issues: List[Dict], active_issues: List, method: str,
+                 backend=None, executor=None, opinion_mode: str = "sequential",
+                 opinion_executor=None, delphi_threshold: Optional[float] = 2.0, multi_issue: bool = False):
+        """
+        Args:
+            backend: 에이전트 의견 백엔드 (None이면 LLM 백엔드)
+            executor: 신규 이슈 동시 토론용 Executor (None이면 순서대로 토론)
+            opinion_mode: "sequential" (건축주 의견을 본 뒤 시공사 답변) 또는
+                "delphi" (서로의 의견 없이 동시에 답변 → 심각도 차이가 크면 조정 라운드)
+            opinion_executor: 델파이 모드에서 에이전트 의견을 동시에 받을 Executor (None이면 순서대로)
+            delphi_threshold: 조정 라운드를 진행할 심각도 차이 (초과 시, None이면 조정 없음)
+            multi_issue: True면 신규 이슈가 여러 건일 때 에이전트별로 한 번에 의견 요청 (give_opinions)
+        """
+        if opinion_mode not in OPINION_MODES:
+            raise ValueError(f"Invalid opinion_mode: {opinion_mode}. Must be one of {list(OPINION_MODES)}")
         self.date = date
         self.context = project_context
         self.new_issues = new_issues
         self.active_issues = active_issues
         self.method = method
+        self.executor = executor
+        self.opinion_mode = opinion_mode
+        self.opinion_executor = opinion_executor
+        self.delphi_threshold = delphi_threshold
+        self.multi_issue = multi_issue
 
         self.agents = {
-            "건축주": OwnerAgent(),
-            "시공사": ContractorAgent(method),
+            "건축주": OwnerAgent(backend=backend),
+            "시공사": ContractorAgent(method, backend=backend),
         }
 
     def run(self) -> Dict:
@@ -31,7 +54,7 @@ class AgentMeeting:
             "진행중": [
                 {
                     "ID": getattr(issue, 'id', 'N/A'),
-                    "이름": getattr(issue, 'name', str(issue)),
+                    "이름": issue.name if hasattr(issue, 'name') else str(issue),
                     "진행률": f"{getattr(issue, 'progress', 0):.0f}%",
                     "카테고리": getattr(issue, 'category', 'N/A')
                 }
@@ -53,9 +76,19 @@ class AgentMeeting:
         }
 
         # ===== 2. 신규 이슈 검토 =====
-        for issue in self.new_issues:
-            discussion = self.discuss_new_issue(issue)
-            log["discussions"].append(discussion)
+        # 같은 날의 신규 이슈는 같은 컨텍스트로 서로의 결과와 무관하게 토론 → 묶음 요청이면 에이전트별로 한 번에 묻고,
+        # executor가 있으면 동시에 진행. 결과는 발생 순서대로 기록
+        if self.multi_issue and len(self.new_issues) > 1:
+            collected = self.collect_opinions_multi(self.new_issues)
+            for issue in self.new_issues:
+                opinions, delphi = collected[issue["ID"]]
+                log["discussions"].append(self.discuss_new_issue(issue, opinions, delphi))
+        elif self.executor is not None and len(self.new_issues) > 1:
+            log["discussions"].extend(self.executor.map(self.discuss_new_issue, self.new_issues))
+        else:
+            for issue in self.new_issues:
+                discussion = self.discuss_new_issue(issue)
+                log["discussions"].append(discussion)
 
         # ===== 3. 진행 중 이슈 검토 =====
         for issue in self.active_issues:
@@ -68,17 +101,20 @@ class AgentMeeting:
 
         return log
 
-    def discuss_new_issue(self, issue: Dict) -> Dict:
-        """신규 이슈 토론"""
+    def discuss_new_issue(self, issue: Dict, opinions: Dict = None, delphi: Dict = None) -> Dict:
+        """신규 이슈 토론 (opinions가 주어지면 의견 수렴을 건너뜀 - 묶음 요청으로 이미 받은 경우)"""
 
         reporter = self.agents.get("시공사")
         report = reporter.report_issue(issue, self.context)
 
         # 각 에이전트 의견 수렴
-        opinions = {}
-        for name, agent in self.agents.items():
-            opinion = agent.give_opinion(issue, self.context, opinions)  # 이전 의견 전달
-            opinions[name] = opinion
+        if opinions is None and self.opinion_mode == "delphi":
+            opinions, delphi = self.collect_opinions_delphi(issue)
+        elif opinions is None:
+            opinions = {}
+            for name, agent in self.agents.items():
+                opinion = agent.give_opinion(issue, self.context, opinions)  # 이전 의견 전달
+                opinions[name] = opinion
 
         # 심각도 평가
         severity = self.evaluate_severity(issue, opinions)
@@ -97,7 +133,7 @@ class AgentMeeting:
         owner = self.agents["건축주"]
         selected = owner.select_solution(solutions, issue, self.context)
 
-        return {
+        discussion = {
             "issue_id": issue["ID"],
             "issue_name": issue["이슈명"],
             "type": "신규",
@@ -108,6 +144,93 @@ class AgentMeeting:
             "selected": selected,
             "reasoning": self.generate_reasoning(issue, opinions, selected),
         }
+        if delphi is not None:
+            discussion["delphi"] = delphi
+        return discussion
+
+    def collect_opinions_delphi(self, issue: Dict):
+        """
+        병렬 델파이 의견 수렴
+
+        1. 모든 에이전트가 서로의 의견 없이 동시에 답변
+        2. 심각도 차이가 delphi_threshold를 넘으면 각자 상대 평가 요약을 보고 심각도만 다시 판단 (동시에)
+
+        Returns:
+            (에이전트별 의견, {"initial_severity", "reconciled"})
+        """
+        opinions = self._for_each_agent(lambda name, agent: agent.give_opinion(issue, self.context))
+        return self.reconcile_opinions(issue, opinions)
+
+    def reconcile_opinions(self, issue: Dict, opinions: Dict):
+        """델파이 조정 라운드 (심각도 차이가 delphi_threshold 이하면 그대로) → (의견, 델파이 기록)"""
+        initial = {name: opinion.get("severity_assessment", 5) for name, opinion in opinions.items()}
+
+        spread = max(initial.values()) - min(initial.values())
+        if self.delphi_threshold is None or spread <= self.delphi_threshold:
+            return opinions, {"initial_severity": initial, "reconciled": False}
+
+        # 조정 라운드에는 의견 요약(선행 필드)만 사용 (스트리밍 완료 시점과 무관하게 같은 입력)
+        summaries = {
+            name: {field: opinions[name].get(field) for field in agent.stream_early_fields}
+            for name, agent in self.agents.items()
+        }
+
+        def reconcile(name, agent):
+            others = {other: summary for other, summary in summaries.items() if other != name}
+            return agent.reconcile(issue, self.context, summaries[name], others)
+
+        revised = self._for_each_agent(reconcile)
+        for name, result in revised.items():
+            if not result:
+                continue
+            opinion = opinions[name]
+            if isinstance(opinion, StreamedOpinion):
+                # 백그라운드에서 나머지 필드를 채울 때 조정 전 값으로 되돌리지 않도록
+                opinion.shared["severity_assessment"] = result["severity_assessment"]
+            opinion["initial_severity"] = initial[name]
+            opinion["reconcile_reason"] = result.get("reason", "")
+            opinion["severity_assessment"] = result["severity_assessment"]
+
+        return opinions, {"initial_severity": initial, "reconciled": True}
+
+    def collect_opinions_multi(self, issues: List[Dict]) -> Dict:
+        """
+        묶음 요청 의견 수렴: 에이전트마다 하루의 신규 이슈를 한 번에 묻고 이슈별로 나눔
+
+        순차 모드는 시공사 요청에 건축주의 이슈별 의견을 넣고, 델파이 모드는 두 에이전트가 동시에 답한 뒤
+        이슈마다 조정 라운드를 거친다.
+
+        Returns:
+            이슈 ID → (에이전트별 의견, 델파이 기록 또는 None)
+        """
+        by_issue = {issue["ID"]: {} for issue in issues}
+
+        if self.opinion_mode == "delphi":
+            answers = self._for_each_agent(lambda name, agent: agent.give_opinions(issues, self.context))
+            for name, per_issue in answers.items():
+                for issue_id, opinion in per_issue.items():
+                    by_issue[issue_id][name] = opinion
+            return {issue["ID"]: self.reconcile_opinions(issue, by_issue[issue["ID"]]) for issue in issues}
+
+        for name, agent in self.agents.items():
+            previous = {issue_id: dict(opinions) for issue_id, opinions in by_issue.items() if opinions}
+            per_issue = agent.give_opinions(issues, self.context, previous)  # 이전 의견 전달 (이슈별)
+            for issue_id, opinion in per_issue.items():
+                by_issue[issue_id][name] = opinion
+        return {issue_id: (opinions, None) for issue_id, opinions in by_issue.items()}
+
+    def _for_each_agent(self, fn) -> Dict:
+        """fn(이름, 에이전트)를 모든 에이전트에 대해 실행 (opinion_executor가 있으면 동시에, 결과는 에이전트 순서)"""
+        names = list(self.agents)
+        if self.opinion_executor is None:
+            return {name: fn(name, self.agents[name]) for name in names}
+
+        # 마지막 에이전트는 현재 스레드에서 실행
+        futures = {name: self.opinion_executor.submit(fn, name, self.agents[name]) for name in names[:-1]}
+        last = fn(names[-1], self.agents[names[-1]])
+        results = {name: future.result() for name, future in futures.items()}
+        results[names[-1]] = last
+        return {name: results[name] for name in names}
 
     def evaluate_severity(self, issue: Dict, opinions: Dict) -> Dict:
         """심각도 평가"""
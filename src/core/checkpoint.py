@@ -0,0 +1,55 @@
+"""
+시뮬레이션 체크포인트 (중단 후 이어서 실행)
+
+ConstructionSimulation이 N일 / LLM 호출 M건마다 마지막으로 끝난 날까지의 상태
+(일자, 누적 지표, 난수 상태, IssueManager, 회의 로그, LLM 호출 기록)를 pickle로 저장하고,
+--resume으로 다시 실행하면 그다음 날부터 이어서 진행한다.
+
+저장은 같은 폴더의 임시 파일에 쓴 뒤 os.replace로 교체하므로 저장 도중 중단되어도
+이전 체크포인트가 깨지지 않는다.
+"""
+
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_DIR = "checkpoints"
+
+
+def checkpoint_path(method: str, directory: str = CHECKPOINT_DIR) -> Path:
+    """공법별 체크포인트 파일 경로"""
+    return Path(directory) / f"{method.lower()}_checkpoint.pkl"
+
+
+def save_checkpoint(path: Path, state: Dict) -> Path:
+    """체크포인트 저장 (임시 파일 → fsync → 교체)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump({"version": CHECKPOINT_VERSION, **state}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return path
+
+
+def load_checkpoint(path: Path) -> Optional[Dict]:
+    """체크포인트 불러오기 (파일이 없으면 None)"""
+    path = Path(path)
+    if not path.exists():
+        return None
+    with open(path, "rb") as f:
+        state = pickle.load(f)
+    if state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"지원하지 않는 체크포인트 버전입니다: {path} (version={state.get('version')})")
+    return state
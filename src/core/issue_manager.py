@@ -3,6 +3,7 @@
 이슈의 발생, 진행, 해결 상태를 추적
 """
 
+import math
 from typing import List, Dict, Set, Literal, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -75,6 +76,22 @@ class IssueRecord:
                 self.actual_delay_days = self.duration_worked
                 self.actual_cost_increase_pct = self.estimated_cost_increase_pct
 
+    def completion_day(self) -> Optional[int]:
+        """
+        해결 중인 이슈가 완료될 날 (update_progress를 매일 호출했을 때와 같은 판정)
+
+        착수일 다음 날부터 하루 1일씩 작업하므로 작업일수 n이 처음으로 진행률 100%에 닿는 날은 착수일 + n.
+        예상 일수가 0 이하면 진행률이 오르지 않아 완료되지 않는다 (None).
+        """
+        if self.started_day is None or self.estimated_delay_days <= 0:
+            return None
+        days = max(1, math.ceil(self.estimated_delay_days))
+        while days > 1 and min(100.0, ((days - 1) / self.estimated_delay_days) * 100) >= 100:
+            days -= 1
+        while min(100.0, (days / self.estimated_delay_days) * 100) < 100:
+            days += 1
+        return self.started_day + days
+
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
         return {
@@ -209,6 +226,20 @@ class IssueManager:
 
         return status_changes
 
+    def catch_up(self, current_day: int):
+        """
+        건너뛴 날의 작업 반영 (이벤트 엔진)
+
+        해결 중인 이슈의 작업일수 / 진행률을 current_day까지 매일 update_all_issues를 호출했을 때의 값으로 맞춘다.
+        건너뛴 날에는 완료 / 착수가 없어야 한다 (일별 기록 daily_updates는 남기지 않음).
+        """
+        for issue in self.issues_by_status["해결중"]:
+            worked = current_day - issue.started_day
+            if worked > issue.duration_worked:
+                issue.duration_worked = worked
+                if issue.estimated_delay_days > 0:
+                    issue.progress = min(100.0, (worked / issue.estimated_delay_days) * 100)
+
     def _can_start_immediately(self, issue: IssueRecord) -> bool:
         """즉시 시작 가능 여부"""
         # 의존성 체크
@@ -0,0 +1,222 @@
+"""
+몬테카를로 반복 실행
+
+같은 프로젝트를 서로 다른 난수 시드로 N회 반복 실행해(ProcessPoolExecutor)
+누적 지연 / 누적 비용 증가 / 총 이슈 수의 분포(평균, 표준편차, 백분위수, 평균의 신뢰구간)를 구한다.
+
+- 반복마다 numpy SeedSequence에서 나눈 독립 시드로 시뮬레이션 난수원을 만듦 (기본 시드가 같으면 결과 재현)
+- 같은 반복 번호의 BIM / 전통 방식은 같은 시드를 써서(공통 난수) 두 방식의 차이를 반복별로 비교
+- 규칙 기반(heuristic) 백엔드 기준 (LLM 백엔드도 가능하지만 반복마다 API를 호출함)
+"""
+
+import contextlib
+import io
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from statistics import NormalDist
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..data.issue_cards import preload_issue_cards
+from .simulation_engine import ConstructionSimulation
+
+
+METHODS = ("BIM", "TRADITIONAL")
+
+# 반복 결과 지표 (리포트 키 → 반복 결과 키)
+METRICS = {
+    "누적지연_일": "delay_days",
+    "비용증가_퍼센트": "cost_increase_pct",
+    "총이슈수": "issue_count",
+}
+
+# BIM 개선 효과 (전통 - BIM, 반복별 차이)
+IMPROVEMENTS = {
+    "일정단축_일": "delay_days",
+    "비용절감_퍼센트포인트": "cost_increase_pct",
+    "이슈감소_개수": "issue_count",
+}
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# 작업 프로세스 상태 (프로세스마다 한 번 설정)
+_WORKER = {}
+
+
+def replication_seeds(seed: int, count: int) -> List[int]:
+    """기본 시드에서 반복별 독립 시드 생성 (SeedSequence.spawn, 128비트)"""
+    children = np.random.SeedSequence(seed).spawn(count)
+    return [int.from_bytes(child.generate_state(4).tobytes(), "little") for child in children]
+
+
+def _init_worker(project_info: Dict, backend: str, opinion_mode: Optional[str]):
+    _WORKER.update(project_info=project_info, backend=backend, opinion_mode=opinion_mode)
+
+
+def run_replication(task) -> Dict:
+    """
+    반복 1회 실행 (작업 프로세스)
+
+    Args:
+        task: (반복 번호, 시드, 공법)
+
+    Returns:
+        {"replication", "method", "seed", "delay_days", "cost_increase_pct", "issue_count"}
+    """
+    index, seed, method = task
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim = ConstructionSimulation(
+            _WORKER["project_info"],
+            method=method,
+            backend=_WORKER["backend"],
+            meeting_workers=1,
+            opinion_mode=_WORKER["opinion_mode"],
+            seed=seed,
+        )
+        summary = sim.run_simulation(output_dir=None)
+
+    return {
+        "replication": index,
+        "method": method,
+        "seed": seed,
+        "delay_days": sim.total_delay_days,
+        "cost_increase_pct": sim.total_cost_increase_pct,
+        "issue_count": summary["시뮬레이션결과"]["총이슈수"],
+    }
+
+
+def describe(values: Sequence[float], confidence: float = 0.95) -> Dict:
+    """평균, 표준편차, 백분위수, 평균의 신뢰구간 (정규 근사)"""
+    data = np.asarray(values, dtype=float)
+    mean = float(data.mean())
+    std = float(data.std(ddof=1)) if len(data) > 1 else 0.0
+    half_width = NormalDist().inv_cdf((1 + confidence) / 2) * std / math.sqrt(len(data))
+
+    stats = {"평균": round(mean, 4), "표준편차": round(std, 4)}
+    for pct, value in zip(PERCENTILES, np.percentile(data, PERCENTILES)):
+        stats[f"p{pct}"] = round(float(value), 4)
+    stats[f"신뢰구간{confidence * 100:g}%"] = [round(mean - half_width, 4), round(mean + half_width, 4)]
+    return stats
+
+
+def aggregate(results: List[Dict], methods: Sequence[str], confidence: float = 0.95) -> Dict:
+    """반복 결과 → 공법별 분포와 (두 공법 모두 실행했으면) 반복별 BIM 개선 효과 분포"""
+    by_method = {method: sorted((r for r in results if r["method"] == method), key=lambda r: r["replication"])
+                 for method in methods}
+
+    report = {
+        method: {name: describe([r[key] for r in rows], confidence) for name, key in METRICS.items()}
+        for method, rows in by_method.items()
+    }
+    if "BIM" in by_method and "TRADITIONAL" in by_method:
+        pairs = list(zip(by_method["BIM"], by_method["TRADITIONAL"]))
+        report["BIM개선효과"] = {
+            name: describe([trad[key] - bim[key] for bim, trad in pairs], confidence)
+            for name, key in IMPROVEMENTS.items()
+        }
+    return report
+
+
+def run_monte_carlo(
+    project_info: Dict,
+    replications: int = 1000,
+    methods: Sequence[str] = METHODS,
+    workers: Optional[int] = None,
+    seed: int = 42,
+    backend: str = "heuristic",
+    opinion_mode: Optional[str] = None,
+    confidence: float = 0.95,
+    output_dir: Optional[str] = "results",
+    keep_replications: bool = False,
+) -> Dict:
+    """
+    몬테카를로 반복 실행
+
+    Args:
+        project_info: 프로젝트 기본 정보 (load_project_config 결과)
+        replications: 공법별 반복 횟수
+        methods: 실행할 공법
+        workers: 작업 프로세스 수 (None이면 CPU 수)
+        seed: 기본 시드 (반복별 시드를 여기서 생성)
+        backend: 에이전트 의견 백엔드 이름
+        opinion_mode: 의견 수렴 방식 (None이면 OPINION_MODE 환경 변수)
+        confidence: 평균 신뢰구간 수준
+        output_dir: 리포트 저장 폴더 (None이면 저장하지 않음)
+        keep_replications: True면 리포트에 반복별 결과도 포함
+
+    Returns:
+        리포트 (실행정보, 공법별 분포, BIM개선효과)
+    """
+    workers = workers or os.cpu_count() or 1
+    seeds = replication_seeds(seed, replications)
+    tasks = [(index, replication_seed, method)
+             for index, replication_seed in enumerate(seeds) for method in methods]
+
+    print(f"\n몬테카를로 실행: {', '.join(methods)} 각 {replications}회, 프로세스 {workers}개, "
+          f"백엔드 {backend}, 시드 {seed}")
+
+    # 카드는 부모 프로세스에서 한 번 로드해 작업 프로세스와 공유
+    preload_issue_cards(methods)
+
+    started = time.perf_counter()
+    results = []
+    # 작업 전달 비용을 줄이도록 프로세스당 여러 묶음으로 나눠 전달
+    chunksize = max(1, len(tasks) // (workers * 8))
+    report_every = max(1, len(tasks) // 10)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(project_info, backend, opinion_mode)
+    ) as executor:
+        for result in executor.map(run_replication, tasks, chunksize=chunksize):
+            results.append(result)
+            if len(results) % report_every == 0:
+                print(f"  {len(results)}/{len(tasks)} 완료 ({time.perf_counter() - started:.1f}s)")
+    elapsed = time.perf_counter() - started
+
+    report = {
+        "실행정보": {
+            "실행일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "공법": list(methods),
+            "반복수": replications,
+            "기본시드": seed,
+            "프로세스수": workers,
+            "백엔드": backend,
+            "신뢰수준": confidence,
+            "실행시간_초": round(elapsed, 1),
+        },
+        **aggregate(results, methods, confidence),
+    }
+    if keep_replications:
+        report["반복결과"] = results
+
+    print_report(report)
+    if output_dir is not None:
+        result_dir = Path(output_dir)
+        result_dir.mkdir(exist_ok=True)
+        report_file = result_dir / f"montecarlo_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        with open(report_file, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n몬테카를로 리포트 저장 완료: {report_file}")
+
+    return report
+
+
+def print_report(report: Dict):
+    """공법별 / 개선 효과 분포 출력"""
+    info = report["실행정보"]
+    ci_key = f"신뢰구간{info['신뢰수준'] * 100:g}%"
+    print(f"\n【몬테카를로 결과】 공법별 {info['반복수']}회, {info['실행시간_초']}s")
+    for section in [*info["공법"], "BIM개선효과"]:
+        if section not in report:
+            continue
+        print(f"  [{section}]")
+        for name, stats in report[section].items():
+            low, high = stats[ci_key]
+            print(f"    {name}: 평균 {stats['평균']:.2f} (±{stats['표준편차']:.2f}), "
+                  f"p5 {stats['p5']:.2f} / p50 {stats['p50']:.2f} / p95 {stats['p95']:.2f}, "
+                  f"{ci_key} [{low:.2f}, {high:.2f}]")
@@ -0,0 +1,93 @@
+"""
+이슈 최초 발생일 표본 추출 (기하분포)
+
+일별 루프(check_issue_occurrence)는 공정률 구간 안의 매일, 아직 발생하지 않은 이슈마다 확률 p로
+베르누이 시행을 한다. p는 시뮬레이션 동안 변하지 않고(KPI는 케이스/공법으로 고정), 공정률 구간은 날짜로만 정해지므로
+구간 첫날부터 첫 발생까지의 실패 횟수 k는 기하분포 P(k) = p(1-p)^k를 따른다.
+
+균등 난수 u ∈ [0, 1) 하나로 k = floor(log(1-u) / log(1-p))를 구해 k < 구간 길이면 (구간 시작일 + k)일에 발생,
+아니면 발생하지 않는다. 이슈 × 반복 전체의 발생 일정을 NumPy 배열 연산 몇 번으로 뽑는다.
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from ..data.card_store import get_card_store
+from ..data.issue_cards import get_progress_index
+from .probability_calculator import calculate_issue_probabilities
+
+
+# "daily": 매일 이슈별 베르누이 시행, "geometric": 시작 시 이슈별 최초 발생일을 한 번에 추출
+OCCURRENCE_MODES = ("daily", "geometric")
+
+
+def occurrence_windows(issues: List[Dict], target_days: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    이슈별 발생 가능 구간 (filter_issues_by_progress와 같은 판정)
+
+    Args:
+        issues: 이슈 목록
+        target_days: 목표 공기 (1일 ~ target_days일 진행)
+
+    Returns:
+        (구간 시작일, 구간 일수) 정수 배열 (공정률 형식이 잘못된 이슈는 일수 0)
+    """
+    days = np.arange(1, target_days + 1)
+    progress_pct = days / target_days * 100 if target_days > 0 else np.zeros(len(days))
+
+    intervals = get_progress_index(issues).intervals
+    valid = np.array([interval is not None for interval in intervals], dtype=bool)
+    min_p = np.array([interval[0] if interval else 0 for interval in intervals], dtype=float)
+    max_p = np.array([interval[1] if interval else 0 for interval in intervals], dtype=float)
+
+    # 진행률은 날짜에 따라 증가하므로 구간은 연속: 첫날 = min_p 이상인 첫 날, 끝 = max_p 초과인 첫 날 전날
+    first = np.searchsorted(progress_pct, min_p, side="left")
+    end = np.searchsorted(progress_pct, max_p, side="right")
+    length = np.where(valid, np.maximum(end - first, 0), 0).astype(np.int64)
+    start = np.where(length > 0, first + 1, 0).astype(np.int64)
+    return start, length
+
+
+def issue_probabilities(issues: List[Dict], kpi_values: Dict[str, float], method: str) -> np.ndarray:
+    """이슈별 일일 발생 확률"""
+    store = get_card_store(issues, method)
+    return calculate_issue_probabilities(store, store.kpi_vector(kpi_values))
+
+
+def first_occurrence_days(
+    probabilities: np.ndarray, start: np.ndarray, length: np.ndarray, uniforms: np.ndarray
+) -> np.ndarray:
+    """
+    균등 난수 → 이슈별 최초 발생일
+
+    Args:
+        probabilities, start, length: 이슈별 일일 발생 확률 / 구간 시작일 / 구간 일수 (길이 n)
+        uniforms: [0, 1) 균등 난수, 모양 (..., n)
+
+    Returns:
+        uniforms와 같은 모양의 발생일 배열 (0이면 발생하지 않음)
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        failures = np.floor(np.log1p(-uniforms) / np.log1p(-probabilities))
+    occurred = failures < length
+    return np.where(occurred, start + np.where(occurred, failures, 0).astype(np.int64), 0)
+
+
+def sample_occurrence_schedules(
+    issues: List[Dict],
+    kpi_values: Dict[str, float],
+    method: str,
+    target_days: int,
+    runs: int,
+    generator: np.random.Generator,
+) -> np.ndarray:
+    """
+    여러 반복의 발생 일정을 한 번에 추출
+
+    Returns:
+        (runs, 이슈 수) 발생일 배열 (0이면 발생하지 않음)
+    """
+    start, length = occurrence_windows(issues, target_days)
+    probabilities = issue_probabilities(issues, kpi_values, method)
+    return first_occurrence_days(probabilities, start, length, generator.random((runs, len(issues))))
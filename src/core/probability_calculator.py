@@ -3,8 +3,17 @@
 KPI 지표와 가중치를 기반으로 실제 발생 확률 계산
 """
 
-from typing import Dict
-from ..config.case_mapping import normalize_kpi_value
+from typing import Dict, List
+
+import numpy as np
+
+from ..config.case_mapping import KPI_NORMALIZATION, normalize_kpi_value
+from ..data.card_store import IssueCardStore, get_card_store
+
+
+# (공법, 케이스, KPI 값, 카드 목록) → 확률표 (최근 몇 개만 유지)
+_TABLE_CACHE: Dict[tuple, tuple] = {}
+_TABLE_CACHE_SIZE = 16
 
 
 def calculate_issue_probability(
@@ -53,3 +62,80 @@ def calculate_issue_probability(
 
     # 최대 95%, 최소 1%로 제한
     return max(0.01, min(0.95, final_prob))
+
+
+def calculate_issue_probabilities(store: IssueCardStore, kpi_vectors) -> np.ndarray:
+    """
+    모든 카드 × KPI 벡터의 발생 확률 (calculate_issue_probability의 배열 버전)
+
+    계산 순서(KPI별 누적 합, min / max 비교)를 스칼라 버전과 같게 해 결과가 비트 단위로 같다.
+    KPI 딕셔너리가 KPI_NORMALIZATION과 같은 순서일 때 기준 (get_kpi_values가 돌려주는 순서).
+
+    Args:
+        store: 공법별 이슈 카드 배열
+        kpi_vectors: (KPI 수,) 또는 (..., KPI 수) KPI 값 (열 순서는 store.kpi_names)
+
+    Returns:
+        (카드 수,) 또는 (..., 카드 수) 최종 발생 확률
+    """
+    kpi = np.asarray(kpi_vectors, dtype=float)
+    params = KPI_NORMALIZATION[store.method]
+    max_values = np.array([params[name]["max"] for name in store.kpi_names])
+    higher_better = np.array([params[name]["direction"] == "higher_better" for name in store.kpi_names])
+
+    # KPI 정규화: min(value / max, 1.0), 높을수록 좋은 지표는 1 - 값
+    ratio = kpi / max_values
+    normalized = np.where(1.0 < ratio, 1.0, ratio)
+    normalized = np.where(higher_better, 1.0 - normalized, normalized)
+
+    # (..., 1, KPI 수) × (카드 수, KPI 수), 가중치가 0 이하인 KPI는 제외
+    active = store.weights > 0
+    scores = np.where(active, normalized[..., np.newaxis, :] * store.weights, 0.0)
+    risk_sum = sum(scores[..., k] for k in range(len(store.kpi_names)))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total_risk = np.where(active.any(axis=1), risk_sum / store.weight_sum, 0.5)
+
+    multiplier = 1.0 + (total_risk - 0.5) * 0.8
+    if store.method == "TRADITIONAL":
+        multiplier = multiplier * 1.2
+
+    final_prob = store.base_probability * multiplier
+    # max(0.01, min(0.95, final_prob))
+    capped = np.where(final_prob < 0.95, final_prob, 0.95)
+    return np.where(capped > 0.01, capped, 0.01)
+
+
+def probability_table(
+    issues: List[Dict], kpi_values: Dict[str, float], method: str, case: str = ""
+) -> Dict[str, float]:
+    """
+    이슈 ID → 발생 확률표 (공법 / 케이스 / KPI 벡터 / 카드 목록별로 한 번 계산해 재사용)
+
+    값은 calculate_issue_probability와 같다. KPI 딕셔너리가 KPI_NORMALIZATION 순서이면
+    calculate_issue_probabilities로 한 번에, 아니면(순서가 다르거나 일부 KPI만 있음) 카드별로 계산한다.
+    반환된 표는 여러 시뮬레이션이 공유하므로 고치지 말 것.
+    """
+    store = get_card_store(issues, method)
+    key = (method, case, tuple(kpi_values.items()), id(issues))
+    cached = _TABLE_CACHE.get(key)
+    # 목록 / 저장소를 함께 보관해 비교 (해제된 목록의 id를 새 목록이 물려받은 경우, 카드를 추가/삭제한 경우 다시 계산)
+    if cached is not None and cached[0] is issues and cached[1] is store:
+        return cached[2]
+
+    if tuple(kpi_values) == store.kpi_names:
+        probabilities = calculate_issue_probabilities(store, store.kpi_vector(kpi_values)).tolist()
+    else:
+        probabilities = [calculate_issue_probability(issue, kpi_values, method) for issue in issues]
+    table = dict(zip(store.ids, probabilities))
+
+    _TABLE_CACHE.pop(key, None)
+    if len(_TABLE_CACHE) >= _TABLE_CACHE_SIZE:
+        _TABLE_CACHE.pop(next(iter(_TABLE_CACHE)))
+    _TABLE_CACHE[key] = (issues, store, table)
+    return table
+
+
+def clear_probability_tables():
+    """확률표 캐시 비우기 (카드 값을 직접 고친 경우)"""
+    _TABLE_CACHE.clear()
@@ -0,0 +1,57 @@
+"""
+시뮬레이션 난수원
+
+시뮬레이션마다 시드로 만든 SimulationRNG를 주입해 모듈 전역 random 상태를 쓰지 않는다
+(스레드/프로세스에서 여러 시뮬레이션을 동시에 실행해도 서로의 난수열이 섞이지 않음).
+
+이슈 카드마다 (시드, 이슈 ID)로 키를 정한 Philox(카운터 기반) 스트림을 따로 두므로
+카드를 추가/삭제하거나 다른 이슈의 발생 여부가 바뀌어도 각 이슈의 난수열은 그대로다.
+"""
+
+import hashlib
+from typing import Dict, Optional
+
+import numpy as np
+
+
+def stream_key(name: str) -> int:
+    """스트림 이름 → 64비트 키 (내장 hash()는 프로세스마다 달라지므로 SHA-256 사용)"""
+    return int.from_bytes(hashlib.sha256(name.encode("utf-8")).digest()[:8], "little")
+
+
+class SimulationRNG:
+    """시드 1개에서 이름별 독립 난수 스트림을 만드는 난수원"""
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: 시드 (None이면 OS 엔트로피로 생성, 생성된 값은 self.seed로 확인 가능)
+        """
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.seed = self.seed_sequence.entropy
+        self._streams: Dict[str, np.random.Generator] = {}
+
+    def stream(self, name: str) -> np.random.Generator:
+        """
+        이름별 난수 스트림 (처음 요청할 때 생성)
+
+        SeedSequence.spawn과 같은 방식으로 spawn_key에 이름의 키를 붙이되, 생성 순서가 아닌 이름으로 정하므로
+        다른 스트림의 생성 여부/순서와 무관하다.
+        """
+        generator = self._streams.get(name)
+        if generator is None:
+            child = np.random.SeedSequence(
+                self.seed_sequence.entropy,
+                spawn_key=self.seed_sequence.spawn_key + (stream_key(name),),
+            )
+            generator = np.random.Generator(np.random.Philox(child))
+            self._streams[name] = generator
+        return generator
+
+    def issue_stream(self, issue_id: str) -> np.random.Generator:
+        """이슈 카드별 난수 스트림"""
+        return self.stream(f"issue:{issue_id}")
+
+    def random(self, issue_id: str) -> float:
+        """이슈 스트림의 다음 [0, 1) 난수"""
+        return self.issue_stream(issue_id).random()
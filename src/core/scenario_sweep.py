@@ -0,0 +1,266 @@
+"""
+시나리오 스윕 (위치 × 용적률 × 공법 등)
+
+프로젝트 설정 격자(grid) 또는 목록(scenarios)을 받아 시나리오마다 BIM / 전통 방식을 실행하고(ProcessPoolExecutor)
+시나리오당 1행의 통합 표(누적 지연 / 비용 증가 / 이슈 수와 BIM 개선 효과)를 만든다.
+
+- 같은 결과가 나오는 작업은 한 번만 실행 (중복 제거)
+  규칙 기반 백엔드에서는 위치 / 용적률이 케이스(determine_case)로만, 연면적 / 총공사비 / 용도는 LLM 프롬프트로만
+  쓰이므로 (케이스, 공법, 시드, 계획공기)가 같으면 같은 작업이다. LLM 백엔드는 프롬프트가 달라지므로 설정 전체로 구분
+- 모든 시나리오는 같은 시드를 사용 (시나리오 간 비교 시 공통 난수)
+"""
+
+import contextlib
+import csv
+import io
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..config.case_mapping import determine_case
+from ..data.issue_cards import preload_issue_cards
+from .monte_carlo import METHODS
+from .simulation_engine import ConstructionSimulation
+
+
+# 시나리오 설정 키 (load_project_config 결과와 같음)
+SCENARIO_KEYS = (
+    "location", "floor_area_ratio", "total_area", "total_budget",
+    "planned_duration_days", "building_type", "ground_roughness",
+)
+NUMERIC_KEYS = {"floor_area_ratio": int, "total_area": float, "total_budget": float, "planned_duration_days": int}
+# project_config.json 키로도 지정 가능
+CONFIG_ALIASES = {
+    "용적률": "floor_area_ratio",
+    "연면적_제곱미터": "total_area",
+    "총공사비_억원": "total_budget",
+    "계획공기_일수": "planned_duration_days",
+}
+
+# 통합 표 열 (표 이름 → (공법, 작업 결과 키))
+RESULT_COLUMNS = {
+    "BIM_누적지연_일": ("BIM", "delay_days"),
+    "전통_누적지연_일": ("TRADITIONAL", "delay_days"),
+    "BIM_비용증가_퍼센트": ("BIM", "cost_increase_pct"),
+    "전통_비용증가_퍼센트": ("TRADITIONAL", "cost_increase_pct"),
+    "BIM_총이슈수": ("BIM", "issue_count"),
+    "전통_총이슈수": ("TRADITIONAL", "issue_count"),
+}
+IMPROVEMENT_COLUMNS = {
+    "일정단축_일": "delay_days",
+    "비용절감_퍼센트포인트": "cost_increase_pct",
+    "이슈감소_개수": "issue_count",
+}
+
+# 작업 프로세스 상태 (프로세스마다 한 번 설정)
+_WORKER = {}
+
+
+def expand_scenarios(base: Dict, grid: Optional[Dict[str, Sequence]] = None,
+                     scenarios: Optional[List[Dict]] = None) -> List[Dict]:
+    """
+    시나리오 목록 생성
+
+    Args:
+        base: 기본 프로젝트 설정 (지정하지 않은 키에 사용)
+        grid: 키별 값 목록 → 모든 조합 (데카르트 곱)
+        scenarios: 개별 시나리오 목록 (base에 덮어씀)
+
+    Returns:
+        중복을 뺀 시나리오 목록 (각 항목에 "case" 포함)
+
+    Raises:
+        ValueError: 알 수 없는 키 / 잘못된 값 / 잘못된 위치
+    """
+    overrides = []
+    if grid:
+        keys = list(grid)
+        overrides.extend(dict(zip(keys, values)) for values in itertools.product(*(grid[key] for key in keys)))
+    overrides.extend(scenarios or [])
+    if not overrides:
+        overrides.append({})
+
+    expanded, seen = [], set()
+    for index, override in enumerate(overrides):
+        override = {CONFIG_ALIASES.get(key, key): value for key, value in override.items()}
+        unknown = set(override) - set(SCENARIO_KEYS)
+        if unknown:
+            raise ValueError(f"시나리오 {index}: 알 수 없는 설정 {sorted(unknown)} (사용 가능: {list(SCENARIO_KEYS)})")
+        scenario = {key: base[key] for key in SCENARIO_KEYS if key in base}
+        try:
+            for key, value in override.items():
+                scenario[key] = NUMERIC_KEYS[key](value) if key in NUMERIC_KEYS else value
+            scenario["case"] = determine_case(scenario["location"], scenario["floor_area_ratio"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"시나리오 {index}: 잘못된 설정 ({e})") from e
+
+        key = tuple(scenario.get(k) for k in SCENARIO_KEYS)
+        if key not in seen:
+            seen.add(key)
+            expanded.append(scenario)
+    return expanded
+
+
+def job_key(scenario: Dict, method: str, seed: int, backend: str) -> Tuple:
+    """같은 결과가 나오는 작업을 묶는 키"""
+    if backend == "heuristic":
+        return (scenario["case"], method, seed, scenario["planned_duration_days"])
+    return (*(scenario.get(k) for k in SCENARIO_KEYS), method, seed)
+
+
+def _init_worker(backend: str, opinion_mode: Optional[str]):
+    _WORKER.update(backend=backend, opinion_mode=opinion_mode)
+
+
+def run_job(task) -> Dict:
+    """
+    작업 1개 실행 (작업 프로세스)
+
+    Args:
+        task: (작업 키, 시나리오, 공법, 시드)
+    """
+    key, scenario, method, seed = task
+    project_info = {k: scenario[k] for k in SCENARIO_KEYS if k in scenario}
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim = ConstructionSimulation(
+            project_info,
+            method=method,
+            backend=_WORKER["backend"],
+            meeting_workers=1,
+            opinion_mode=_WORKER["opinion_mode"],
+            seed=seed,
+        )
+        summary = sim.run_simulation(output_dir=None)
+
+    return {
+        "key": key,
+        "delay_days": round(sim.total_delay_days, 4),
+        "cost_increase_pct": round(sim.total_cost_increase_pct, 4),
+        "issue_count": summary["시뮬레이션결과"]["총이슈수"],
+    }
+
+
+def build_table(scenarios: List[Dict], results: Dict[Tuple, Dict], methods: Sequence[str],
+                seed: int, backend: str) -> List[Dict]:
+    """시나리오당 1행 통합 표"""
+    rows = []
+    for number, scenario in enumerate(scenarios, 1):
+        row = {"시나리오": number, **{k: scenario.get(k) for k in SCENARIO_KEYS}, "케이스": scenario["case"]}
+        by_method = {method: results[job_key(scenario, method, seed, backend)] for method in methods}
+        for column, (method, field) in RESULT_COLUMNS.items():
+            if method in by_method:
+                row[column] = by_method[method][field]
+        if "BIM" in by_method and "TRADITIONAL" in by_method:
+            for column, field in IMPROVEMENT_COLUMNS.items():
+                row[column] = round(by_method["TRADITIONAL"][field] - by_method["BIM"][field], 4)
+        rows.append(row)
+    return rows
+
+
+def run_sweep(
+    scenarios: List[Dict],
+    methods: Sequence[str] = METHODS,
+    workers: Optional[int] = None,
+    seed: int = 42,
+    backend: str = "heuristic",
+    opinion_mode: Optional[str] = None,
+    output_dir: Optional[str] = "results",
+) -> Dict:
+    """
+    시나리오 스윕 실행
+
+    Args:
+        scenarios: expand_scenarios 결과
+        methods: 실행할 공법
+        workers: 작업 프로세스 수 (None이면 CPU 수)
+        seed: 모든 시나리오 / 공법에 쓰는 시드
+        backend: 에이전트 의견 백엔드 이름
+        opinion_mode: 의견 수렴 방식 (None이면 OPINION_MODE 환경 변수)
+        output_dir: 표 저장 폴더 (None이면 저장하지 않음)
+
+    Returns:
+        리포트 (실행정보, 시나리오별 표)
+    """
+    workers = workers or os.cpu_count() or 1
+    tasks, seen = [], set()
+    for scenario in scenarios:
+        for method in methods:
+            key = job_key(scenario, method, seed, backend)
+            if key not in seen:
+                seen.add(key)
+                tasks.append((key, scenario, method, seed))
+
+    print(f"\n시나리오 스윕: 시나리오 {len(scenarios)}개 × {', '.join(methods)} → 작업 {len(tasks)}개 "
+          f"(중복 {len(scenarios) * len(methods) - len(tasks)}개 제외), 프로세스 {workers}개, 백엔드 {backend}, 시드 {seed}")
+
+    # 카드는 부모 프로세스에서 한 번 로드해 작업 프로세스와 공유
+    preload_issue_cards(methods)
+
+    started = time.perf_counter()
+    results = {}
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(backend, opinion_mode)
+    ) as executor:
+        for result in executor.map(run_job, tasks, chunksize=max(1, len(tasks) // (workers * 4))):
+            results[result["key"]] = result
+    elapsed = time.perf_counter() - started
+
+    report = {
+        "실행정보": {
+            "실행일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "공법": list(methods),
+            "시나리오수": len(scenarios),
+            "작업수": len(tasks),
+            "시드": seed,
+            "프로세스수": workers,
+            "백엔드": backend,
+            "실행시간_초": round(elapsed, 1),
+        },
+        "시나리오": build_table(scenarios, results, methods, seed, backend),
+    }
+
+    print_table(report)
+    if output_dir is not None:
+        save_report(report, Path(output_dir))
+    return report
+
+
+def save_report(report: Dict, result_dir: Path):
+    """통합 표를 JSON / CSV(엑셀에서 바로 열리도록 UTF-8 BOM)로 저장"""
+    result_dir.mkdir(exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    json_file = result_dir / f"sweep_{timestamp}.json"
+    with open(json_file, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    csv_file = result_dir / f"sweep_{timestamp}.csv"
+    rows = report["시나리오"]
+    with open(csv_file, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    print(f"\n시나리오 스윕 저장 완료: {json_file}, {csv_file}")
+
+
+def print_table(report: Dict):
+    """시나리오별 결과 표 출력"""
+    info = report["실행정보"]
+    print(f"\n【시나리오 스윕 결과】 시나리오 {info['시나리오수']}개, 작업 {info['작업수']}개, {info['실행시간_초']}s")
+    for row in report["시나리오"]:
+        settings = (f"{row['location']} 용적률 {row['floor_area_ratio']}% / {row['total_area']:,.0f}㎡ / "
+                    f"{row['total_budget']}억 / {row['planned_duration_days']}일 / {row['building_type']}")
+        line = f"  #{row['시나리오']} [{row['케이스']}] {settings}"
+        if "BIM_누적지연_일" in row:
+            line += f" | BIM {row['BIM_누적지연_일']:.1f}일 {row['BIM_비용증가_퍼센트']:.2f}%"
+        if "전통_누적지연_일" in row:
+            line += f" | 전통 {row['전통_누적지연_일']:.1f}일 {row['전통_비용증가_퍼센트']:.2f}%"
+        if "일정단축_일" in row:
+            line += f" | 단축 {row['일정단축_일']:.1f}일, 절감 {row['비용절감_퍼센트포인트']:.2f}%p"
+        print(line)
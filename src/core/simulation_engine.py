@@ -3,33 +3,92 @@
 매일 시뮬레이션을 실행하고 회의를 진행
 """
 
-import random
+import os
 import json
-from typing import Dict, List
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+
 from ..config.project_context import ProjectContext
 from ..config.case_mapping import determine_case, get_kpi_values
-from ..data.issue_cards import get_issues_by_method, filter_issues_by_progress
+from ..data.issue_cards import card_source, get_issues_by_method, filter_issues_by_progress
 from .issue_manager import IssueManager
-from .agent_meeting import AgentMeeting
-from .probability_calculator import calculate_issue_probability
+from .agent_meeting import AgentMeeting, OPINION_MODES
+from .occurrence_sampler import OCCURRENCE_MODES, first_occurrence_days, issue_probabilities, occurrence_windows
+from .rng import SimulationRNG
+from .checkpoint import load_checkpoint, save_checkpoint as write_checkpoint
+from ..agents.backends import OpinionBackend, create_backend
+
+
+# "day": 1일부터 매일 진행, "event": 이벤트가 있는 날만 진행
+ENGINES = ("day", "event")
 
 
 class ConstructionSimulation:
     """건설 시뮬레이션 엔진"""
 
-    def __init__(self, project_info: Dict, method: str = "BIM"):
+    def __init__(self, project_info: Dict, method: str = "BIM", llm=None, backend="llm",
+                 meeting_workers: Optional[int] = None, opinion_mode: Optional[str] = None,
+                 seed: Optional[int] = None, occurrence: Optional[str] = None, engine: Optional[str] = None,
+                 checkpoint_path: Optional[str] = None, checkpoint_days: Optional[int] = None,
+                 checkpoint_calls: Optional[int] = None):
         """
         시뮬레이션 초기화
 
         Args:
             project_info: 프로젝트 기본 정보
             method: "BIM" 또는 "TRADITIONAL"
+            llm: 에이전트가 사용할 LLMClient (None이면 프로세스 공유 클라이언트)
+            backend: 에이전트 의견 백엔드 ("llm", "heuristic" 또는 OpinionBackend 객체)
+            meeting_workers: 하루의 신규 이슈를 동시에 토론할 스레드 수
+                (None이면 MEETING_WORKERS 환경 변수, 1 이하거나 LLM을 쓰지 않는 백엔드면 순서대로 토론)
+            opinion_mode: 의견 수렴 방식 "sequential" 또는 "delphi" (None이면 OPINION_MODE 환경 변수)
+            seed: 이슈 발생 난수 시드 (같은 시드면 같은 이슈 발생, None이면 실행마다 다름)
+            occurrence: 이슈 발생 판정 방식 "daily" 또는 "geometric" (None이면 OCCURRENCE_SAMPLER 환경 변수,
+                event 엔진의 기본값은 geometric)
+            engine: 진행 방식 "day"(매일) 또는 "event"(이벤트가 있는 날만, geometric 필요)
+                (None이면 SIMULATION_ENGINE 환경 변수)
+            checkpoint_path: 체크포인트 파일 (None이면 저장하지 않음)
+            checkpoint_days: 체크포인트 저장 간격 (일, None이면 CHECKPOINT_DAYS 환경 변수, 0이면 일수 기준 저장 안 함)
+            checkpoint_calls: 체크포인트 저장 간격 (LLM 호출 기록 건수, None이면 CHECKPOINT_CALLS 환경 변수, 0이면 사용 안 함)
         """
         # 프로젝트 컨텍스트 생성
         self.method = method
+        self.llm = llm
+        self.seed = seed
+        self.rng = SimulationRNG(seed)  # 이슈별 독립 난수 스트림 (전역 random 미사용)
+        self.backend = backend if isinstance(backend, OpinionBackend) else create_backend(backend, llm=llm)
+        self.metrics = self.backend.metrics  # LLM 호출 지표 (LLM 백엔드만)
+        if meeting_workers is None:
+            meeting_workers = int(os.getenv("MEETING_WORKERS", "4"))
+        self.meeting_workers = meeting_workers if self.backend.blocking_io else 1
+        self._meeting_executor = None
+
+        # 의견 수렴 방식 (델파이: 에이전트 동시 답변 + 심각도 차이가 DELPHI_THRESHOLD 초과 시 조정 라운드)
+        self.opinion_mode = opinion_mode or os.getenv("OPINION_MODE", "sequential")
+        if self.opinion_mode not in OPINION_MODES:
+            raise ValueError(f"Invalid opinion_mode: {self.opinion_mode}. Must be one of {list(OPINION_MODES)}")
+        threshold = float(os.getenv("DELPHI_THRESHOLD", "2"))
+        self.delphi_threshold = threshold if threshold >= 0 else None  # 음수면 조정 라운드 없음
+        self._opinion_executor = None
+
+        # 진행 방식 (event: 이슈 발생 / 완료 / 착수 확인이 있는 날만 진행, 결과 요약은 day와 같음)
+        self.engine = engine or os.getenv("SIMULATION_ENGINE", "day")
+        if self.engine not in ENGINES:
+            raise ValueError(f"Invalid engine: {self.engine}. Must be one of {list(ENGINES)}")
+
+        # 이슈 발생 판정 (geometric: 시작 시 이슈별 최초 발생일을 기하분포로 한 번에 추출, 분포는 daily와 같음)
+        self.occurrence = (occurrence or os.getenv("OCCURRENCE_SAMPLER")
+                           or ("geometric" if self.engine == "event" else "daily"))
+        if self.occurrence not in OCCURRENCE_MODES:
+            raise ValueError(f"Invalid occurrence: {self.occurrence}. Must be one of {list(OCCURRENCE_MODES)}")
+        if self.engine == "event" and self.occurrence != "geometric":
+            raise ValueError("event 엔진은 미리 추출한 발생일이 필요합니다 (occurrence='geometric')")
+        self._occurrence_schedule: Optional[Dict[int, List[Dict]]] = None
 
         # 케이스 결정
         case = determine_case(
@@ -65,10 +124,30 @@ class ConstructionSimulation:
         self.total_delay_days = 0
         self.total_cost_increase_pct = 0
 
-    def run_simulation(self, output_dir: str = "results") -> Dict:
+        # 이벤트 엔진 상태 (힙, 처리한 이벤트일 수, 마지막 진행 상황 출력 구간)
+        self._events = None
+        self.event_days = 0
+        self._last_report = 0
+
+        # 체크포인트 (마지막으로 끝난 날까지의 상태를 주기적으로 저장)
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        if checkpoint_days is None:
+            checkpoint_days = int(os.getenv("CHECKPOINT_DAYS", "10"))
+        if checkpoint_calls is None:
+            checkpoint_calls = int(os.getenv("CHECKPOINT_CALLS", "0"))
+        self.checkpoint_days = checkpoint_days
+        self.checkpoint_calls = checkpoint_calls
+        self._checkpoint_day = 0
+        self._checkpoint_calls_at = 0
+
+    def run_simulation(self, output_dir: str = "results", resume: bool = False) -> Dict:
         """
         전체 시뮬레이션 실행
 
+        Args:
+            output_dir: 결과 요약 저장 폴더 (None이면 파일을 저장하지 않음)
+            resume: True면 체크포인트의 다음 날부터 이어서 실행 (체크포인트가 없으면 처음부터)
+
         Returns:
             시뮬레이션 결과 요약
         """
@@ -79,59 +158,268 @@ class ConstructionSimulation:
         print(f"목표 공기: {self.context.target_days}일")
         print(f"{'='*60}\n")
 
-        for day in range(1, self.context.target_days + 1):
-            self.current_day = day
-            progress_rate = self.context.get_progress_rate(day)
-
-            # 1. 오늘 발생 가능한 이슈 필터링
-            candidate_issues = filter_issues_by_progress(self.all_issues, progress_rate)
+        if resume:
+            state = load_checkpoint(self.checkpoint_path) if self.checkpoint_path else None
+            if state is None:
+                print("체크포인트가 없어 처음부터 실행합니다.")
+            else:
+                self.restore_checkpoint(state)
+                if state["완료"]:
+                    print(f"이미 완료된 실행입니다 (체크포인트: {self.checkpoint_path}). 저장된 결과를 사용합니다.")
+                    return self.generate_summary()
+                print(f"체크포인트에서 이어서 실행: Day {self.current_day + 1}부터 ({self.checkpoint_path})")
+
+        if self.meeting_workers > 1:
+            self._meeting_executor = ThreadPoolExecutor(
+                max_workers=self.meeting_workers, thread_name_prefix="meeting"
+            )
+        if self.opinion_mode == "delphi" and self.backend.blocking_io:
+            # 토론 스레드마다 에이전트 1명분 의견을 동시에 받음 (토론 풀과 분리해 서로 기다리지 않게)
+            self._opinion_executor = ThreadPoolExecutor(
+                max_workers=max(self.meeting_workers, 1), thread_name_prefix="opinion"
+            )
 
-            # 2. 발생 여부 판단
-            occurred_issues = self.check_issue_occurrence(candidate_issues)
+        if self.occurrence == "geometric" and self._occurrence_schedule is None:
+            self._occurrence_schedule = self.sample_occurrence_schedule()
 
-            # 3. 이슈 상태 업데이트
-            status_changes = self.issue_manager.update_all_issues(day)
+        if self.checkpoint_path is not None and self.current_day == 0:
+            # 처음부터 실행: 이전 실행의 체크포인트를 시작 상태로 덮어씀 (첫 저장 전에 중단돼도 이전 결과로 이어지지 않게)
+            self.save_checkpoint()
 
-            # 4. 회의 진행 (새 이슈 또는 진행 중 이슈가 있을 때)
-            active_issues = self.issue_manager.get_active_issues()
-            if occurred_issues or active_issues:
-                meeting_result = self.conduct_meeting(occurred_issues, active_issues)
-                self.daily_logs.append(meeting_result)
+        try:
+            if self.engine == "event":
+                self.run_event_loop()
+            else:
+                self.run_day_loop()
+        except KeyboardInterrupt:
+            if self.checkpoint_path is not None and self._checkpoint_day:
+                print(f"\n중단됨: Day {self._checkpoint_day}까지 저장된 체크포인트({self.checkpoint_path})에서 "
+                      f"--resume으로 이어서 실행할 수 있습니다.")
+            raise
 
-                # 새 이슈 등록
-                for discussion in meeting_result.get("discussions", []):
-                    if discussion.get("type") == "신규":
-                        # 이슈 매니저에 추가
-                        issue_data = next(
-                            (i for i in occurred_issues if i["ID"] == discussion["issue_id"]),
-                            None
-                        )
-                        if issue_data:
-                            self.issue_manager.add_issue(
-                                issue_data,
-                                discussion["severity"],
-                                discussion["selected"],
-                                day
-                            )
+        for executor in (self._meeting_executor, self._opinion_executor):
+            if executor is not None:
+                executor.shutdown()
+        self._meeting_executor = self._opinion_executor = None
 
-            # 진행 상황 출력 (10일마다)
-            if day % 10 == 0:
-                print(f"Day {day}/{self.context.target_days} ({progress_rate*100:.1f}%) - "
-                      f"이슈: {len(active_issues)}개 진행 중")
+        # 스트리밍으로 먼저 받은 의견의 나머지 필드가 모두 채워질 때까지 대기 (회의 로그 완성)
+        self.backend.flush()
 
         # 시뮬레이션 종료
         print(f"\n{'='*60}")
         print("시뮬레이션 완료")
+        if self.metrics is not None and len(self.metrics):
+            self.metrics.print_summary()
         print(f"{'='*60}\n")
 
         # 결과 요약
         summary = self.generate_summary()
 
         # 결과 저장
-        self.save_results(output_dir, summary)
+        if output_dir is not None:
+            self.save_results(output_dir, summary)
+
+        # 완료 표시 (이어서 실행하면 다시 진행하지 않고 결과만 돌려줌)
+        if self.checkpoint_path is not None:
+            self.save_checkpoint(completed=True)
 
         return summary
 
+    def run_day_loop(self):
+        """1일부터 목표 공기까지 매일 진행"""
+        for day in range(self.current_day + 1, self.context.target_days + 1):
+            progress_rate = self.context.get_progress_rate(day)
+
+            if self._occurrence_schedule is not None:
+                # 1~2. 미리 뽑은 최초 발생일이 오늘인 이슈
+                occurred_issues = self._occurrence_schedule.get(day, [])
+            else:
+                # 1. 오늘 발생 가능한 이슈 필터링
+                candidate_issues = filter_issues_by_progress(self.all_issues, progress_rate)
+
+                # 2. 발생 여부 판단
+                occurred_issues = self.check_issue_occurrence(candidate_issues)
+
+            active_issues = self.simulate_day(day, occurred_issues)
+
+            # 진행 상황 출력 (10일마다)
+            if day % 10 == 0:
+                print(f"Day {day}/{self.context.target_days} ({progress_rate*100:.1f}%) - "
+                      f"이슈: {len(active_issues)}개 진행 중")
+
+            self.maybe_checkpoint(day)
+
+    def run_event_loop(self):
+        """
+        이벤트가 있는 날만 진행 (이산 사건 시뮬레이션)
+
+        이슈 상태가 바뀔 수 있는 날은 이슈 발생일(미리 추출), 해결 완료일(착수일과 예상 일수로 계산),
+        대기 이슈 착수 확인일(대기 이슈가 추가된 다음 날, 선행 이슈 / 동시 진행 제한 해제는 완료일에 함께 처리)뿐이다.
+        그 사이의 날은 진행 중 이슈의 작업일수만 늘어나므로 다음 이벤트일에 한꺼번에 반영한다.
+        결과 요약은 같은 시드의 일별 진행(geometric)과 같고, 회의 로그에는 이벤트가 있는 날만 기록된다.
+        """
+        target_days = self.context.target_days
+        if self._events is None:
+            self._events = []  # (일자, 종류, 이슈 ID)
+            for day, issues in self._occurrence_schedule.items():
+                for issue in issues:
+                    heapq.heappush(self._events, (day, "발생", issue["ID"]))
+        events = self._events
+
+        while events:
+            day = events[0][0]
+            if day > target_days:
+                break
+            while events and events[0][0] == day:
+                heapq.heappop(events)
+
+            started = {issue.id for issue in self.issue_manager.issues_by_status["해결중"]}
+            self.issue_manager.catch_up(day - 1)
+            active_issues = self.simulate_day(day, self._occurrence_schedule.get(day, []))
+            self.event_days += 1
+
+            # 새로 착수한 이슈의 완료일, 대기 이슈가 새로 생겼으면 다음 날 착수 확인
+            for issue in self.issue_manager.issues_by_status["해결중"]:
+                if issue.id not in started:
+                    completion = issue.completion_day()
+                    if completion is not None:
+                        heapq.heappush(events, (completion, "완료", issue.id))
+            if any(issue.detected_day == day for issue in self.issue_manager.issues_by_status["대기중"]):
+                heapq.heappush(events, (day + 1, "착수확인", ""))
+
+            # 진행 상황 출력 (10일 단위를 지날 때마다)
+            if day // 10 > self._last_report:
+                self._last_report = day // 10
+                print(f"Day {day}/{target_days} ({self.context.get_progress_rate(day)*100:.1f}%) - "
+                      f"이슈: {len(active_issues)}개 진행 중")
+
+            self.maybe_checkpoint(day)
+
+        # 마지막 날까지의 작업 반영
+        self.current_day = target_days
+        self.issue_manager.catch_up(target_days)
+        print(f"이벤트 처리: {self.event_days}일 / 전체 {target_days}일")
+
+    def maybe_checkpoint(self, day: int):
+        """저장 간격(일수 / LLM 호출 건수)에 도달했으면 체크포인트 저장"""
+        if self.checkpoint_path is None:
+            return
+        due_days = self.checkpoint_days > 0 and day - self._checkpoint_day >= self.checkpoint_days
+        calls = len(self.metrics) if self.metrics is not None else 0
+        due_calls = self.checkpoint_calls > 0 and calls - self._checkpoint_calls_at >= self.checkpoint_calls
+        if due_days or due_calls:
+            self.save_checkpoint()
+
+    def checkpoint_fingerprint(self) -> Dict:
+        """이어서 실행할 수 있는지 확인하는 실행 설정"""
+        return {
+            "공법": self.method,
+            "케이스": self.context.case,
+            "목표공기": self.context.target_days,
+            "발생판정": self.occurrence,
+            "진행방식": self.engine,
+            "의견수렴": self.opinion_mode,
+            "조정기준": self.delphi_threshold,
+            "의견백엔드": self.backend.name,
+            "스트리밍": getattr(self.backend, "stream", False),
+            "묶음요청": self.backend.multi_issue,
+            "시드": self.seed,
+            "카드원본": card_source(),
+            "이슈카드": [issue["ID"] for issue in self.all_issues],
+        }
+
+    def save_checkpoint(self, completed: bool = False) -> Path:
+        """
+        마지막으로 끝난 날(current_day)까지의 상태 저장
+
+        스트리밍으로 나중에 채워지는 의견까지 회의 로그에 반영한 뒤 저장한다.
+        """
+        self.backend.flush()
+        state = {
+            "설정": self.checkpoint_fingerprint(),
+            "완료": completed,
+            "일자": self.current_day,
+            "누적지연": self.total_delay_days,
+            "누적비용증가": self.total_cost_increase_pct,
+            "난수": self.rng,
+            "이슈관리": self.issue_manager,
+            "회의로그": self.daily_logs,
+            "발생일정": (
+                None if self._occurrence_schedule is None
+                else {day: [issue["ID"] for issue in issues] for day, issues in self._occurrence_schedule.items()}
+            ),
+            "이벤트": self._events,
+            "이벤트일수": self.event_days,
+            "진행출력": self._last_report,
+            "LLM호출기록": list(self.metrics.events) if self.metrics is not None else [],
+        }
+        path = write_checkpoint(self.checkpoint_path, state)
+        self._checkpoint_day = self.current_day
+        self._checkpoint_calls_at = len(self.metrics) if self.metrics is not None else 0
+        return path
+
+    def restore_checkpoint(self, state: Dict):
+        """체크포인트 상태 복원 (설정이 다르면 ValueError)"""
+        fingerprint = self.checkpoint_fingerprint()
+        if state["설정"] != fingerprint:
+            changed = [key for key in fingerprint if state["설정"].get(key) != fingerprint[key]]
+            raise ValueError(f"체크포인트와 실행 설정이 다릅니다: {', '.join(changed)} ({self.checkpoint_path})")
+
+        self.current_day = state["일자"]
+        self.total_delay_days = state["누적지연"]
+        self.total_cost_increase_pct = state["누적비용증가"]
+        self.rng = state["난수"]
+        self.issue_manager = state["이슈관리"]
+        self.daily_logs = state["회의로그"]
+        if state["발생일정"] is not None:
+            by_id = {issue["ID"]: issue for issue in self.all_issues}
+            self._occurrence_schedule = {
+                day: [by_id[issue_id] for issue_id in ids] for day, ids in state["발생일정"].items()
+            }
+        self._events = state["이벤트"]
+        self.event_days = state["이벤트일수"]
+        self._last_report = state["진행출력"]
+        if self.metrics is not None:
+            self.metrics.events[:0] = state["LLM호출기록"]
+        self._checkpoint_day = self.current_day
+        self._checkpoint_calls_at = len(self.metrics) if self.metrics is not None else 0
+
+    def simulate_day(self, day: int, occurred_issues: List[Dict]) -> List:
+        """
+        하루 진행 (이슈 상태 업데이트 → 회의 → 신규 이슈 등록)
+
+        Returns:
+            회의에 올라간 진행 중 이슈 목록
+        """
+        self.current_day = day
+
+        # 3. 이슈 상태 업데이트
+        status_changes = self.issue_manager.update_all_issues(day)
+
+        # 4. 회의 진행 (새 이슈 또는 진행 중 이슈가 있을 때)
+        active_issues = self.issue_manager.get_active_issues()
+        if occurred_issues or active_issues:
+            meeting_result = self.conduct_meeting(occurred_issues, active_issues)
+            self.daily_logs.append(meeting_result)
+
+            # 새 이슈 등록
+            for discussion in meeting_result.get("discussions", []):
+                if discussion.get("type") == "신규":
+                    # 이슈 매니저에 추가
+                    issue_data = next(
+                        (i for i in occurred_issues if i["ID"] == discussion["issue_id"]),
+                        None
+                    )
+                    if issue_data:
+                        self.issue_manager.add_issue(
+                            issue_data,
+                            discussion["severity"],
+                            discussion["selected"],
+                            day
+                        )
+
+        return active_issues
+
     def check_issue_occurrence(self, candidates: List[Dict]) -> List[Dict]:
         """
         이슈 발생 여부 판단
@@ -143,23 +431,41 @@ class ConstructionSimulation:
             실제 발생한 이슈 목록
         """
         occurred = []
+        # 이슈별 확률 (공법 / 케이스 / KPI 값별로 한 번 계산된 표)
+        probabilities = self.context.issue_probabilities(self.all_issues)
 
         for issue in candidates:
             # 이미 발생한 이슈는 제외
             if issue["ID"] in self.issue_manager.occurred_issue_ids:
                 continue
 
-            # 확률 계산
-            prob = calculate_issue_probability(
-                issue, self.context.kpi_values, self.method
-            )
+            prob = probabilities[issue["ID"]]
 
-            # 발생 여부 (난수)
-            if random.random() < prob:
+            # 발생 여부 (이슈별 난수 스트림)
+            if self.rng.random(issue["ID"]) < prob:
                 occurred.append(issue)
 
         return occurred
 
+    def sample_occurrence_schedule(self) -> Dict[int, List[Dict]]:
+        """
+        이슈별 최초 발생일 추출 (geometric 방식)
+
+        이슈마다 자기 난수 스트림에서 균등 난수 1개를 뽑아 기하분포로 변환한다.
+
+        Returns:
+            {발생일: [이슈, ...]} (같은 날 발생한 이슈는 카드 순서)
+        """
+        start, length = occurrence_windows(self.all_issues, self.context.target_days)
+        probabilities = issue_probabilities(self.all_issues, self.context.kpi_values, self.method)
+        uniforms = np.array([self.rng.issue_stream(issue["ID"]).random() for issue in self.all_issues])
+
+        schedule: Dict[int, List[Dict]] = {}
+        for issue, day in zip(self.all_issues, first_occurrence_days(probabilities, start, length, uniforms)):
+            if day:
+                schedule.setdefault(int(day), []).append(issue)
+        return schedule
+
     def conduct_meeting(
         self, new_issues: List[Dict], active_issues: List
     ) -> Dict:
@@ -175,6 +481,7 @@ class ConstructionSimulation:
         """
         # 프로젝트 컨텍스트 준비
         meeting_context = {
+            "method": self.method,
             "current_day": self.current_day,
             "progress_rate": self.context.get_progress_rate(self.current_day),
             "project_summary": self.context.to_summary_dict()["기본정보"],
@@ -193,6 +500,12 @@ class ConstructionSimulation:
             new_issues=new_issues,
             active_issues=active_issues,
             method=self.method,
+            backend=self.backend,
+            executor=self._meeting_executor,
+            opinion_mode=self.opinion_mode,
+            opinion_executor=self._opinion_executor,
+            delphi_threshold=self.delphi_threshold,
+            multi_issue=self.backend.multi_issue,
         )
 
         result = meeting.run()
@@ -236,6 +549,9 @@ class ConstructionSimulation:
         meeting_log_data = {
             "시뮬레이션정보": {
                 "공법": self.method,
+                "시드": self.rng.seed,
+                "발생판정": self.occurrence,
+                "진행방식": self.engine,
                 "시작일": timestamp,
                 "총일수": len(self.daily_logs),
             },
@@ -267,6 +583,15 @@ class ConstructionSimulation:
         with open(result_file, "w", encoding="utf-8") as f:
             json.dump(summary, f, ensure_ascii=False, indent=2)
 
-        print(f"결과 요약 저장 완료: {result_file}\n")
+        print(f"결과 요약 저장 완료: {result_file}")
+
+        # 4. results/ 폴더에 LLM 호출 비용/지연 리포트 저장
+        if self.metrics is not None and len(self.metrics):
+            metrics_file = self.metrics.save(
+                result_dir / f"llm_metrics_{self.method}_{timestamp}.json",
+                info={"공법": self.method, "시작일": timestamp, "모델": self.metrics.events[0].get("model")},
+            )
+            print(f"LLM 호출 리포트 저장 완료: {metrics_file}")
+        print()
 
         return timestamp  # 타임스탬프 반환 (비교 리포트용)
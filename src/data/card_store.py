@@ -0,0 +1,89 @@
+"""
+이슈 카드 열 저장소 (struct of arrays)
+
+카드 목록(딕셔너리 + 중첩 "가중치" 딕셔너리)을 공법별로 한 번 NumPy 배열로 바꿔 둔다.
+확률 / 발생 구간 / 지연·비용 범위를 카드 전체에 대해 배열 연산으로 계산할 때 사용한다
+(calculate_issue_probabilities, occurrence_sampler).
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+from ..config.case_mapping import KPI_NORMALIZATION
+from .issue_cards import get_progress_index
+
+
+# 심각도 코드 (알 수 없는 값은 0)
+SEVERITY_CODES = {"S1": 1, "S2": 2, "S3": 3}
+
+
+class IssueCardStore:
+    """
+    공법별 이슈 카드 배열 (카드 순서는 원래 목록과 같음)
+
+    Attributes:
+        ids: 이슈 ID 목록
+        kpi_names: 가중치 / KPI 열 순서 (KPI_NORMALIZATION[method] 순서)
+        base_probability: 기본 발생 확률 (발생확률(%) / 100)
+        weights: (카드 수, KPI 수) KPI별 가중치 (없는 KPI는 0)
+        weight_sum: 카드별 가중치 합 (카드의 "가중치" 값 전체)
+        window_min, window_max: 공정률 구간 (%) (형식이 잘못된 범위는 -1, has_window False)
+        delay_min, delay_max: 지연 범위 (주)
+        cost_min, cost_max: 비용 증가 범위 (%)
+        severity: 심각도 코드 (SEVERITY_CODES)
+    """
+
+    def __init__(self, issues: List[Dict], method: str):
+        self.issues = issues
+        self.method = method
+        self.ids = [issue["ID"] for issue in issues]
+        self.kpi_names = tuple(KPI_NORMALIZATION[method])
+
+        self.base_probability = np.array([issue["발생확률(%)"] / 100.0 for issue in issues], dtype=float)
+        self.weights = np.array(
+            [[issue.get("가중치", {}).get(name, 0.0) for name in self.kpi_names] for issue in issues],
+            dtype=float,
+        ).reshape(len(issues), len(self.kpi_names))
+        # 스칼라 계산과 같은 값이 되도록 파이썬 sum으로 (가중치 딕셔너리 순서)
+        self.weight_sum = np.array([sum(issue.get("가중치", {}).values()) for issue in issues], dtype=float)
+
+        intervals = get_progress_index(issues).intervals
+        self.has_window = np.array([interval is not None for interval in intervals], dtype=bool)
+        self.window_min = np.array([interval[0] if interval else -1 for interval in intervals], dtype=np.int64)
+        self.window_max = np.array([interval[1] if interval else -1 for interval in intervals], dtype=np.int64)
+
+        self.delay_min = np.array([issue["지연(주)_Min"] for issue in issues], dtype=float)
+        self.delay_max = np.array([issue["지연(주)_Max"] for issue in issues], dtype=float)
+        self.cost_min = np.array([issue["비용증가(%)_Min"] for issue in issues], dtype=float)
+        self.cost_max = np.array([issue["비용증가(%)_Max"] for issue in issues], dtype=float)
+        self.severity = np.array([SEVERITY_CODES.get(issue.get("심각도"), 0) for issue in issues], dtype=np.int8)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def kpi_vector(self, kpi_values: Dict[str, float]) -> np.ndarray:
+        """KPI 딕셔너리 → kpi_names 순서의 벡터 (모든 KPI 필요)"""
+        return np.array([kpi_values[name] for name in self.kpi_names], dtype=float)
+
+
+# 목록 객체별 저장소 (최근 몇 개만 유지)
+_STORE_CACHE: Dict[tuple, IssueCardStore] = {}
+_STORE_CACHE_SIZE = 8
+
+
+def get_card_store(issues: List[Dict], method: str) -> IssueCardStore:
+    """
+    이슈 목록의 열 저장소 (같은 목록 객체 / 공법이면 다시 만들지 않음)
+
+    get_progress_index와 같이 이슈를 추가/삭제하면 다시 만들고, 카드 값을 직접 고친 경우는 새 목록을 넘겨야 한다.
+    """
+    key = (id(issues), method)
+    store = _STORE_CACHE.get(key)
+    if store is None or store.issues is not issues or len(store) != len(issues):
+        store = IssueCardStore(issues, method)
+        _STORE_CACHE.pop(key, None)
+        if len(_STORE_CACHE) >= _STORE_CACHE_SIZE:
+            _STORE_CACHE.pop(next(iter(_STORE_CACHE)))
+        _STORE_CACHE[key] = store
+    return store
@@ -0,0 +1,160 @@
+"""
+연구 엑셀 통합 문서에서 이슈 카드 직접 읽기
+
+"이슈 카드_BIM 사용 / 미사용" 시트를 pandas로 읽어 열을 검증하고, 시뮬레이션에 쓰는 열만 남겨
+normalize_issues로 정규화한다 (빈 행, "보상" / "페널티" / "4열"~"10열" 같은 정리용 열은 버림).
+결과는 issue_cards의 스냅샷에 저장되어 통합 문서의 내용(SHA-256)이 바뀔 때까지 재사용되므로
+pandas / openpyxl은 통합 문서를 처음 읽거나 고친 뒤에만 필요하다.
+"""
+
+import io
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .issue_cards import DATA_DIR, ISSUE_CARD_FILES, normalize_issues, parse_progress_range
+
+
+DEFAULT_WORKBOOK = DATA_DIR.parent.parent / "BIM 효과 정량화를 위한 멀티 에이전트 시뮬레이션 연구.xlsx"
+
+# 공법별 이슈 카드 시트 이름 (카드 수 표기 등 뒷부분은 달라도 됨)
+ISSUE_SHEET_PREFIXES = {
+    "BIM": "이슈 카드_BIM 사용",
+    "TRADITIONAL": "이슈 카드_BIM 미사용",
+}
+
+# 시뮬레이션에 쓰는 열 (JSON 원본과 같은 순서, 가중치 열 위치에 공법별 가중치 4개)
+CARD_COLUMNS = [
+    "ID", "이슈명", "카테고리", "심각도", "발생단계",
+    "지연(주)\nMin", "지연(주)\nMax", "비용증가(%)\nMin", "비용증가(%)\nMax",
+    "상세설명", "이슈탐지율\n(%)", "가중치", "발생확률\n(%)", "공정률",
+]
+NUMBER_COLUMNS = [
+    "지연(주)\nMin", "지연(주)\nMax", "비용증가(%)\nMin", "비용증가(%)\nMax",
+    "이슈탐지율\n(%)", "발생확률\n(%)",
+]
+WEIGHT_COLUMNS = {
+    "BIM": ["WD\n가중치", "CD\n가중치", "AF\n가중치", "PL\n가중치"],
+    "TRADITIONAL": ["RR\n가중치", "SR\n가중치", "CR\n가중치", "FC\n가중치"],
+}
+
+# 오류가 많을 때 메시지에 표시할 최대 개수
+MAX_REPORTED_ERRORS = 20
+
+
+def workbook_path() -> Path:
+    """이슈 카드 통합 문서 경로 (ISSUE_CARD_WORKBOOK, 기본은 저장소 루트의 연구 엑셀 파일)"""
+    return Path(os.getenv("ISSUE_CARD_WORKBOOK") or str(DEFAULT_WORKBOOK))
+
+
+def _import_pandas():
+    try:
+        import pandas as pd
+    except ImportError as e:
+        raise ImportError(
+            "엑셀 통합 문서에서 이슈 카드를 읽으려면 pandas와 openpyxl이 필요합니다: pip install pandas openpyxl"
+        ) from e
+    return pd
+
+
+def card_columns(method: str) -> List[str]:
+    """공법별 카드 열 목록"""
+    columns = []
+    for column in CARD_COLUMNS:
+        columns.extend(WEIGHT_COLUMNS[method] if column == "가중치" else [column])
+    return columns
+
+
+def find_issue_sheet(sheet_names: List[str], method: str) -> str:
+    """공법별 이슈 카드 시트 이름 찾기"""
+    prefix = ISSUE_SHEET_PREFIXES[method]
+    matches = [name for name in sheet_names if name.strip().startswith(prefix)]
+    if len(matches) != 1:
+        raise ValueError(f"'{prefix}'로 시작하는 시트가 {len(matches)}개입니다 (시트 목록: {sheet_names})")
+    return matches[0]
+
+
+def read_issue_records(data: bytes, method: str) -> List[Dict]:
+    """
+    통합 문서 내용에서 공법별 이슈 카드 시트를 읽어 검증
+
+    Args:
+        data: .xlsx 파일 내용
+        method: "BIM" 또는 "TRADITIONAL"
+
+    Returns:
+        카드별 {열 이름: 값} 목록 (시뮬레이션에 쓰는 열만, 빈 칸은 키 없음, 숫자 열은 float)
+
+    Raises:
+        ValueError: 시트 / 필요한 열이 없거나, ID가 비었거나 중복, 숫자 열에 숫자가 아닌 값,
+                    공정률 범위 형식 오류 (문제가 된 엑셀 행 번호와 함께 한 번에 보고)
+    """
+    pd = _import_pandas()
+    with pd.ExcelFile(io.BytesIO(data), engine="openpyxl") as workbook:
+        sheet = find_issue_sheet(workbook.sheet_names, method)
+        frame = workbook.parse(sheet)
+
+    # 줄바꿈이 \r\n으로 저장된 머리글도 같은 열로 취급
+    frame.columns = [str(column).replace("\r\n", "\n").strip() for column in frame.columns]
+    columns = card_columns(method)
+    missing = [column for column in columns if column not in frame.columns]
+    if missing:
+        raise ValueError(f"'{sheet}' 시트에 필요한 열이 없습니다: {missing}")
+
+    frame = frame[columns].dropna(how="all")
+    # 엑셀 행 번호 (머리글이 1행)
+    rows = frame.index + 2
+    errors = []
+
+    blank_ids = frame["ID"].isna()
+    errors += [f"{row}행: ID가 비어 있습니다" for row in rows[blank_ids]]
+    duplicated = frame["ID"].duplicated(keep=False) & ~blank_ids
+    errors += [f"{row}행: ID가 중복됩니다 ({issue_id})" for row, issue_id in zip(rows[duplicated], frame["ID"][duplicated])]
+
+    for column in NUMBER_COLUMNS + WEIGHT_COLUMNS[method]:
+        numbers = pd.to_numeric(frame[column], errors="coerce")
+        invalid = frame[column].notna() & numbers.isna()
+        label = column.replace("\n", " ")
+        errors += [f"{row}행: '{label}' 값이 숫자가 아닙니다 ({value!r})"
+                   for row, value in zip(rows[invalid], frame[column][invalid])]
+        frame[column] = numbers.astype(float)
+
+    for row, value in zip(rows, frame["공정률"]):
+        if value == value:  # 빈 칸은 normalize_issues 기본값 사용
+            try:
+                parse_progress_range(value)
+            except ValueError as e:
+                errors.append(f"{row}행: 공정률 {e}")
+
+    if errors:
+        shown = "\n".join(f"  - {error}" for error in errors[:MAX_REPORTED_ERRORS])
+        more = f"\n  ... 외 {len(errors) - MAX_REPORTED_ERRORS}건" if len(errors) > MAX_REPORTED_ERRORS else ""
+        raise ValueError(f"'{sheet}' 시트 검증 실패 ({len(errors)}건)\n{shown}{more}")
+
+    return [{key: value for key, value in record.items() if value == value}
+            for record in frame.to_dict("records")]
+
+
+def read_issue_sheet(data: bytes, method: str) -> List[Dict]:
+    """통합 문서 내용 → 정규화된 이슈 목록 (JSON 원본을 normalize_issues로 읽은 것과 같은 형식)"""
+    return normalize_issues(read_issue_records(data, method), method)
+
+
+def export_raw_json(path: Optional[Path] = None, data_dir: Path = DATA_DIR) -> Dict[str, Path]:
+    """
+    통합 문서의 이슈 카드 시트를 검증해 src/data/*_issues_raw.json으로 내보내기 (시뮬레이션에 쓰는 열만)
+
+    Returns:
+        공법별 저장 경로
+    """
+    data = Path(path or workbook_path()).read_bytes()
+    records = {method: read_issue_records(data, method) for method in ISSUE_CARD_FILES}
+
+    written = {}
+    for method, filename in ISSUE_CARD_FILES.items():
+        target = Path(data_dir) / filename
+        with open(target, "w", encoding="utf-8") as f:
+            json.dump(records[method], f, ensure_ascii=False, indent=2)
+        written[method] = target
+    return written
@@ -1,30 +1,142 @@
 """
 이슈 카드 데이터베이스
 엑셀에서 추출한 90개 이슈 데이터 로드
+
+- 공법별로 처음 사용할 때 로드 (import 시에는 읽지 않음)
+- 원본은 JSON(기본) 또는 연구 엑셀 통합 문서(ISSUE_CARD_SOURCE=excel, excel_loader)
+- 정규화한 카드를 pickle 스냅샷(.cache/issue_cards/)에 저장하고, 원본의 수정 시각 / 크기가 같으면
+  스냅샷을 그대로 사용 (다르면 SHA-256을 비교해 내용이 바뀐 경우에만 다시 정규화)
+- 프로세스 풀 실행 전 preload_issue_cards로 부모 프로세스에서 로드해 두면 작업 프로세스가 fork로 공유하고,
+  spawn 방식이어도 최신 스냅샷을 읽기만 한다 (카드 목록은 읽기 전용으로 사용)
 """
 
+import hashlib
 import json
+import math
+import os
+import pickle
+import tempfile
 from pathlib import Path
-from typing import List, Dict
+from typing import Callable, List, Dict, Iterable, Optional, Tuple
 
 
-def load_issues_from_json() -> tuple:
-    """JSON 파일에서 이슈 데이터 로드"""
-    data_dir = Path(__file__).parent
+DATA_DIR = Path(__file__).parent
+ISSUE_CARD_FILES = {
+    "BIM": "bim_issues_raw.json",
+    "TRADITIONAL": "traditional_issues_raw.json",
+}
+ISSUE_CARD_SOURCES = ("json", "excel")
+# 정규화 방식이 바뀌면 올려서 기존 스냅샷 무효화
+SNAPSHOT_VERSION = 1
+
+# 공법별 로드된 카드
+_ISSUES: Dict[str, List[Dict]] = {}
+
+
+def card_source() -> str:
+    """카드 원본 (ISSUE_CARD_SOURCE: json(기본, src/data/*_issues_raw.json) / excel(연구 엑셀 통합 문서))"""
+    source = os.getenv("ISSUE_CARD_SOURCE", "json")
+    if source not in ISSUE_CARD_SOURCES:
+        raise ValueError(f"ISSUE_CARD_SOURCE는 {ISSUE_CARD_SOURCES} 중 하나여야 합니다: {source}")
+    return source
+
+
+def snapshot_path(method: str, source: str = "json") -> Path:
+    """공법 / 원본별 카드 스냅샷 경로 (ISSUE_CARD_CACHE_DIR, 기본 .cache/issue_cards)"""
+    return Path(os.getenv("ISSUE_CARD_CACHE_DIR", ".cache/issue_cards")) / f"{method.lower()}_{source}.pkl"
+
+
+def _read_snapshot(path: Path) -> Optional[Dict]:
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def _write_snapshot(path: Path, snapshot: Dict):
+    """임시 파일에 쓴 뒤 교체 (동시에 여러 프로세스가 써도 깨진 파일을 읽지 않음, 실패해도 무시)"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+    except OSError:
+        pass
+
+
+def load_cached_cards(path: Path, source: Path, build: Callable[[bytes], List[Dict]]) -> List[Dict]:
+    """
+    스냅샷에서 카드 로드 (원본의 수정 시각 / 크기가 같으면 그대로, 다르면 SHA-256이 같을 때만 재사용)
+
+    Args:
+        path: 스냅샷 경로
+        source: 원본 파일
+        build: 원본 내용(bytes) → 정규화된 카드 목록 (스냅샷을 쓸 수 없을 때만 호출)
+
+    LLM_CACHE처럼 ISSUE_CARD_CACHE=0이면 스냅샷을 쓰지 않는다.
+    """
+    use_snapshot = os.getenv("ISSUE_CARD_CACHE", "1") != "0"
+    stat = source.stat()
+    signature = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+    snapshot = _read_snapshot(path) if use_snapshot else None
+    if snapshot is not None and snapshot.get("source") == str(source) and snapshot["signature"] == signature:
+        return snapshot["issues"]
+
+    data = source.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    if snapshot is not None and snapshot.get("sha256") == digest:
+        # 수정 시각만 바뀜 (checkout, 복사 등) → 정규화 결과 재사용
+        issues = snapshot["issues"]
+    else:
+        issues = build(data)
+
+    if use_snapshot:
+        _write_snapshot(path, {
+            "version": SNAPSHOT_VERSION,
+            "source": str(source),
+            "signature": signature,
+            "sha256": digest,
+            "issues": issues,
+        })
+    return issues
+
+
+def load_issue_cards(method: str, source: Optional[str] = None) -> List[Dict]:
+    """
+    공법별 이슈 카드 로드 (스냅샷 → 없거나 원본이 바뀌었으면 원본을 읽어 정규화 후 스냅샷 저장)
+
+    Args:
+        method: "BIM" 또는 "TRADITIONAL"
+        source: "json" / "excel" (None이면 ISSUE_CARD_SOURCE)
+    """
+    if method not in ISSUE_CARD_FILES:
+        raise ValueError(f"Invalid method: {method}")
+    source = source or card_source()
+
+    if source == "excel":
+        from .excel_loader import read_issue_sheet, workbook_path
 
-    # BIM 이슈
-    with open(data_dir / 'bim_issues_raw.json', 'r', encoding='utf-8') as f:
-        bim_raw = json.load(f)
+        return load_cached_cards(snapshot_path(method, source), workbook_path(),
+                                 lambda data: read_issue_sheet(data, method))
 
-    # 전통 이슈
-    with open(data_dir / 'traditional_issues_raw.json', 'r', encoding='utf-8') as f:
-        trad_raw = json.load(f)
+    return load_cached_cards(snapshot_path(method, source), DATA_DIR / ISSUE_CARD_FILES[method],
+                             lambda data: normalize_issues(json.loads(data.decode("utf-8")), method))
 
-    # 데이터 정규화
-    bim_issues = normalize_issues(bim_raw, "BIM")
-    trad_issues = normalize_issues(trad_raw, "TRADITIONAL")
 
-    return bim_issues, trad_issues
+def load_issues_from_json() -> tuple:
+    """JSON 파일에서 이슈 데이터 로드 (BIM, 전통)"""
+    return get_issues_by_method("BIM"), get_issues_by_method("TRADITIONAL")
 
 
 def normalize_issues(raw_data: List[Dict], method: str) -> List[Dict]:
@@ -86,18 +198,115 @@ def normalize_issues(raw_data: List[Dict], method: str) -> List[Dict]:
     return normalized
 
 
-# 전역 변수로 로드
-BIM_ISSUES, TRADITIONAL_ISSUES = load_issues_from_json()
+def parse_progress_range(range_str: str) -> Tuple[int, int]:
+    """
+    공정률 범위 문자열 파싱 ("0-25" → (0, 25))
+
+    Raises:
+        ValueError: "정수-정수" 형식이 아니거나 시작이 끝보다 클 때
+    """
+    parts = str(range_str).split("-")
+    if len(parts) != 2:
+        raise ValueError(f"'시작-끝' 형식이 아닙니다: '{range_str}'")
+    min_p, max_p = int(parts[0]), int(parts[1])
+    if min_p > max_p:
+        raise ValueError(f"시작({min_p})이 끝({max_p})보다 큽니다: '{range_str}'")
+    return min_p, max_p
+
+
+class ProgressIndex:
+    """
+    공정률 구간 색인
+
+    이슈별 공정률 범위를 한 번만 파싱해 정수 % 단위 버킷에 넣어 두고, 공정률 x의 후보 이슈를
+    버킷 하나로 찾는다 (매칭되는 이슈 수에 비례, 판정은 filter_issues_by_progress와 같음).
+    범위가 정수이므로 min <= x <= max 는
+    - x가 정수: x를 포함하는 이슈 (버킷 _at[x])
+    - x가 정수가 아님: floor(x)와 floor(x)+1을 모두 포함하는 이슈 (버킷 _between[floor(x)])
+    0~100%를 벗어난 공정률은 전체 구간을 직접 비교한다.
+    """
+
+    def __init__(self, issues: List[Dict]):
+        self.issues = issues
+        self.intervals: List[Optional[Tuple[int, int]]] = []
+        self.malformed: List[Tuple[str, str, str]] = []  # (ID, 공정률, 사유)
+        self._at = [[] for _ in range(101)]
+        self._between = [[] for _ in range(100)]
+
+        for issue in issues:
+            try:
+                min_p, max_p = parse_progress_range(issue.get("공정률", ""))
+            except ValueError as e:
+                self.intervals.append(None)
+                self.malformed.append((issue.get("ID", ""), str(issue.get("공정률")), str(e)))
+                continue
+            self.intervals.append((min_p, max_p))
+            for pct in range(max(min_p, 0), min(max_p, 100) + 1):
+                self._at[pct].append(issue)
+            for pct in range(max(min_p, 0), min(max_p, 100)):
+                self._between[pct].append(issue)
+
+    def candidates(self, progress_rate: float) -> List[Dict]:
+        """현재 공정률(0.0 ~ 1.0)에 해당하는 이슈 목록 (원래 순서)"""
+        progress_pct = progress_rate * 100
+        if not 0 <= progress_pct <= 100:
+            return [issue for issue, interval in zip(self.issues, self.intervals)
+                    if interval is not None and interval[0] <= progress_pct <= interval[1]]
+        floor_pct = math.floor(progress_pct)
+        if floor_pct == progress_pct:
+            return list(self._at[floor_pct])
+        return list(self._between[floor_pct])
+
+    def report(self, label: str = ""):
+        """형식이 잘못된 공정률 범위 출력 (해당 이슈는 발생하지 않음)"""
+        for issue_id, range_str, reason in self.malformed:
+            print(f"⚠️ {label} 이슈 {issue_id}: 공정률 범위가 잘못되어 제외됩니다 ({reason})")
+
+
+# 목록 객체별 색인 (최근 몇 개만 유지)
+_INDEX_CACHE: Dict[int, ProgressIndex] = {}
+_INDEX_CACHE_SIZE = 8
+
+
+def get_progress_index(issues: List[Dict]) -> ProgressIndex:
+    """
+    이슈 목록의 공정률 색인 (같은 목록 객체면 다시 만들지 않음)
+
+    목록에 이슈를 추가/삭제하면 다시 만들고, 이슈의 공정률을 직접 고친 경우는 새 목록을 넘겨야 한다.
+    """
+    index = _INDEX_CACHE.get(id(issues))
+    if index is None or index.issues is not issues or len(index.intervals) != len(issues):
+        index = ProgressIndex(issues)
+        _INDEX_CACHE.pop(id(issues), None)
+        if len(_INDEX_CACHE) >= _INDEX_CACHE_SIZE:
+            _INDEX_CACHE.pop(next(iter(_INDEX_CACHE)))
+        _INDEX_CACHE[id(issues)] = index
+    return index
 
 
 def get_issues_by_method(method: str) -> List[Dict]:
-    """공법에 따른 이슈 목록 반환"""
-    if method == "BIM":
-        return BIM_ISSUES
-    elif method == "TRADITIONAL":
-        return TRADITIONAL_ISSUES
-    else:
-        raise ValueError(f"Invalid method: {method}")
+    """공법에 따른 이슈 목록 반환 (처음 호출 시 로드하고 공정률 범위 오류 보고)"""
+    issues = _ISSUES.get(method)
+    if issues is None:
+        issues = load_issue_cards(method)
+        get_progress_index(issues).report(method)
+        _ISSUES[method] = issues
+    return issues
+
+
+def preload_issue_cards(methods: Iterable[str]):
+    """프로세스 풀을 만들기 전에 부모 프로세스에서 카드 로드 (작업 프로세스가 공유)"""
+    for method in methods:
+        get_issues_by_method(method)
+
+
+def __getattr__(name: str):
+    # 이전 전역 변수 (BIM_ISSUES, TRADITIONAL_ISSUES) 호환
+    if name == "BIM_ISSUES":
+        return get_issues_by_method("BIM")
+    if name == "TRADITIONAL_ISSUES":
+        return get_issues_by_method("TRADITIONAL")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_issue_by_id(issue_id: str, method: str) -> Dict:
@@ -119,21 +328,7 @@ def filter_issues_by_progress(issues: List[Dict], progress_rate: float) -> List[
 
     Returns:
         해당 공정률 범위의 이슈 목록
-    """
-    filtered = []
-    progress_pct = progress_rate * 100
-
-    for issue in issues:
-        range_str = issue["공정률"]
-        try:
-            parts = range_str.split("-")
-            min_p = int(parts[0])
-            max_p = int(parts[1])
 
-            if min_p <= progress_pct <= max_p:
-                filtered.append(issue)
-        except:
-            # 파싱 실패 시 무시
-            continue
-
-    return filtered
+    범위는 목록별 ProgressIndex에 한 번만 파싱해 두고, 형식이 잘못된 범위의 이슈는 제외된다.
+    """
+    return get_progress_index(issues).candidates(progress_rate)
@@ -1,4 +1,5 @@
 """Utils module"""
-from .llm_client import LLMClient
+from .llm_client import LLMClient, get_llm_client, set_llm_client
+from .llm_metrics import LLMMetrics
 
-__all__ = ["LLMClient"]
+__all__ = ["LLMClient", "get_llm_client", "set_llm_client", "LLMMetrics"]
@@ -0,0 +1,195 @@
+"""
+LLM 응답 JSON 파싱 / 복구 / 스키마 검증
+
+- 빠른 파싱: orjson이 설치되어 있으면 사용 (없으면 표준 json)
+- 복구: 코드 블록(```json), 앞뒤 설명 문장, 잘린 응답(닫히지 않은 문자열/괄호, 끝의 쉼표)을 고쳐 다시 파싱
+- 스키마: 필드별 타입 변환 (severity_assessment는 "7", "7/10", "7점", 7.5 등을 1~10 숫자로)
+"""
+
+import json
+import re
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+
+# 파싱 결과 상태
+PARSE_OK = "ok"
+PARSE_REPAIRED = "repaired"
+PARSE_FAILED = "failed"
+
+
+def fast_loads(text: str):
+    """JSON 문자열 파싱 (orjson 우선, 실패 시 ValueError)"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _try_loads(text: str) -> Optional[Dict]:
+    try:
+        data = fast_loads(text)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _strip_code_fence(text: str) -> str:
+    """```json ... ``` 코드 블록 안쪽만 추출"""
+    match = re.search(r"```(?:json)?\s*(.*?)(?:```|$)", text, re.DOTALL)
+    return match.group(1) if match else text
+
+
+def _scan_object(text: str, start: int) -> Tuple[int, List[str], bool]:
+    """
+    start의 '{'부터 JSON 객체 끝까지 스캔
+
+    Returns:
+        (끝 위치(닫는 괄호 다음, 잘렸으면 len(text)), 닫히지 않은 괄호 스택, 문자열 안에서 끝났는지)
+    """
+    stack: List[str] = []
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]":
+            if stack:
+                stack.pop()
+            if not stack:
+                return i + 1, [], False
+    return len(text), stack, in_string
+
+
+def _close_truncated(body: str, stack: List[str], in_string: bool) -> str:
+    """잘린 JSON 끝을 정리하고 열린 괄호를 닫음"""
+    if in_string:
+        # 이스케이프 문자 중간에 잘렸으면 버리고 문자열을 닫음
+        if body.endswith("\\") and not body.endswith("\\\\"):
+            body = body[:-1]
+        body += '"'
+
+    # 끝의 불완전한 항목 제거: 쉼표, 값 없는 키("key":), 값 없이 끝난 키 문자열
+    body = body.rstrip()
+    while True:
+        trimmed = re.sub(r',\s*$', "", body)
+        trimmed = re.sub(r',?\s*"[^"\\]*"\s*:\s*$', "", trimmed)
+        if trimmed == body:
+            break
+        body = trimmed.rstrip()
+
+    # 객체 안에서 값 없이 끝난 키 문자열 ({"a": 1, "b") 제거
+    if stack and stack[-1] == "}":
+        body = re.sub(r'([{,])\s*"[^"\\]*"\s*$', r"\1", body)
+        body = re.sub(r',\s*$', "", body)
+
+    return body + "".join(reversed(stack))
+
+
+def repair_json(text: str) -> Optional[Dict]:
+    """거의 유효한 JSON 응답을 고쳐서 파싱 (실패 시 None)"""
+    text = _strip_code_fence(text)
+    start = text.find("{")
+    if start < 0:
+        return None
+
+    end, stack, in_string = _scan_object(text, start)
+    body = text[start:end]
+
+    if not stack and not in_string:
+        # 완결된 객체 뒤에 설명 문장이 붙은 경우 등
+        data = _try_loads(body)
+        if data is not None:
+            return data
+        # 끝의 쉼표 제거 후 재시도 ({"a": 1,})
+        return _try_loads(re.sub(r",\s*([}\]])", r"\1", body))
+
+    return _try_loads(_close_truncated(body, stack, in_string))
+
+
+def parse_json_response(content: Optional[str]) -> Tuple[Optional[Dict], str]:
+    """
+    LLM 응답 본문 파싱
+
+    Returns:
+        (dict 또는 None, 상태: PARSE_OK / PARSE_REPAIRED / PARSE_FAILED)
+    """
+    if not content:
+        return None, PARSE_FAILED
+
+    data = _try_loads(content)
+    if data is not None:
+        return data, PARSE_OK
+
+    data = repair_json(content)
+    if data is not None:
+        return data, PARSE_REPAIRED
+
+    return None, PARSE_FAILED
+
+
+def coerce_severity(value) -> Optional[float]:
+    """심각도 값을 1~10 숫자로 변환 ("7", "7/10", "7점", "높음(8)" 등). 변환 불가 시 None"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        number = float(value)
+    elif isinstance(value, str):
+        match = re.search(r"-?\d+(?:\.\d+)?", value)
+        if not match:
+            return None
+        number = float(match.group())
+    else:
+        return None
+
+    number = max(1.0, min(10.0, number))
+    return int(number) if number.is_integer() else number
+
+
+def validate_response(data: Dict, schema: Dict[str, str], defaults: Dict) -> Tuple[Optional[Dict], List[str]]:
+    """
+    에이전트 응답 스키마 검증 및 타입 변환
+
+    Args:
+        data: 파싱된 응답
+        schema: 필드 → 타입 ("severity": 1~10 숫자, 필수 / "text": 문자열, 없으면 기본값)
+        defaults: 필드별 기본값 (에이전트 기본 의견)
+
+    Returns:
+        (검증된 응답 또는 None, 문제가 있던 필드 목록). 필수 필드를 복구할 수 없으면 None
+    """
+    result = dict(data)
+    problems = []
+
+    for field, kind in schema.items():
+        value = data.get(field)
+        if kind == "severity":
+            severity = coerce_severity(value)
+            if severity is None:
+                return None, problems + [field]
+            if severity != value:
+                problems.append(field)
+            result[field] = severity
+        elif value is None or value == "":
+            problems.append(field)
+            result[field] = defaults.get(field, "")
+        elif not isinstance(value, str):
+            # 목록/숫자 등은 문자열로 변환
+            result[field] = ", ".join(map(str, value)) if isinstance(value, list) else str(value)
+            problems.append(field)
+
+    return result, problems
@@ -0,0 +1,153 @@
+"""
+OpenAI Batch API 실행 모드
+
+1. 시뮬레이션을 '드라이 런'으로 실행해 캐시 미적중 요청을 모두 수집 (에이전트는 기본 의견 사용)
+2. 수집된 요청을 Batch JSONL로 작성해 제출하고 완료될 때까지 대기
+3. 결과를 요청 ID(공법:일자:이슈ID:에이전트)별로 보관 → 같은 시드로 다시 실행하면 결과를 재사용
+   (응답 캐시에는 제출한 요청 본문 기준으로만 저장)
+
+이슈 발생은 에이전트 응답과 무관하므로 두 실행에서 요청 ID의 집합은 같다.
+단, 드라이 런 프롬프트의 누적 지연/비용·다른 에이전트 의견은 기본 의견 기준으로 계산된 값이다.
+"""
+
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from .llm_client import LLMClient
+
+
+class BatchRequestCollector:
+    """드라이 런 요청 수집기 (요청 ID → 요청 본문)"""
+
+    def __init__(self):
+        self.requests: Dict[str, Dict] = {}
+        self.response_formats: Dict[str, str] = {}
+
+    def add(self, request_id: str, body: Dict, response_format: str):
+        self.requests[request_id] = body
+        self.response_formats[request_id] = response_format
+
+    def write_jsonl(self, path: Path) -> Path:
+        """Batch 입력 JSONL 파일 작성"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for request_id, body in self.requests.items():
+                line = {
+                    "custom_id": request_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body,
+                }
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+        return path
+
+    def __len__(self):
+        return len(self.requests)
+
+
+def submit_batch(
+    client: LLMClient,
+    collector: BatchRequestCollector,
+    batch_dir: str = ".cache/batches",
+    poll_interval: float = 30.0,
+    timeout: Optional[float] = None,
+) -> Dict[str, Dict]:
+    """
+    수집된 요청을 Batch로 제출하고 완료될 때까지 대기
+
+    Returns:
+        요청 ID → 파싱된 응답 (실패한 요청은 제외)
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    input_path = collector.write_jsonl(Path(batch_dir) / f"batch_input_{timestamp}.jsonl")
+
+    with open(input_path, "rb") as f:
+        input_file = client.client.files.create(file=f, purpose="batch")
+
+    batch = client.client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    print(f"Batch 제출: {batch.id} ({len(collector)}건, 입력 {input_path})")
+
+    started = time.monotonic()
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        if timeout is not None and time.monotonic() - started > timeout:
+            raise TimeoutError(f"Batch {batch.id}가 {timeout:.0f}초 안에 완료되지 않았습니다.")
+        time.sleep(poll_interval)
+        batch = client.client.batches.retrieve(batch.id)
+        counts = batch.request_counts
+        if counts is not None:
+            print(f"  상태: {batch.status} ({counts.completed}/{counts.total})")
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} 실패: 상태 {batch.status}")
+
+    # 결과 파일 보관 후 파싱
+    output_text = client.client.files.content(batch.output_file_id).text
+    output_path = Path(batch_dir) / f"batch_output_{timestamp}.jsonl"
+    output_path.write_text(output_text, encoding="utf-8")
+
+    results = {}
+    for line in output_text.splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        request_id = item.get("custom_id")
+        response = item.get("response") or {}
+        if request_id not in collector.requests or response.get("status_code") != 200:
+            continue
+
+        content = response["body"]["choices"][0]["message"]["content"]
+        response_format = collector.response_formats[request_id]
+        result, _ = client._parse_content(content, response_format)
+        if "error" not in result:
+            results[request_id] = result
+            # 캐시는 제출한 요청(드라이 런 프롬프트) 기준 (재실행 프롬프트와 다를 수 있음)
+            client.cache_request_result(collector.requests[request_id], response_format, result)
+
+    return results
+
+
+def run_batch_mode(
+    run_fn: Callable[[], object],
+    client: LLMClient,
+    poll_interval: float = 30.0,
+    batch_dir: str = ".cache/batches",
+) -> int:
+    """
+    드라이 런으로 요청을 수집하고 Batch 결과를 client.batch_results에 적재
+
+    이후 같은 시드로 시뮬레이션을 다시 실행하면 각 요청이 Batch 결과를 사용한다.
+    결과가 없는 요청(실패 등)만 실시간 API로 호출된다.
+
+    Args:
+        run_fn: 시뮬레이션 전체를 같은 시드로 실행하는 함수 (결과 파일은 저장하지 않아야 함)
+        client: 에이전트가 사용하는 LLMClient
+        poll_interval: Batch 상태 확인 간격 (초)
+        batch_dir: Batch 입력/출력 JSONL 저장 폴더
+
+    Returns:
+        Batch로 받은 응답 수
+    """
+    collector = BatchRequestCollector()
+    client.batch_collector = collector
+    try:
+        run_fn()
+    finally:
+        client.batch_collector = None
+
+    if not collector.requests:
+        print("Batch 모드: 모든 요청이 캐시에 적중 (제출 생략)")
+        return 0
+
+    print(f"\nBatch 모드: 신규 요청 {len(collector)}건 수집")
+    results = submit_batch(client, collector, batch_dir=batch_dir, poll_interval=poll_interval)
+    print(f"  응답 {len(results)}건 수신, 실패 {len(collector) - len(results)}건 (실시간 호출로 대체)")
+
+    client.batch_results.update(results)
+    return len(results)
@@ -3,90 +3,1162 @@ LLM 클라이언트 (OpenAI GPT API 사용)
 """
 
 import openai
+import httpx
+import asyncio
 import os
 import json
+import time
+import random
+import hashlib
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
 from dotenv import load_dotenv
 
+from .llm_metrics import LLMMetrics, estimate_cost
+from .json_parsing import PARSE_OK, parse_json_response
+from .llm_stream import StreamingResponse
+
 # 환경 변수 로드
 load_dotenv()
 
 
+class LLMResponseCache:
+    """
+    LLM 응답 디스크 캐시 (SQLite)
+
+    (모델, temperature, 시스템 프롬프트, 사용자 메시지, 응답 형식)의 해시를 키로
+    응답을 저장한다. 입력이 같으면 재실행 시 API를 다시 호출하지 않는다.
+    """
+
+    # 이 횟수만큼 저장할 때마다 만료/초과 항목 정리
+    EVICT_EVERY = 100
+
+    def __init__(self, path: str, max_entries: int = 50000, max_age_days: float = 30.0):
+        """
+        Args:
+            path: SQLite 파일 경로
+            max_entries: 최대 보관 항목 수 (초과 시 오래 사용하지 않은 항목부터 삭제)
+            max_age_days: 최대 보관 기간 (일, 0 이하면 무제한)
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+
+        # 적중/미적중 카운터
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+        self.evict()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        temperature: float,
+        system_prompt: str,
+        user_message: str,
+        response_format: str,
+        max_tokens: int,
+    ) -> str:
+        """요청 내용으로부터 캐시 키 생성"""
+        payload = json.dumps(
+            [model, temperature, system_prompt, user_message, response_format, max_tokens],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """캐시 조회 (없거나 만료되면 None)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or self._is_expired(row[1], now):
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    def set(self, key: str, response: Dict):
+        """응답 저장 (같은 키는 덮어씀)"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created_at, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(response, ensure_ascii=False), now, now),
+            )
+            self._conn.commit()
+            self.writes += 1
+            need_evict = self.writes % self.EVICT_EVERY == 0
+
+        if need_evict:
+            self.evict()
+
+    def evict(self):
+        """만료 항목 및 최대 항목 수 초과분 삭제"""
+        with self._lock:
+            if self.max_age_days > 0:
+                cutoff = time.time() - self.max_age_days * 86400
+                self._conn.execute("DELETE FROM responses WHERE created_at < ?", (cutoff,))
+
+            if self.max_entries > 0:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "  SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?"
+                    ")",
+                    (self.max_entries,),
+                )
+            self._conn.commit()
+
+    def clear(self):
+        """전체 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def stats(self) -> Dict:
+        """캐시 통계"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": entries,
+            "path": str(self.path),
+        }
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.max_age_days > 0 and now - created_at > self.max_age_days * 86400
+
+
+# 경로별 캐시 인스턴스 (프로세스 내 공유)
+_RESPONSE_CACHES: Dict[str, LLMResponseCache] = {}
+_RESPONSE_CACHES_LOCK = threading.Lock()
+
+
+def get_response_cache(path: Optional[str] = None) -> Optional[LLMResponseCache]:
+    """
+    환경 변수 설정에 따른 공유 응답 캐시 반환
+
+    LLM_CACHE=0 이면 None (캐시 비활성화)
+    """
+    if os.getenv("LLM_CACHE", "1") == "0":
+        return None
+
+    path = path or os.getenv("LLM_CACHE_PATH", ".cache/llm_responses.sqlite3")
+    with _RESPONSE_CACHES_LOCK:
+        if path not in _RESPONSE_CACHES:
+            _RESPONSE_CACHES[path] = LLMResponseCache(
+                path,
+                max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "50000")),
+                max_age_days=float(os.getenv("LLM_CACHE_MAX_AGE_DAYS", "30")),
+            )
+        return _RESPONSE_CACHES[path]
+
+
+class TokenBucketRateLimiter:
+    """
+    분당 요청 수(RPM) / 토큰 수(TPM) 토큰 버킷
+
+    두 버킷 모두 여유가 생길 때까지 대기한다. 한도가 0 이하인 버킷은 무제한.
+    """
+
+    def __init__(self, requests_per_minute: float = 0, tokens_per_minute: float = 0):
+        self.rpm = requests_per_minute
+        self.tpm = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = None  # (이벤트 루프, asyncio.Lock) - 루프마다 새로 생성
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rpm > 0:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        if self.tpm > 0:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    def _wait_time(self, tokens: float) -> float:
+        """요청 1건 + tokens 만큼 확보하기까지 남은 시간 (초)"""
+        wait = max(0.0, self._paused_until - time.monotonic())
+        if self.rpm > 0 and self._requests < 1:
+            wait = max(wait, (1 - self._requests) * 60 / self.rpm)
+        if self.tpm > 0 and self._tokens < tokens:
+            wait = max(wait, (tokens - self._tokens) * 60 / self.tpm)
+        return wait
+
+    async def acquire(self, tokens: float = 0):
+        """요청 1건과 예상 토큰 수만큼 확보 (부족하면 대기)"""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock[0] is not loop:
+            self._lock = (loop, asyncio.Lock())
+
+        # 버킷 용량보다 큰 요청은 용량만큼만 요구 (영원히 대기하지 않도록)
+        if self.tpm > 0:
+            tokens = min(tokens, self.tpm)
+
+        async with self._lock[1]:
+            while True:
+                self._refill()
+                wait = self._wait_time(tokens)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+
+            if self.rpm > 0:
+                self._requests -= 1
+            if self.tpm > 0:
+                self._tokens -= tokens
+
+    def adjust_tokens(self, delta: float):
+        """실제 사용량과 예상치의 차이 반영 (양수면 추가 차감)"""
+        if self.tpm > 0:
+            self._tokens -= delta
+
+    def pause(self, seconds: float):
+        """429 응답 시 전체 요청을 일정 시간 멈춤"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class LLMCallError(Exception):
+    """분류된 LLM 호출 오류"""
+
+    def __init__(
+        self,
+        message: str,
+        retryable: bool,
+        retry_after: Optional[float] = None,
+        status_code: Optional[int] = None,
+    ):
+        super().__init__(message)
+        self.retryable = retryable  # True면 재시도 가능 (429, 5xx, 타임아웃, 연결 오류)
+        self.retry_after = retry_after  # 서버가 요청한 대기 시간 (초)
+        self.status_code = status_code
+
+
+def classify_error(error: Exception) -> LLMCallError:
+    """예외를 재시도 가능/불가 오류로 분류"""
+    if isinstance(error, LLMCallError):
+        return error
+
+    message = str(error) or type(error).__name__
+
+    if isinstance(error, openai.RateLimitError):
+        # 크레딧 소진은 기다려도 해결되지 않음
+        if getattr(error, "code", None) == "insufficient_quota":
+            return LLMCallError(message, retryable=False, status_code=429)
+        return LLMCallError(
+            message, retryable=True, retry_after=_retry_after(error), status_code=429
+        )
+
+    if isinstance(error, openai.APIStatusError):
+        status = error.status_code
+        return LLMCallError(
+            message, retryable=status in (408, 409) or status >= 500, status_code=status
+        )
+
+    if isinstance(error, (openai.APIConnectionError, httpx.TransportError,
+                          TimeoutError, FutureTimeoutError)):
+        return LLMCallError(message, retryable=True)
+
+    # 요청 구성 오류 등 알 수 없는 예외는 재시도하지 않음
+    return LLMCallError(message, retryable=False)
+
+
+def _retry_after(error: Exception, default: Optional[float] = None) -> Optional[float]:
+    """429 응답의 Retry-After 헤더 (초)"""
+    response = getattr(error, "response", None)
+    try:
+        return float(response.headers.get("retry-after", default))
+    except (AttributeError, TypeError, ValueError):
+        return default
+
+
+class BackoffPolicy:
+    """지수 백오프 + full jitter (시뮬레이션 난수와 분리된 자체 난수 사용)"""
+
+    def __init__(self, base: float = 1.0, max_delay: float = 30.0):
+        self.base = base
+        self.max_delay = max_delay
+        self._random = random.Random()
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """attempt번째 재시도 전 대기 시간 (초)"""
+        delay = self._random.uniform(0, min(self.max_delay, self.base * 2 ** attempt))
+        return max(delay, retry_after or 0.0)
+
+
+class CircuitBreaker:
+    """
+    연속 실패 시 호출을 차단하는 회로 차단기
+
+    failure_threshold번 연속 실패하면 열림(open) → reset_timeout초 동안 호출을 즉시 거부하고
+    에이전트는 기본 의견을 사용한다. 이후 1건을 시험 호출(half-open)해 성공하면 다시 닫힌다.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self.state = "closed"
+        self.opened_count = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """지금 호출해도 되는지"""
+        if self.failure_threshold <= 0:
+            return True
+
+        with self._lock:
+            if self.state == "open":
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = "half_open"
+                return True
+            if self.state == "half_open":
+                # 시험 호출 결과를 기다리는 중
+                return False
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            self.state = "closed"
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.failure_threshold > 0 and (
+                self.state == "half_open" or self.consecutive_failures >= self.failure_threshold
+            ):
+                if self.state != "open":
+                    self.opened_count += 1
+                    print(f"LLM 회로 차단기 열림: {self.consecutive_failures}회 연속 실패 "
+                          f"→ {self.reset_timeout:.0f}초간 기본 의견 사용")
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
+
 class LLMClient:
     """LLM 클라이언트"""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[LLMResponseCache] = None, refresh_cache: Optional[bool] = None):
+        """
+        Args:
+            cache: 응답 캐시 (None이면 환경 변수 설정에 따른 공유 캐시 사용)
+            refresh_cache: True면 캐시를 읽지 않고 항상 새로 호출 후 덮어씀
+                (None이면 LLM_CACHE_REFRESH 환경 변수 사용)
+        """
         self.api_key = os.getenv("OPENAI_API_KEY")
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
         self.temperature = float(os.getenv("LLM_TEMPERATURE", "0.7"))
         self.max_tokens = int(os.getenv("LLM_MAX_TOKENS", "500"))
+        # 모델 캐스케이드: 설정하면 call_cascade가 이 (작은) 모델에 먼저 묻고 필요할 때만 OPENAI_MODEL로 승격
+        self.cascade_model = os.getenv("LLM_CASCADE_MODEL") or None
 
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY가 .env 파일에 설정되지 않았습니다.")
 
-        openai.api_key = self.api_key
+        # 요청 타임아웃 (초)
+        self.timeout = httpx.Timeout(
+            float(os.getenv("LLM_TIMEOUT", "60")),
+            connect=float(os.getenv("LLM_CONNECT_TIMEOUT", "10")),
+        )
+
+        # 연결 풀을 유지하는 클라이언트 (keep-alive로 TLS 연결 재사용)
+        self.http_client = httpx.Client(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=int(os.getenv("LLM_MAX_CONNECTIONS", "20")),
+                max_keepalive_connections=int(os.getenv("LLM_MAX_KEEPALIVE", "20")),
+                keepalive_expiry=float(os.getenv("LLM_KEEPALIVE_EXPIRY", "120")),
+            ),
+        )
+        self.client = openai.OpenAI(
+            api_key=self.api_key,
+            base_url=os.getenv("OPENAI_BASE_URL") or None,
+            timeout=self.timeout,
+            max_retries=0,  # 재시도는 call_with_retry가 오류 분류에 따라 수행
+            http_client=self.http_client,
+        )
+
+        # 재시도 / 데드라인 / 헤지 / 회로 차단기
+        self.max_retries = int(os.getenv("LLM_MAX_RETRIES", "2"))
+        self.call_deadline = float(os.getenv("LLM_CALL_DEADLINE", "120"))
+        self.backoff = BackoffPolicy(
+            base=float(os.getenv("LLM_BACKOFF_BASE", "1.0")),
+            max_delay=float(os.getenv("LLM_BACKOFF_MAX", "30")),
+        )
+        self.hedge_delay = float(os.getenv("LLM_HEDGE_DELAY", "0"))  # 0이면 헤지 요청 안 함
+        self.hedged_requests = 0
+        self._hedge_pool = None
+        self._stream_pool = None  # call_stream 수신 스레드
+        self._stream_pool_lock = threading.Lock()
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=int(os.getenv("LLM_BREAKER_THRESHOLD", "5")),
+            reset_timeout=float(os.getenv("LLM_BREAKER_RESET", "60")),
+        )
+
+        self.cache = cache if cache is not None else get_response_cache()
+        if refresh_cache is None:
+            refresh_cache = os.getenv("LLM_CACHE_REFRESH", "0") == "1"
+        self.refresh_cache = refresh_cache
+
+        # 비동기 경로 설정 (동시 요청 수, 분당 요청/토큰 한도)
+        self.max_concurrency = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+        self.rate_limiter = TokenBucketRateLimiter(
+            requests_per_minute=float(os.getenv("LLM_RPM", "500")),
+            tokens_per_minute=float(os.getenv("LLM_TPM", "200000")),
+        )
+        self._async_state = None  # (이벤트 루프, AsyncOpenAI, Semaphore)
+
+        # Batch 모드
+        # - batch_collector: 설정 시 캐시 미적중 요청을 보내지 않고 수집만 함 (드라이 런)
+        # - batch_results: Batch 결과 (요청 ID → 응답), 재실행 시 같은 요청 ID에 사용
+        self.batch_collector = None
+        self.batch_results: Dict[str, Dict] = {}
 
     def call(
         self,
         system_prompt: str,
         user_message: str,
-        response_format: str = "json"
+        response_format: str = "json",
+        request_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+        metrics: Optional[LLMMetrics] = None,
+        tags: Optional[Dict] = None,
+        attempt: int = 0,
+        max_tokens: Optional[int] = None,
+        model: Optional[str] = None
     ) -> dict:
         """
-        LLM API 호출
+        LLM API 호출 (1회, 재시도 없음)
 
         Args:
             system_prompt: 시스템 프롬프트
             user_message: 사용자 메시지
             response_format: 응답 형식 ("json" 또는 "text")
+            request_id: 시뮬레이션 내 요청 위치 (예: "BIM:12:I-03:건축주"), Batch 모드에서 사용
+            timeout: 이번 요청의 타임아웃 (초, None이면 기본값)
+            metrics: 호출 지표 기록기 (None이면 기록하지 않음)
+            tags: 지표에 함께 기록할 호출자 정보 (agent, issue_id, day 등)
+            attempt: 재시도 순번 (0이면 첫 시도)
+            max_tokens: 이번 요청의 최대 출력 토큰 (None이면 LLM_MAX_TOKENS)
+            model: 이번 요청에 사용할 모델 (None이면 OPENAI_MODEL)
 
         Returns:
-            LLM 응답 (dict 또는 str)
+            LLM 응답 dict. 실패 시 {"error", "fallback", "retryable", ...}
         """
+        model = model or self.model
+        started = time.perf_counter()
+        cache_key, cached = self._cache_lookup(system_prompt, user_message, response_format, model, max_tokens)
+        if cached is not None:
+            self._record_metrics(metrics, tags, attempt, "cache", started, model=model)
+            return cached
+
+        if self.batch_collector is not None:
+            # Batch 드라이 런: 요청만 기록하고 에이전트는 기본 의견 사용
+            body = self._build_request(system_prompt, user_message, response_format, max_tokens, model)
+            self.batch_collector.add(
+                request_id or cache_key or str(len(self.batch_collector)),
+                {k: v for k, v in body.items() if v is not None},
+                response_format,
+            )
+            return {"error": "batch_pending", "fallback": True}
+
+        if request_id is not None and request_id in self.batch_results:
+            # Batch 결과 재사용 (드라이 런에서 제출한 프롬프트에 대한 응답이므로 지금 프롬프트 키로는 캐시하지 않음,
+            # 캐시는 submit_batch가 제출한 요청 본문 기준으로 저장)
+            self._record_metrics(metrics, tags, attempt, "batch", started, model=model)
+            return json.loads(json.dumps(self.batch_results[request_id]))
+
+        if not self.circuit_breaker.allow():
+            self._record_metrics(metrics, tags, attempt, "circuit_open", started, model=model)
+            return {"error": "circuit_open", "fallback": True, "retryable": False}
         try:
-            response = openai.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                response_format={"type": "json_object"} if response_format == "json" else None
+            result, usage = self._request(system_prompt, user_message, response_format, timeout, max_tokens, model)
+        except LLMCallError as e:
+            self.circuit_breaker.record_failure()
+            self._record_metrics(metrics, tags, attempt, "error", started, error=e, model=model)
+            print(f"LLM API 호출 오류: {e}")
+            return self._error_result(e)
+        self.circuit_breaker.record_success()
+        self._record_metrics(metrics, tags, attempt, "api", started, usage=usage)
+
+        self._cache_store(cache_key, result)
+        return result
+
+    def _record_metrics(
+        self,
+        metrics: Optional[LLMMetrics],
+        tags: Optional[Dict],
+        attempt: int,
+        source: str,
+        started: float,
+        usage: Optional[Dict] = None,
+        error: Optional[LLMCallError] = None,
+        extra: Optional[Dict] = None,
+        model: Optional[str] = None,
+    ):
+        """호출 시도 1건을 지표 기록기에 기록 (extra: 스트리밍 첫 토큰 시간 등 추가 항목)"""
+        if metrics is None:
+            return
+
+        usage = usage or {}
+        model = usage.get("model", model or self.model)
+        event = {
+            **(tags or {}),
+            "source": source,
+            "model": model,
+            "attempt": attempt,
+            "latency_s": round(time.perf_counter() - started, 4),
+            "prompt_tokens": usage.get("prompt_tokens", 0),
+            "completion_tokens": usage.get("completion_tokens", 0),
+            "cached_tokens": usage.get("cached_tokens", 0),
+            "cost_usd": estimate_cost(
+                model,
+                usage.get("prompt_tokens", 0),
+                usage.get("completion_tokens", 0),
+                usage.get("cached_tokens", 0),
+            ),
+        }
+        if "parse" in usage:
+            event["parse"] = usage["parse"]
+            event["finish_reason"] = usage["finish_reason"]
+        if error is not None:
+            event["error"] = str(error)
+            event["status_code"] = error.status_code
+        if event.get("cascade") == "small":
+            # 같은 토큰을 큰 모델로 처리했을 때의 비용 (캐스케이드 절감액 계산용)
+            event["large_model_cost_usd"] = estimate_cost(
+                self.model,
+                usage.get("prompt_tokens", 0),
+                usage.get("completion_tokens", 0),
+                usage.get("cached_tokens", 0),
             )
+        event.update(extra or {})
+        metrics.record(**event)
 
-            content = response.choices[0].message.content
+    @staticmethod
+    def _usage_dict(response, parse_status: str = PARSE_OK) -> Dict:
+        """응답의 모델명, 종료 사유, 파싱 상태와 토큰 사용량 (캐시된 입력 토큰 포함)"""
+        return LLMClient._usage_meta(
+            response.model, response.choices[0].finish_reason, response.usage, parse_status
+        )
 
-            if response_format == "json":
-                try:
-                    return json.loads(content)
-                except json.JSONDecodeError:
-                    # JSON 파싱 실패 시 간단한 구조 반환
-                    return {
-                        "error": "JSON 파싱 실패",
-                        "raw_content": content
-                    }
-            else:
-                return {"content": content}
+    @staticmethod
+    def _usage_meta(model: str, finish_reason: Optional[str], usage, parse_status: str = PARSE_OK) -> Dict:
+        meta = {
+            "model": model,
+            "finish_reason": finish_reason,
+            "parse": parse_status,
+        }
+        if usage is None:
+            return meta
+        details = getattr(usage, "prompt_tokens_details", None)
+        return {
+            **meta,
+            "prompt_tokens": usage.prompt_tokens,
+            "completion_tokens": usage.completion_tokens,
+            "cached_tokens": (getattr(details, "cached_tokens", None) or 0) if details is not None else 0,
+        }
 
-        except Exception as e:
-            print(f"LLM API 호출 오류: {e}")
-            # 오류 시 기본값 반환
+    @staticmethod
+    def _error_result(error: LLMCallError) -> dict:
+        """오류를 에이전트가 기본 의견으로 처리할 수 있는 dict로 변환"""
+        return {
+            "error": str(error),
+            "fallback": True,
+            "retryable": error.retryable,
+            "retry_after": error.retry_after,
+            "rate_limited": error.status_code == 429,
+        }
+
+    def _cache_lookup(
+        self, system_prompt: str, user_message: str, response_format: str, model: Optional[str] = None,
+        max_tokens: Optional[int] = None
+    ):
+        """캐시 키 계산 및 조회 → (키, 캐시된 응답 또는 None)"""
+        if self.cache is None:
+            return None, None
+
+        # 출력 토큰 한도가 다르면 (잘린 응답일 수 있으므로) 다른 요청으로 취급
+        cache_key = LLMResponseCache.make_key(
+            model or self.model, self.temperature, system_prompt, user_message, response_format,
+            max_tokens or self.max_tokens
+        )
+        if self.refresh_cache:
+            return cache_key, None
+        return cache_key, self.cache.get(cache_key)
+
+    def _cache_store(self, cache_key: Optional[str], result: dict):
+        # 오류 응답은 캐시하지 않음
+        if cache_key is not None and "error" not in result:
+            self.cache.set(cache_key, result)
+
+    def cache_request_result(self, body: Dict, response_format: str, result: dict):
+        """
+        요청 본문(_build_request 결과)에 대한 응답을 캐시에 저장
+
+        Batch 결과처럼 지금 실행 중인 프롬프트가 아니라 실제로 보낸 요청에 대한 응답을 저장할 때 사용한다.
+        """
+        if self.cache is None:
+            return
+        messages = {message["role"]: message["content"] for message in body["messages"]}
+        cache_key = LLMResponseCache.make_key(
+            body["model"], body["temperature"], messages["system"], messages["user"], response_format,
+            body["max_tokens"]
+        )
+        self._cache_store(cache_key, result)
+
+    def _build_request(
+        self, system_prompt: str, user_message: str, response_format: str, max_tokens: Optional[int] = None,
+        model: Optional[str] = None
+    ) -> dict:
+        """chat.completions 요청 파라미터"""
+        return dict(
+            model=model or self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message}
+            ],
+            temperature=self.temperature,
+            max_tokens=max_tokens or self.max_tokens,
+            response_format={"type": "json_object"} if response_format == "json" else None
+        )
+
+    @staticmethod
+    def _parse_content(content: str, response_format: str) -> Tuple[dict, str]:
+        """
+        응답 본문을 dict로 변환 → (결과, 파싱 상태 "ok"/"repaired"/"failed")
+
+        잘리거나 설명 문장이 붙은 JSON은 복구해서 사용한다. 복구도 실패하면 같은 프롬프트로 다시 보내도
+        (max_tokens 초과 등) 같은 결과가 나오기 쉬우므로 재시도 불가로 표시하고 원문을 함께 돌려준다
+        (호출자가 원문만으로 수정 요청 가능).
+        """
+        if response_format != "json":
+            return {"content": content}, PARSE_OK
+
+        data, status = parse_json_response(content)
+        if data is None:
             return {
-                "error": str(e),
-                "fallback": True
-            }
+                "error": "JSON 파싱 실패",
+                "raw_content": content,
+                "retryable": False
+            }, status
+        return data, status
+
+    def _request(
+        self, system_prompt: str, user_message: str, response_format: str, timeout: Optional[float],
+        max_tokens: Optional[int] = None, model: Optional[str] = None
+    ) -> Tuple[dict, Dict]:
+        """실제 API 요청 → (응답 dict, 토큰 사용량). 실패 시 LLMCallError"""
+        if self.hedge_delay > 0:
+            return self._hedged_request(system_prompt, user_message, response_format, timeout, max_tokens, model)
+        return self._send(system_prompt, user_message, response_format, timeout, max_tokens, model)
+
+    def _send(
+        self, system_prompt: str, user_message: str, response_format: str, timeout: Optional[float],
+        max_tokens: Optional[int] = None, model: Optional[str] = None
+    ) -> Tuple[dict, Dict]:
+        try:
+            response = self.client.chat.completions.create(
+                **self._build_request(system_prompt, user_message, response_format, max_tokens, model),
+                timeout=timeout if timeout is not None else self.timeout,
+            )
+        except Exception as e:
+            raise classify_error(e) from e
+        result, parse_status = self._parse_content(response.choices[0].message.content, response_format)
+        return result, self._usage_dict(response, parse_status)
+
+    def _hedged_request(
+        self, system_prompt: str, user_message: str, response_format: str, timeout: Optional[float],
+        max_tokens: Optional[int] = None, model: Optional[str] = None
+    ) -> Tuple[dict, Dict]:
+        """
+        헤지 요청: hedge_delay초 안에 응답이 없으면 같은 요청을 한 번 더 보내 먼저 온 응답 사용
+        (느린 꼬리 지연 단축용, 늦게 온 응답은 버림)
+        """
+        if self._hedge_pool is None:
+            self._hedge_pool = ThreadPoolExecutor(
+                max_workers=int(os.getenv("LLM_MAX_CONNECTIONS", "20")),
+                thread_name_prefix="llm-hedge",
+            )
+
+        args = (system_prompt, user_message, response_format, timeout, max_tokens, model)
+        primary = self._hedge_pool.submit(self._send, *args)
+        done, _ = wait([primary], timeout=self.hedge_delay)
+        if done:
+            return primary.result()
+
+        self.hedged_requests += 1
+        hedge = self._hedge_pool.submit(self._send, *args)
+
+        wait_limit = timeout if timeout is not None else self.timeout.read
+        error = None
+        try:
+            for future in as_completed([primary, hedge], timeout=wait_limit):
+                try:
+                    return future.result()
+                except LLMCallError as e:
+                    error = e
+        except FutureTimeoutError as e:
+            raise classify_error(e) from e
+        raise error
 
     def call_with_retry(
         self,
         system_prompt: str,
         user_message: str,
-        retries: int = 2
+        retries: Optional[int] = None,
+        request_id: Optional[str] = None,
+        deadline: Optional[float] = None,
+        response_format: str = "json",
+        metrics: Optional[LLMMetrics] = None,
+        tags: Optional[Dict] = None,
+        max_tokens: Optional[int] = None,
+        model: Optional[str] = None
+    ) -> dict:
+        """
+        재시도 로직 포함 호출
+
+        재시도 가능한 오류(429, 5xx, 타임아웃, 연결 오류)만 지터가 적용된 지수 백오프 후 재시도한다.
+        전체 호출은 deadline초 안에 끝나며, 넘으면 마지막 오류를 반환한다.
+
+        Args:
+            retries: 최대 재시도 횟수 (None이면 LLM_MAX_RETRIES)
+            deadline: 전체 호출 제한 시간 (초, None이면 LLM_CALL_DEADLINE)
+            metrics, tags: 호출 지표 기록기와 태그 (시도마다 1건씩 기록)
+            max_tokens: 최대 출력 토큰 (None이면 LLM_MAX_TOKENS)
+            model: 사용할 모델 (None이면 OPENAI_MODEL)
+        """
+        retries = self.max_retries if retries is None else retries
+        deadline_at = time.monotonic() + (self.call_deadline if deadline is None else deadline)
+
+        result = {"error": "deadline_exceeded", "fallback": True, "retryable": False}
+        for attempt in range(retries + 1):
+            remaining = deadline_at - time.monotonic()
+            if remaining <= 0:
+                break
+
+            result = self.call(
+                system_prompt,
+                user_message,
+                response_format=response_format,
+                request_id=request_id,
+                timeout=min(remaining, self.timeout.read),
+                metrics=metrics,
+                tags=tags,
+                attempt=attempt,
+                max_tokens=max_tokens,
+                model=model,
+            )
+            # Batch 드라이 런 중에는 재시도하지 않음
+            if "error" not in result or self.batch_collector is not None:
+                return result
+            if not result.get("retryable") or attempt >= retries:
+                return result
+
+            delay = self.backoff.delay(attempt, result.get("retry_after"))
+            if time.monotonic() + delay >= deadline_at:
+                break
+            print(f"재시도 {attempt + 1}/{retries} ({delay:.1f}초 후)...")
+            time.sleep(delay)
+
+        return result
+
+    # ===== 모델 캐스케이드 =====
+
+    def call_cascade(
+        self,
+        system_prompt: str,
+        user_message: str,
+        check: Callable[[dict], Optional[str]],
+        escalate: Optional[str] = None,
+        request_id: Optional[str] = None,
+        metrics: Optional[LLMMetrics] = None,
+        tags: Optional[Dict] = None,
+        max_tokens: Optional[int] = None
+    ) -> dict:
+        """
+        모델 캐스케이드 호출 (cascade_model이 없으면 call_with_retry와 같음)
+
+        작은 모델(LLM_CASCADE_MODEL)에 먼저 묻고, check(응답)이 승격 사유를 돌려주면 같은 프롬프트를
+        큰 모델(OPENAI_MODEL)로 다시 보낸다. escalate가 주어지면 작은 모델 없이 바로 큰 모델에 묻는다.
+        지표에는 cascade("small" / "escalated" / "large")와 승격 사유(escalation)를 함께 기록한다.
+
+        Args:
+            check: 작은 모델 응답 → 승격 사유 (None이면 작은 모델 응답 사용)
+            escalate: 처음부터 큰 모델을 쓸 사유 (예: 카드 심각도 "S1")
+            request_id: Batch 요청 ID (승격 요청은 ":escalated"를 붙여 구분)
+        """
+        if self.cascade_model is None:
+            return self.call_with_retry(
+                system_prompt, user_message, request_id=request_id, metrics=metrics, tags=tags, max_tokens=max_tokens
+            )
+
+        tags = tags or {}
+        stage = "large"
+        if escalate is None:
+            result = self.call_with_retry(
+                system_prompt,
+                user_message,
+                request_id=request_id,
+                metrics=metrics,
+                tags={**tags, "cascade": "small"},
+                max_tokens=max_tokens,
+                model=self.cascade_model,
+            )
+            # Batch 드라이 런에서는 응답이 없으므로 작은 모델 요청만 수집
+            if result.get("error") == "batch_pending":
+                return result
+            escalate = check(result)
+            if escalate is None:
+                return result
+            stage = "escalated"
+            if request_id is not None:
+                request_id = f"{request_id}:escalated"
+
+        return self.call_with_retry(
+            system_prompt,
+            user_message,
+            request_id=request_id,
+            metrics=metrics,
+            tags={**tags, "cascade": stage, "escalation": escalate},
+            max_tokens=max_tokens,
+        )
+
+    # ===== 스트리밍 경로 =====
+
+    def call_stream(
+        self,
+        system_prompt: str,
+        user_message: str,
+        early_fields=("severity_assessment",),
+        request_id: Optional[str] = None,
+        metrics: Optional[LLMMetrics] = None,
+        tags: Optional[Dict] = None,
+        model: Optional[str] = None
+    ) -> StreamingResponse:
+        """
+        스트리밍 호출 (JSON 응답 전용)
+
+        응답은 백그라운드 스레드에서 받고, 바로 StreamingResponse 핸들을 반환한다.
+        early_fields가 도착하면 handle.early()가 먼저 풀리고, 응답이 끝나면 handle.result()가
+        call_with_retry()와 같은 형식의 전체 응답을 돌려준다 (재시도/회로 차단기/캐시/지표 동일).
+
+        캐시 적중, Batch 드라이 런, Batch 결과 재사용은 스트리밍 없이 바로 완료된 핸들을 반환한다.
+        """
+        model = model or self.model
+        handle = StreamingResponse(early_fields)
+        started = time.perf_counter()
+        cache_key, cached = self._cache_lookup(system_prompt, user_message, "json", model)
+        if cached is not None:
+            self._record_metrics(metrics, tags, 0, "cache", started, model=model)
+            handle.finish(cached)
+            return handle
+
+        if self.batch_collector is not None or (request_id is not None and request_id in self.batch_results):
+            handle.finish(self.call_with_retry(
+                system_prompt, user_message, request_id=request_id, metrics=metrics, tags=tags, model=model
+            ))
+            return handle
+
+        if self._stream_pool is None:
+            with self._stream_pool_lock:
+                if self._stream_pool is None:
+                    self._stream_pool = ThreadPoolExecutor(
+                        max_workers=int(os.getenv("LLM_MAX_CONNECTIONS", "20")),
+                        thread_name_prefix="llm-stream",
+                    )
+        self._stream_pool.submit(
+            self._run_stream, handle, system_prompt, user_message, cache_key, metrics, tags, model
+        )
+        return handle
+
+    def _run_stream(
+        self,
+        handle: StreamingResponse,
+        system_prompt: str,
+        user_message: str,
+        cache_key: Optional[str],
+        metrics: Optional[LLMMetrics],
+        tags: Optional[Dict],
+        model: str,
+    ):
+        """스트림 수신 (백그라운드 스레드). 어떤 경우에도 handle.finish()로 끝낸다"""
+        result = {"error": "deadline_exceeded", "fallback": True, "retryable": False}
+        try:
+            deadline_at = time.monotonic() + self.call_deadline
+            for attempt in range(self.max_retries + 1):
+                remaining = deadline_at - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                result = self._stream_once(handle, system_prompt, user_message,
+                                           min(remaining, self.timeout.read), metrics, tags, attempt, model)
+                if "error" not in result or not result.get("retryable") or attempt >= self.max_retries:
+                    break
+
+                delay = self.backoff.delay(attempt, result.get("retry_after"))
+                if time.monotonic() + delay >= deadline_at:
+                    break
+                print(f"재시도 {attempt + 1}/{self.max_retries} ({delay:.1f}초 후)...")
+                time.sleep(delay)
+                handle.reset()
+
+            self._cache_store(cache_key, result)
+        except Exception as e:  # 핸들을 기다리는 쪽이 멈추지 않도록 예상 밖 오류도 결과로 전달
+            result = self._error_result(classify_error(e))
+        finally:
+            handle.finish(result)
+
+    def _stream_once(
+        self,
+        handle: StreamingResponse,
+        system_prompt: str,
+        user_message: str,
+        timeout: float,
+        metrics: Optional[LLMMetrics],
+        tags: Optional[Dict],
+        attempt: int,
+        model: str,
+    ) -> dict:
+        """스트리밍 요청 1회 → 전체 응답 dict (실패 시 오류 dict)"""
+        started = time.perf_counter()
+        if not self.circuit_breaker.allow():
+            self._record_metrics(metrics, tags, attempt, "circuit_open", started, model=model)
+            return {"error": "circuit_open", "fallback": True, "retryable": False}
+
+        finish_reason, usage = None, None
+        try:
+            stream = self.client.chat.completions.create(
+                **self._build_request(system_prompt, user_message, "json", model=model),
+                stream=True,
+                stream_options={"include_usage": True},
+                timeout=timeout,
+            )
+            for chunk in stream:
+                model = chunk.model or model
+                if chunk.usage is not None:
+                    usage = chunk.usage
+                if chunk.choices:
+                    choice = chunk.choices[0]
+                    if choice.delta is not None and choice.delta.content:
+                        handle.feed(choice.delta.content)
+                    finish_reason = choice.finish_reason or finish_reason
+        except Exception as e:
+            error = classify_error(e)
+            if not handle.text:
+                self.circuit_breaker.record_failure()
+                self._record_metrics(metrics, tags, attempt, "error", started, error=error, model=model)
+                print(f"LLM API 호출 오류: {error}")
+                return self._error_result(error)
+            # 응답 도중 끊김: 받은 부분까지 JSON 복구로 사용 (다시 보내도 처음부터 생성해야 함)
+            print(f"LLM 스트림 중단 ({len(handle.text)}자 수신 후): {error}")
+            finish_reason = "interrupted"
+
+        self.circuit_breaker.record_success()
+        result, parse_status = self._parse_content(handle.text, "json")
+        self._record_metrics(
+            metrics, tags, attempt, "api", started,
+            usage=self._usage_meta(model, finish_reason, usage, parse_status),
+            extra={
+                "stream": True,
+                "first_token_s": round(handle.first_token_s or 0.0, 4),
+                "early_fields_s": round(handle.early_fields_s, 4) if handle.early_fields_s is not None else None,
+            },
+        )
+        return result
+
+    # ===== 비동기 경로 =====
+
+    def _get_async_state(self):
+        """현재 이벤트 루프용 AsyncOpenAI 클라이언트와 세마포어 (루프마다 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._async_state is None or self._async_state[0] is not loop:
+            async_http_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=max(self.max_concurrency, 1),
+                    max_keepalive_connections=max(self.max_concurrency, 1),
+                ),
+            )
+            # 429 재시도는 SDK가 아닌 공용 레이트 리미터가 조율하도록 SDK 재시도는 끔
+            async_client = openai.AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=os.getenv("OPENAI_BASE_URL") or None,
+                timeout=self.timeout,
+                max_retries=0,
+                http_client=async_http_client,
+            )
+            self._async_state = (loop, async_client, asyncio.Semaphore(max(self.max_concurrency, 1)))
+        return self._async_state[1], self._async_state[2]
+
+    def _estimate_tokens(self, system_prompt: str, user_message: str) -> int:
+        """요청 토큰 수 추정 (한글 위주 프롬프트 기준 약 2자/토큰 + 최대 출력 토큰)"""
+        return (len(system_prompt) + len(user_message)) // 2 + self.max_tokens
+
+    async def acall(
+        self,
+        system_prompt: str,
+        user_message: str,
+        response_format: str = "json",
+        timeout: Optional[float] = None,
+        metrics: Optional[LLMMetrics] = None,
+        tags: Optional[Dict] = None,
+        attempt: int = 0
     ) -> dict:
-        """재시도 로직 포함 호출"""
+        """
+        비동기 LLM API 호출 (동시 요청 수 제한 + RPM/TPM 토큰 버킷)
+
+        여러 의견을 asyncio.gather로 동시에 요청할 때 사용한다.
+        반환 형식과 지표 기록은 call()과 같다.
+        """
+        started = time.perf_counter()
+        cache_key, cached = self._cache_lookup(system_prompt, user_message, response_format)
+        if cached is not None:
+            self._record_metrics(metrics, tags, attempt, "cache", started)
+            return cached
+
+        async_client, semaphore = self._get_async_state()
+        estimated = self._estimate_tokens(system_prompt, user_message)
+
+        if not self.circuit_breaker.allow():
+            self._record_metrics(metrics, tags, attempt, "circuit_open", started)
+            return {"error": "circuit_open", "fallback": True, "retryable": False}
+
+        async with semaphore:
+            await self.rate_limiter.acquire(estimated)
+            try:
+                response = await async_client.chat.completions.create(
+                    **self._build_request(system_prompt, user_message, response_format),
+                    timeout=timeout if timeout is not None else self.timeout,
+                )
+            except Exception as e:
+                error = classify_error(e)
+                if error.status_code == 429:
+                    # 공용 버킷을 잠시 멈춰 다른 동시 요청도 함께 물러나게 함
+                    self.rate_limiter.pause(error.retry_after or 1.0)
+                else:
+                    print(f"LLM API 호출 오류: {error}")
+                self.circuit_breaker.record_failure()
+                self._record_metrics(metrics, tags, attempt, "error", started, error=error)
+                return self._error_result(error)
+
+        self.circuit_breaker.record_success()
+        result, parse_status = self._parse_content(response.choices[0].message.content, response_format)
+        self._record_metrics(metrics, tags, attempt, "api", started, usage=self._usage_dict(response, parse_status))
+        if response.usage is not None:
+            self.rate_limiter.adjust_tokens(response.usage.total_tokens - estimated)
+
+        self._cache_store(cache_key, result)
+        return result
+
+    async def acall_with_retry(
+        self,
+        system_prompt: str,
+        user_message: str,
+        retries: Optional[int] = None,
+        deadline: Optional[float] = None,
+        response_format: str = "json",
+        metrics: Optional[LLMMetrics] = None,
+        tags: Optional[Dict] = None
+    ) -> dict:
+        """재시도 로직 포함 비동기 호출 (call_with_retry와 같은 오류 분류/백오프/데드라인)"""
+        retries = self.max_retries if retries is None else retries
+        deadline_at = time.monotonic() + (self.call_deadline if deadline is None else deadline)
+
+        result = {"error": "deadline_exceeded", "fallback": True, "retryable": False}
         for attempt in range(retries + 1):
-            result = self.call(system_prompt, user_message)
+            remaining = deadline_at - time.monotonic()
+            if remaining <= 0:
+                break
+
+            result = await self.acall(
+                system_prompt,
+                user_message,
+                response_format=response_format,
+                timeout=min(remaining, self.timeout.read),
+                metrics=metrics,
+                tags=tags,
+                attempt=attempt,
+            )
             if "error" not in result:
                 return result
-            if attempt < retries:
-                print(f"재시도 {attempt + 1}/{retries}...")
+            if not result.get("retryable") or attempt >= retries:
+                return result
+
+            delay = self.backoff.delay(attempt, result.get("retry_after"))
+            if time.monotonic() + delay >= deadline_at:
+                break
+            print(f"재시도 {attempt + 1}/{retries} ({delay:.1f}초 후)...")
+            await asyncio.sleep(delay)
+
         return result
+
+    def close(self):
+        """연결 풀 종료"""
+        self.client.close()
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False)
+        if self._stream_pool is not None:
+            self._stream_pool.shutdown(wait=False)
+
+
+# 프로세스 전역 클라이언트 (pid, client)
+_SHARED_CLIENT = None
+_SHARED_CLIENT_LOCK = threading.Lock()
+
+
+def get_llm_client() -> LLMClient:
+    """
+    프로세스 전역 공유 LLMClient 반환 (최초 호출 시 생성)
+
+    fork된 자식 프로세스는 부모의 연결을 재사용하지 않도록 새로 생성한다.
+    """
+    global _SHARED_CLIENT
+    with _SHARED_CLIENT_LOCK:
+        if _SHARED_CLIENT is None or _SHARED_CLIENT[0] != os.getpid():
+            _SHARED_CLIENT = (os.getpid(), LLMClient())
+        return _SHARED_CLIENT[1]
+
+
+def set_llm_client(client: Optional[LLMClient]):
+    """공유 LLMClient 교체 (None이면 다음 호출 시 새로 생성)"""
+    global _SHARED_CLIENT
+    with _SHARED_CLIENT_LOCK:
+        _SHARED_CLIENT = (os.getpid(), client) if client is not None else None
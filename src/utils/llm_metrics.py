@@ -0,0 +1,192 @@
+"""
+LLM 호출 지표 수집 (토큰 / 지연 / 재시도 / 비용)
+
+LLMClient.call이 호출 시도마다 이벤트 1건을 기록하고,
+시뮬레이션이 끝나면 에이전트별 비용/지연 리포트로 집계한다.
+
+이벤트 항목:
+    source: "api" / "cache" / "batch" / "error" / "circuit_open"
+    model, attempt(0이면 첫 시도, 1 이상이면 재시도), latency_s
+    prompt_tokens, completion_tokens, cached_tokens, cost_usd
+    parse("ok" / "repaired" / "failed"), finish_reason (API 응답만)
+    stream, first_token_s, early_fields_s (스트리밍 응답만: 첫 토큰 / 심각도 등 선행 필드 도착까지 걸린 시간)
+    cascade("small" / "escalated" / "large"), escalation(승격 사유), large_model_cost_usd (모델 캐스케이드 사용 시,
+        large_model_cost_usd는 작은 모델 요청을 큰 모델로 처리했을 때의 비용)
+    agent, issue_id, day, purpose("fixup"이면 JSON 수정 요청, "reconcile"이면 델파이 심각도 조정) 등 호출자가 넘긴 태그
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# 모델별 100만 토큰당 가격 (USD): (입력, 캐시된 입력, 출력)
+MODEL_PRICES = {
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-4.1-mini": (0.40, 0.10, 1.60),
+    "gpt-4.1": (2.00, 0.50, 8.00),
+}
+
+
+def get_model_price(model: str) -> Tuple[float, float, float]:
+    """
+    모델 가격 (USD / 100만 토큰)
+
+    LLM_PRICE_INPUT / LLM_PRICE_CACHED_INPUT / LLM_PRICE_OUTPUT 환경 변수가 있으면 우선 사용하고,
+    없으면 MODEL_PRICES에서 가장 길게 일치하는 모델명 접두사를 찾는다 (없으면 0).
+    """
+    matches = [name for name in MODEL_PRICES if (model or "").startswith(name)]
+    default = MODEL_PRICES[max(matches, key=len)] if matches else (0.0, 0.0, 0.0)
+
+    input_price = float(os.getenv("LLM_PRICE_INPUT", default[0]))
+    cached_price = float(os.getenv("LLM_PRICE_CACHED_INPUT", default[1]))
+    output_price = float(os.getenv("LLM_PRICE_OUTPUT", default[2]))
+    return input_price, cached_price, output_price
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0) -> float:
+    """토큰 사용량으로 비용 추정 (USD)"""
+    input_price, cached_price, output_price = get_model_price(model)
+    uncached = max(prompt_tokens - cached_tokens, 0)
+    return (uncached * input_price + cached_tokens * cached_price + completion_tokens * output_price) / 1_000_000
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """정렬된 값의 백분위수 (최근접 순위)"""
+    if not values:
+        return 0.0
+    index = min(int(round(pct / 100 * (len(values) - 1))), len(values) - 1)
+    return values[index]
+
+
+class LLMMetrics:
+    """LLM 호출 이벤트 기록 및 집계 (여러 스레드에서 기록 가능)"""
+
+    def __init__(self):
+        self.events: List[Dict] = []
+        self._lock = threading.Lock()
+
+    def record(self, **event):
+        """호출 시도 1건 기록"""
+        event.setdefault("timestamp", time.time())
+        with self._lock:
+            self.events.append(event)
+
+    def __len__(self):
+        return len(self.events)
+
+    @staticmethod
+    def aggregate(events: List[Dict]) -> Dict:
+        """이벤트 목록 집계"""
+        api_latencies = sorted(e["latency_s"] for e in events if e.get("source") == "api")
+        prompt_tokens = sum(e.get("prompt_tokens", 0) for e in events)
+        cached_tokens = sum(e.get("cached_tokens", 0) for e in events)
+        early_latencies = [e["early_fields_s"] for e in events if e.get("early_fields_s") is not None]
+
+        # 모델 캐스케이드: 첫 시도 기준 의견 요청 수와 큰 모델 사용(승격) 수
+        small = [e for e in events if e.get("cascade") == "small"]
+        escalated = [e for e in events if e.get("cascade") in ("escalated", "large")]
+        routed = sum(1 for e in small + escalated if e.get("attempt", 0) == 0 and e.get("cascade") != "escalated")
+        escalations = sum(1 for e in escalated if e.get("attempt", 0) == 0)
+        escalation_reasons: Dict[str, int] = {}
+        for e in escalated:
+            if e.get("attempt", 0) == 0:
+                escalation_reasons[e["escalation"]] = escalation_reasons.get(e["escalation"], 0) + 1
+        # 모든 요청을 큰 모델로 보냈을 때 대비 절감액 (승격 전 작은 모델 비용과 승격 요청 비용은 차감)
+        cascade_saved = sum(
+            e.get("large_model_cost_usd", 0.0) - e.get("cost_usd", 0.0) for e in small
+        ) - sum(e.get("cost_usd", 0.0) for e in escalated if e.get("cascade") == "escalated")
+
+        return {
+            "calls": sum(1 for e in events if e.get("attempt", 0) == 0),
+            "attempts": len(events),
+            "retries": sum(1 for e in events if e.get("attempt", 0) > 0),
+            "api_requests": len(api_latencies),
+            "cache_hits": sum(1 for e in events if e.get("source") == "cache"),
+            "batch_results": sum(1 for e in events if e.get("source") == "batch"),
+            "errors": sum(1 for e in events if e.get("source") in ("error", "circuit_open")),
+            "json_repaired": sum(1 for e in events if e.get("parse") == "repaired"),
+            "json_failed": sum(1 for e in events if e.get("parse") == "failed"),
+            "fixups": sum(1 for e in events if e.get("purpose") == "fixup"),
+            "reconciles": sum(1 for e in events if e.get("purpose") == "reconcile"),
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": sum(e.get("completion_tokens", 0) for e in events),
+            "cached_tokens": cached_tokens,
+            "cached_token_ratio": round(cached_tokens / prompt_tokens, 4) if prompt_tokens else 0.0,
+            "cost_usd": round(sum(e.get("cost_usd", 0.0) for e in events), 6),
+            "latency_total_s": round(sum(e.get("latency_s", 0.0) for e in events), 3),
+            "latency_mean_ms": round(sum(api_latencies) / len(api_latencies) * 1000, 1) if api_latencies else 0.0,
+            "latency_p50_ms": round(_percentile(api_latencies, 50) * 1000, 1),
+            "latency_p95_ms": round(_percentile(api_latencies, 95) * 1000, 1),
+            "streamed": sum(1 for e in events if e.get("stream")),
+            "early_fields_mean_ms": (
+                round(sum(early_latencies) / len(early_latencies) * 1000, 1) if early_latencies else 0.0
+            ),
+            "cascade_requests": routed,
+            "escalations": escalations,
+            "escalation_rate": round(escalations / routed, 4) if routed else 0.0,
+            "escalation_reasons": escalation_reasons,
+            "cascade_saved_usd": round(cascade_saved, 6),
+        }
+
+    def summary(self, group_by: str = "agent") -> Dict:
+        """전체 및 태그별(기본: 에이전트) 집계"""
+        with self._lock:
+            events = list(self.events)
+
+        groups: Dict[str, List[Dict]] = {}
+        for event in events:
+            groups.setdefault(str(event.get(group_by, "N/A")), []).append(event)
+
+        total = self.aggregate(events)
+        by_group = {}
+        for name, group_events in groups.items():
+            stats = self.aggregate(group_events)
+            # 전체 대비 비용/시간 비중
+            stats["cost_share"] = round(stats["cost_usd"] / total["cost_usd"], 4) if total["cost_usd"] else 0.0
+            stats["latency_share"] = (
+                round(stats["latency_total_s"] / total["latency_total_s"], 4) if total["latency_total_s"] else 0.0
+            )
+            by_group[name] = stats
+
+        return {"전체": total, group_by: by_group}
+
+    def save(self, path: Path, info: Optional[Dict] = None) -> Path:
+        """리포트 저장 (실행 정보 + 집계 + 호출 기록)"""
+        summary = self.summary()
+        report = {
+            "실행정보": info or {},
+            "전체": summary["전체"],
+            "에이전트별": summary["agent"],
+            "호출기록": list(self.events),
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return path
+
+    def print_summary(self):
+        """에이전트별 비용/지연 요약 출력"""
+        summary = self.summary()
+        total = summary["전체"]
+        print(f"LLM 호출: {total['calls']}건 (API {total['api_requests']}, 캐시 {total['cache_hits']}, "
+              f"재시도 {total['retries']}, 오류 {total['errors']}, JSON 복구 {total['json_repaired']}, "
+              f"수정 요청 {total['fixups']}, 델파이 조정 {total['reconciles']}) / "
+              f"토큰 입력 {total['prompt_tokens']:,} (캐시 {total['cached_tokens']:,}), 출력 {total['completion_tokens']:,} / "
+              f"비용 ${total['cost_usd']:.4f} / 지연 합계 {total['latency_total_s']:.1f}s")
+        if total["streamed"]:
+            print(f"스트리밍: {total['streamed']}건, 심각도 도착 평균 {total['early_fields_mean_ms']:.0f}ms "
+                  f"(전체 응답 평균 {total['latency_mean_ms']:.0f}ms)")
+        if total["cascade_requests"]:
+            reasons = ", ".join(f"{reason} {count}" for reason, count in sorted(total["escalation_reasons"].items()))
+            print(f"모델 캐스케이드: 의견 요청 {total['cascade_requests']}건 중 큰 모델 {total['escalations']}건 "
+                  f"({total['escalation_rate']*100:.1f}%{', ' + reasons if reasons else ''}) / "
+                  f"큰 모델만 사용 대비 절감 ${total['cascade_saved_usd']:.4f}")
+        for agent, stats in summary["agent"].items():
+            print(f"  - {agent}: {stats['calls']}건, ${stats['cost_usd']:.4f} ({stats['cost_share']*100:.1f}%), "
+                  f"지연 {stats['latency_total_s']:.1f}s ({stats['latency_share']*100:.1f}%), "
+                  f"p95 {stats['latency_p95_ms']:.0f}ms")
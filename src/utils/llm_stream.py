@@ -0,0 +1,123 @@
+"""
+LLM 스트리밍 응답 처리
+
+응답 JSON을 받는 도중에 완성된 최상위 필드를 바로 꺼낸다.
+에이전트 응답은 severity_assessment를 맨 앞에 출력하므로, 심각도는 첫 몇 토큰 만에
+확정되고 나머지 의견 문장은 백그라운드에서 계속 받는다.
+"""
+
+import re
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .json_parsing import fast_loads
+
+
+# 값이 끝까지 도착한 필드만 인정: 문자열은 닫는 따옴표, 숫자 등은 뒤따르는 , } ] 까지
+# (숫자 "1"이 "10"의 앞부분일 수 있으므로)
+_VALUE_PATTERN = r'("(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?(?=\s*[,}\]])|true|false|null)'
+_FIELD_PATTERNS: Dict[str, "re.Pattern"] = {}
+
+
+def extract_field(text: str, field: str):
+    """부분 JSON 텍스트에서 값이 완성된 필드 추출 (아직 없으면 KeyError)"""
+    pattern = _FIELD_PATTERNS.get(field)
+    if pattern is None:
+        pattern = re.compile(r'"' + re.escape(field) + r'"\s*:\s*' + _VALUE_PATTERN)
+        _FIELD_PATTERNS[field] = pattern
+
+    match = pattern.search(text)
+    if match is None:
+        raise KeyError(field)
+    return fast_loads(match.group(1))
+
+
+class StreamingResponse:
+    """
+    스트리밍 LLM 응답 핸들
+
+    - early(): early_fields가 모두 도착하면(또는 응답이 끝나면) 그때까지 추출한 필드 반환
+    - result(): 응답이 끝날 때까지 기다려 전체 응답 dict 반환 (call()과 같은 형식)
+    - add_done_callback(): 응답이 끝나면 호출할 함수 등록
+    """
+
+    def __init__(self, early_fields: Iterable[str] = ()):
+        self.early_fields = tuple(early_fields)
+        self.fields: Dict = {}
+        self.text = ""
+        self.started = time.perf_counter()
+        self.first_token_s: Optional[float] = None  # 첫 토큰까지 걸린 시간 (초)
+        self.early_fields_s: Optional[float] = None  # early_fields가 모두 도착하기까지 걸린 시간 (초)
+
+        self._result: Optional[Dict] = None
+        self._callbacks: List[Callable] = []
+        self._lock = threading.Lock()
+        self._early = threading.Event()
+        self._done = threading.Event()
+        if not self.early_fields:
+            self._early.set()
+
+    def reset(self):
+        """재시도 전 받은 내용 초기화"""
+        with self._lock:
+            self.text = ""
+            self.fields = {}
+
+    def feed(self, delta: str):
+        """스트림 조각 추가 후 새로 완성된 필드 추출"""
+        with self._lock:
+            elapsed = time.perf_counter() - self.started
+            if self.first_token_s is None:
+                self.first_token_s = elapsed
+            self.text += delta
+
+            if self._early.is_set():
+                return
+            for field in self.early_fields:
+                if field in self.fields:
+                    continue
+                try:
+                    self.fields[field] = extract_field(self.text, field)
+                except (KeyError, ValueError):
+                    pass
+            if all(field in self.fields for field in self.early_fields):
+                self.early_fields_s = elapsed
+                self._early.set()
+
+    def finish(self, result: Dict):
+        """응답 완료 처리 (전체 응답에만 있는 early_fields도 채움)"""
+        with self._lock:
+            self._result = result
+            if "error" not in result:
+                for field in self.early_fields:
+                    if field in result:
+                        self.fields.setdefault(field, result[field])
+            callbacks, self._callbacks = self._callbacks, []
+        self._early.set()
+        self._done.set()
+        for callback in callbacks:
+            callback(self)
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def early(self, timeout: Optional[float] = None) -> Dict:
+        """early_fields가 모두 도착할 때까지 대기 후 추출된 필드 반환"""
+        self._early.wait(timeout)
+        with self._lock:
+            return dict(self.fields)
+
+    def result(self, timeout: Optional[float] = None) -> Optional[Dict]:
+        """응답이 끝날 때까지 대기 후 전체 응답 반환 (시간 초과 시 None)"""
+        self._done.wait(timeout)
+        return self._result
+
+    def add_done_callback(self, callback: Callable):
+        """응답이 끝나면 callback(handle) 호출 (이미 끝났으면 바로 호출)"""
+        with self._lock:
+            if self._result is None:
+                self._callbacks.append(callback)
+                return
+        callback(self)